@@ -0,0 +1,280 @@
+"""
+Micro-benchmark Suite for the N.E.T.R.A. engine and data loaders
+Times the engine's hot paths and the dashboard loader on synthetic inputs,
+writes a JSON report and compares it with a stored baseline so regressions
+are caught
+
+Baselines are machine-specific: store one per machine with --save-baseline
+(the default path is gitignored). A baseline from a different platform or
+CPU count is refused rather than compared.
+
+Per-row Python paths (calculate_threat_probability, get_confidence_score,
+analyze_location, batch_analyze) are timed on at most --scalar-cap rows, and
+the engine/log files hold at most --engine-cap rows; every result records
+how many operations were actually timed and is compared per operation.
+"""
+
+import os
+import sys
+import json
+import time
+import shutil
+import argparse
+import platform
+import tempfile
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from netra_core import NetraAI, NE_LOCATIONS, SENSOR_ORDER
+from netra_locations import get_location_registry
+from netra_binlog import binlog_to_csv
+import netra_data
+
+
+DEFAULT_SIZES = (1_000, 100_000, 10_000_000)
+DEFAULT_BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'benchmark_baseline.json')
+CHUNK_ROWS = 1_000_000
+
+# Report metadata that must match for timings to be comparable
+MACHINE_KEYS = ('platform', 'cpu_count')
+
+
+def best_of(fn, repeat):
+    """Best wall-clock time of fn() over several runs, in seconds"""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def result(name, size, ops, seconds):
+    """One benchmark result; us_per_op is what baselines are compared on"""
+    return {
+        'name': name,
+        'size': size,
+        'ops': ops,
+        'seconds': round(seconds, 6),
+        'us_per_op': round(seconds / ops * 1e6, 4),
+        'ops_per_second': round(ops / seconds, 1) if seconds > 0 else None
+    }
+
+
+def bench_scoring(matrix, size, scalar_cap, repeat):
+    """Scalar and vectorized scoring paths (nothing is logged)"""
+    ai = NetraAI(history_capacity=1)
+    scalar = [dict(zip(SENSOR_ORDER, row)) for row in matrix[:scalar_cap].tolist()]
+
+    def score_chunks(fn):
+        for start in range(0, len(matrix), CHUNK_ROWS):
+            fn(matrix[start:start + CHUNK_ROWS])
+
+    return [
+        result('calculate_threat_probability', size, len(scalar),
+               best_of(lambda: [ai.calculate_threat_probability(s) for s in scalar], repeat)),
+        result('get_confidence_score', size, len(scalar),
+               best_of(lambda: [ai.get_confidence_score(s) for s in scalar], repeat)),
+        result('calculate_threat_probability_batch', size, len(matrix),
+               best_of(lambda: score_chunks(ai.calculate_threat_probability_batch), repeat)),
+        result('score_batch', size, len(matrix),
+               best_of(lambda: score_chunks(ai.score_batch), repeat))
+    ]
+
+
+def bench_analysis(matrix, size, scalar_cap, repeat):
+    """Logged single-scan analysis paths"""
+    rows = min(size, scalar_cap)
+    keys = list(NE_LOCATIONS.keys())
+    location_keys = [keys[i % len(keys)] for i in range(rows)]
+    scalar = [dict(zip(SENSOR_ORDER, row)) for row in matrix[:rows].tolist()]
+
+    ai = NetraAI(history_capacity=rows)
+    analyze = best_of(lambda: [ai.analyze_location(k, s) for k, s in zip(location_keys, scalar)], repeat)
+    ai = NetraAI(history_capacity=rows)
+    batch = best_of(lambda: ai.batch_analyze(location_keys), repeat)
+
+    return [
+        result('analyze_location', size, rows, analyze),
+        result('batch_analyze', size, rows, batch)
+    ]
+
+
+def bench_engine(matrix, size, engine_cap, repeat, workdir):
+    """Batch logging, statistics, CSV export and the dashboard loader"""
+    rows = min(size, engine_cap)
+    names = get_location_registry().sites['name'].to_numpy()
+    locations = names[np.arange(rows) % len(names)]
+
+    ai = NetraAI(history_capacity=rows)
+    bin_path = os.path.join(workdir, netra_data.THREAT_LOG_BIN)
+    ai.attach_binlog(bin_path)
+
+    start = time.perf_counter()
+    for begin in range(0, rows, CHUNK_ROWS):
+        chunk = matrix[begin:min(rows, begin + CHUNK_ROWS)]
+        scores = ai.score_batch(chunk)
+        ai.log_threat_batch(locations[begin:begin + len(chunk)], scores['probability'].to_numpy(),
+                            chunk, scores['confidence'].to_numpy())
+    results = [result('log_threat_batch', size, rows, time.perf_counter() - start)]
+
+    calls = 100_000
+    stats = best_of(lambda: [ai.get_statistics() for _ in range(calls)], repeat)
+    results.append(result('get_statistics', size, calls, stats))
+
+    export_path = os.path.join(workdir, 'export.csv')
+    export = best_of(lambda: ai.export_history_to_csv(export_path), repeat)
+    results.append(result('export_history_to_csv', size, rows, export))
+    ai.close_binlog()
+
+    # Dashboard loader: threat log CSV first, then the newer binary copy
+    csv_path = os.path.join(workdir, netra_data.THREAT_LOG_CSV)
+    binlog_to_csv(bin_path, csv_path)
+    root = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+    for name in (netra_data.LOCATIONS_CSV, netra_data.SENSOR_READINGS_CSV):
+        if os.path.exists(os.path.join(root, name)):
+            shutil.copy(os.path.join(root, name), workdir)
+
+    past = os.path.getmtime(csv_path) - 60
+    os.utime(bin_path, (past, past))
+    results.append(result('load_historical_data[csv]', size, rows,
+                          best_of(lambda: netra_data.load_historical_data(workdir), repeat)))
+    os.utime(bin_path, None)
+    os.utime(csv_path, (past, past))
+    results.append(result('load_historical_data[binlog]', size, rows,
+                          best_of(lambda: netra_data.load_historical_data(workdir), repeat)))
+    return results
+
+
+def run_benchmarks(sizes=DEFAULT_SIZES, scalar_cap=10_000, engine_cap=1_000_000, repeat=3, seed=42):
+    """
+    Run every benchmark at every size
+
+    Returns:
+        dict: Report with 'meta' and 'results' entries
+    """
+    rng = np.random.default_rng(seed)
+    results = []
+
+    for size in sizes:
+        print(f"\n📏 {size:,} rows")
+        matrix = rng.uniform(0, 100, size=(size, len(SENSOR_ORDER))).round(1)
+        workdir = tempfile.mkdtemp(prefix='netra_bench_')
+        try:
+            for group in (bench_scoring(matrix, size, scalar_cap, repeat),
+                          bench_analysis(matrix, size, scalar_cap, repeat),
+                          bench_engine(matrix, size, engine_cap, repeat, workdir)):
+                for entry in group:
+                    print(f"   {entry['name']:<36} {entry['ops']:>10,} ops {entry['seconds']:>10.4f}s "
+                          f"| {entry['us_per_op']:>10.3f} µs/op")
+                results.extend(group)
+        finally:
+            shutil.rmtree(workdir, ignore_errors=True)
+        del matrix
+
+    return {
+        'meta': {
+            'generated_at': datetime.utcnow().isoformat(timespec='seconds'),
+            'platform': platform.platform(),
+            'python': platform.python_version(),
+            'numpy': np.__version__,
+            'pandas': pd.__version__,
+            'cpu_count': os.cpu_count(),
+            'sizes': list(sizes),
+            'scalar_cap': scalar_cap,
+            'engine_cap': engine_cap,
+            'repeat': repeat,
+            'seed': seed
+        },
+        'results': results
+    }
+
+
+def compare_to_baseline(report, baseline, tolerance=0.5, min_seconds=0.05):
+    """
+    Compare per-operation times against a baseline report
+
+    Benchmarks that took less than min_seconds in the baseline are shown
+    but never flagged, since timer noise dominates at that scale.
+
+    Returns:
+        list: (name, size, baseline µs/op, current µs/op, ratio) of every
+        benchmark slower than the baseline by more than the tolerance
+
+    Raises:
+        ValueError: If the baseline was recorded on a different machine
+            (see MACHINE_KEYS)
+    """
+    mismatched = [key for key in MACHINE_KEYS
+                  if baseline['meta'].get(key) != report['meta'].get(key)]
+    if mismatched:
+        raise ValueError("Baseline is from a different machine: " + ", ".join(
+            f"{key} {baseline['meta'].get(key)!r} != {report['meta'].get(key)!r}" for key in mismatched))
+
+    reference = {(r['name'], r['size']): r for r in baseline['results']}
+    regressions = []
+
+    print(f"\n📊 Comparison with baseline from {baseline['meta'].get('generated_at', '?')} "
+          f"(tolerance {tolerance:.0%})")
+    for entry in report['results']:
+        key = (entry['name'], entry['size'])
+        if key not in reference or not reference[key]['us_per_op']:
+            continue
+        ratio = entry['us_per_op'] / reference[key]['us_per_op']
+        regressed = ratio > 1 + tolerance and reference[key]['seconds'] >= min_seconds
+        status = "❌" if regressed else ("✅" if reference[key]['seconds'] >= min_seconds else "·")
+        print(f"   {status} {entry['name']:<36} {entry['size']:>12,} {ratio:>7.2f}x")
+        if regressed:
+            regressions.append((entry['name'], entry['size'], reference[key]['us_per_op'],
+                                entry['us_per_op'], ratio))
+    return regressions
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="N.E.T.R.A. micro-benchmark suite")
+    parser.add_argument('--sizes', type=int, nargs='+', default=list(DEFAULT_SIZES), help="Synthetic row counts")
+    parser.add_argument('--scalar-cap', type=int, default=10_000, help="Max rows timed through per-row Python paths")
+    parser.add_argument('--engine-cap', type=int, default=1_000_000, help="Max rows logged, exported and loaded")
+    parser.add_argument('--repeat', type=int, default=3, help="Runs per benchmark (best is reported)")
+    parser.add_argument('--output', default='benchmark_report.json', help="JSON report path")
+    parser.add_argument('--baseline', default=DEFAULT_BASELINE, help="Baseline report to compare against")
+    parser.add_argument('--tolerance', type=float, default=0.5, help="Allowed slowdown before flagging a regression")
+    parser.add_argument('--min-seconds', type=float, default=0.05, help="Ignore benchmarks faster than this in the baseline")
+    parser.add_argument('--save-baseline', action='store_true', help="Store this run as the new baseline")
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print("⏱️ N.E.T.R.A. Micro-benchmark Suite")
+    print("=" * 60)
+    report = run_benchmarks(args.sizes, args.scalar_cap, args.engine_cap, args.repeat)
+
+    with open(args.output, 'w') as f:
+        json.dump(report, f, indent=2)
+    print(f"\n📁 Report saved to: {args.output}")
+
+    if args.save_baseline:
+        with open(args.baseline, 'w') as f:
+            json.dump(report, f, indent=2)
+        print(f"📁 Baseline saved to: {args.baseline}")
+        exit(0)
+
+    if not os.path.exists(args.baseline):
+        print("⚠️ No baseline found; run with --save-baseline to store one.")
+        exit(0)
+
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+    try:
+        regressions = compare_to_baseline(report, baseline, args.tolerance, args.min_seconds)
+    except ValueError as e:
+        print(f"\n⚠️ {e}\n   Run with --save-baseline to store a baseline for this machine.")
+        exit(2)
+    if regressions:
+        print(f"\n❌ {len(regressions)} benchmark(s) regressed.")
+        exit(1)
+    print("\n✅ No regressions against the baseline.")
+    exit(0)
@@ -9,66 +9,27 @@ import numpy as np
 from datetime import datetime, timedelta
 import random
 import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from netra_explosives import EXPLOSIVES_CSV, explosive_dict, fallback_table, load_explosives
 
 def load_explosive_database():
     """
     Load comprehensive explosive database from CSV
     Returns dictionary of explosive types with characteristics
-    """
-    db_file = '../explosives_dataset_1500_entries_Version2.csv'
     
-    if not os.path.exists(db_file):
-        print(f"⚠️ Warning: {db_file} not found. Using fallback database.")
+    Parsing and the binary sidecar cache live in netra_explosives.py
+    """
+    if not os.path.exists(EXPLOSIVES_CSV):
+        print(f"⚠️ Warning: {EXPLOSIVES_CSV} not found. Using fallback database.")
         return get_fallback_explosives()
     
     try:
-        df = pd.read_csv(db_file)
-        print(f"✅ Loaded {len(df)} explosive variants from database")
-        
-        explosives = {}
-        for idx, row in df.iterrows():
-            name = str(row['Explosive Name']).strip()
-            fume_info = str(row.get('Detonation Products & Inferred Fume Color', 'Unknown'))
-            
-            # Extract fume color from description
-            fume_color = 'Unknown'
-            if 'Black' in fume_info:
-                fume_color = 'Black/Orange-Brown'
-            elif 'Orange' in fume_info or 'Brown' in fume_info:
-                fume_color = 'Orange/Brown NOx'
-            elif 'White' in fume_info:
-                fume_color = 'White vapor'
-            elif 'Yellow' in fume_info:
-                fume_color = 'Yellow smoke'
-            elif 'Colorless' in fume_info:
-                fume_color = 'Colorless'
-            
-            # Classify danger based on detonation velocity
-            velocity = float(row.get('Detonation Velocity (m/s)', 0))
-            if velocity > 7500:
-                danger = 'Very High'
-            elif velocity > 5000:
-                danger = 'High'
-            elif velocity > 3000:
-                danger = 'Medium'
-            else:
-                danger = 'Low'
-            
-            # Handle brisance - ensure not NaN
-            brisance_val = row.get('Brisance', 'Medium')
-            if pd.isna(brisance_val) or str(brisance_val).strip() == '':
-                brisance_val = 'Medium'
-            
-            explosives[name] = {
-                'fume_color': fume_color,
-                'danger': danger,
-                'velocity': int(velocity),
-                'density': float(row.get('Density (g/cm³)', 1.0)) if pd.notna(row.get('Density (g/cm³)')) else 1.0,
-                'brisance': str(brisance_val).strip(),
-                'type': str(row.get('Type/Class', 'Unknown'))
-            }
-        
-        return explosives
+        table = load_explosives(EXPLOSIVES_CSV)
+        print(f"✅ Loaded {len(table)} explosive variants from database")
+        return explosive_dict(table)
         
     except Exception as e:
         print(f"⚠️ Error loading explosive database: {e}")
@@ -76,16 +37,7 @@ def load_explosive_database():
 
 def get_fallback_explosives():
     """Fallback explosive database if CSV not available"""
-    return {
-        # Military/Common Explosives
-        'TNT': {'fume_color': 'Black/Orange-Brown', 'danger': 'High', 'velocity': 6900, 'density': 1.65, 'brisance': 'High', 'type': 'Nitroaromatic'},
-        'RDX': {'fume_color': 'Orange/Brown NOx', 'danger': 'Very High', 'velocity': 8750, 'density': 1.82, 'brisance': 'Very High', 'type': 'Nitramine'},
-        'HMX': {'fume_color': 'Brown NOx', 'danger': 'Very High', 'velocity': 9100, 'density': 1.91, 'brisance': 'Very High', 'type': 'Nitramine'},
-        'PETN': {'fume_color': 'Colorless/Brown', 'danger': 'Very High', 'velocity': 8400, 'density': 1.77, 'brisance': 'Very High', 'type': 'Nitrate Ester'},
-        'C4': {'fume_color': 'Brown/Orange', 'danger': 'Very High', 'velocity': 8040, 'density': 1.59, 'brisance': 'Very High', 'type': 'Plastic Explosive'},
-        'TATP': {'fume_color': 'White vapor', 'danger': 'Very High', 'velocity': 5300, 'density': 1.22, 'brisance': 'High', 'type': 'Peroxide'},
-        'ANFO': {'fume_color': 'Brown/Orange NOx', 'danger': 'Medium', 'velocity': 4200, 'density': 0.93, 'brisance': 'Medium', 'type': 'Ammonium Nitrate'}
-    }
+    return explosive_dict(fallback_table())
 
 # Load explosive database at module level
 EXPLOSIVE_TYPES = load_explosive_database()
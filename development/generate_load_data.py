@@ -0,0 +1,279 @@
+"""
+Load-Test Data Generator for N.E.T.R.A. System
+Vectorized, chunked counterpart of generate_enhanced_data.py for large
+threat logs (millions of rows)
+
+Rows are produced a chunk at a time with a seeded np.random.Generator and
+streamed to CSV (or Parquet, if pyarrow is installed), so memory stays
+bounded by one chunk. The output has the same columns, value ranges and
+threat-level mix as generate_enhanced_threats:
+- threat levels keep the exact 21/26/32/21% counts; each chunk draws its
+  share with a multivariate hypergeometric sample, which matches shuffling
+  the full list of levels
+- rows come out sorted by timestamp: the time range is split into one slice
+  per chunk and each slice receives a binomial share of the rows, which
+  matches sorting uniformly drawn timestamps
+
+Usage:
+    python generate_load_data.py 10000000
+    python generate_load_data.py 1000000 90 --output load.parquet --seed 7
+"""
+
+import io
+import os
+import csv
+import sys
+import time
+import argparse
+from datetime import datetime, timedelta
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from netra_explosives import get_explosive_table
+
+
+COLUMNS = [
+    'Timestamp', 'Location', 'State', 'Threat_Level', 'Threat_Probability',
+    'Fume_Detection', 'Metal_Detection', 'GPR_Reading', 'Ground_CV', 'Drone_CV',
+    'Disturbance', 'Thermal', 'Explosive_Type', 'Fume_Signature', 'Danger_Level',
+    'Detonation_Velocity', 'Density', 'Brisance', 'Explosive_Class', 'Action'
+]
+SENSOR_COLUMNS = COLUMNS[5:12]
+
+# Same proportions, base ranges and actions as generate_enhanced_threats
+LEVELS = np.array(['CRITICAL', 'HIGH', 'MODERATE', 'LOW'], dtype=object)
+LEVEL_SHARES = (0.21, 0.26, 0.32)
+BASE_LOW = np.array([75, 60, 40, 10])
+BASE_HIGH = np.array([95, 80, 65, 45])
+ACTIONS = np.array([
+    'Immediate evacuation and EOD deployment',
+    'Route diversion and increased surveillance',
+    'Enhanced monitoring and caution advised',
+    'Standard patrol procedures'
+], dtype=object)
+
+# Per-sensor (low, high) offsets from the base range, in COLUMNS order
+SENSOR_OFFSETS = np.array([(0, 0), (-10, 0), (-15, -5), (-10, -10), (-5, -10), (-20, -15), (-15, -20)])
+SENSOR_WEIGHTS = np.array([0.25, 0.20, 0.20, 0.10, 0.10, 0.10, 0.05])
+
+
+def level_counts(num_records):
+    """Exact CRITICAL/HIGH/MODERATE/LOW counts used by generate_enhanced_threats"""
+    counts = [int(num_records * share) for share in LEVEL_SHARES]
+    return np.array(counts + [num_records - int(num_records * 0.79)], dtype=np.int64)
+
+
+def explosive_table(explosives):
+    """Threat-log column arrays of an explosive table (see netra_explosives)"""
+    velocity = explosives['velocity'].to_numpy(dtype=np.int64)
+    return {
+        'Explosive_Type': explosives.index.to_numpy(dtype=object),
+        'Fume_Signature': explosives['fume_color'].to_numpy(dtype=object),
+        'Danger_Level': explosives['danger'].to_numpy(dtype=object),
+        'Detonation_Velocity': velocity,
+        'Density': explosives['density'].to_numpy(dtype=np.float64),
+        'Brisance': explosives['brisance'].to_numpy(dtype=object),
+        'Explosive_Class': explosives['type'].to_numpy(dtype=object),
+        'modifier': np.select([velocity > 7500, velocity > 5000, velocity > 3000], [8, 5, 2], 0)
+    }
+
+
+def generate_chunks(num_records, days_back=60, chunk_size=500_000, seed=None,
+                    locations_df=None, explosives=None, end_date=None):
+    """
+    Yield the threat log as time-ordered DataFrame chunks
+
+    Args:
+        num_records: Total rows
+        days_back: Time range in days, ending at end_date
+        chunk_size: Target rows per chunk (actual sizes vary around it)
+        seed: Seed for np.random.default_rng (None = fresh entropy)
+        locations_df: DataFrame with Location and State columns
+        explosives: Explosive table (default: get_explosive_table())
+        end_date: End of the time range (default: now)
+
+    Yields:
+        DataFrames with the netra_threat_log.csv columns
+    """
+    rng = np.random.default_rng(seed)
+    table = explosive_table(explosives if explosives is not None else get_explosive_table())
+    if locations_df is None:
+        locations_df = pd.read_csv(_locations_file())
+    locations = locations_df['Location'].to_numpy(dtype=object)
+    states = locations_df['State'].fillna('North-East India').to_numpy(dtype=object)
+
+    end_date = end_date or datetime.now()
+    start = np.datetime64(end_date - timedelta(days=days_back), 'us')
+    span_us = days_back * 86_400_000_000
+
+    remaining_levels = level_counts(num_records)
+    remaining = num_records
+    slices = max(1, -(-num_records // chunk_size))
+
+    for k in range(slices):
+        n = remaining if k == slices - 1 else int(rng.binomial(remaining, 1 / (slices - k)))
+        remaining -= n
+        if n == 0:
+            continue
+
+        # Sorted timestamps within this chunk's slice of the time range
+        offset = np.sort(rng.uniform(k, k + 1, n)) / slices * span_us
+        timestamp = start + offset.astype(np.int64).astype('timedelta64[us]')
+
+        # This chunk's share of the level counts, shuffled
+        counts = rng.multivariate_hypergeometric(remaining_levels, n)
+        remaining_levels -= counts
+        level = rng.permutation(np.repeat(np.arange(len(LEVELS)), counts))
+
+        explosive = rng.integers(0, len(table['Explosive_Type']), n)
+        modifier = table['modifier'][explosive]
+        low = np.minimum(95, BASE_LOW[level] + modifier)[:, None] + SENSOR_OFFSETS[:, 0]
+        high = np.minimum(100, BASE_HIGH[level] + modifier)[:, None] + SENSOR_OFFSETS[:, 1]
+        sensors = np.clip(rng.uniform(low, high), 0, 100)
+        probability = sensors @ SENSOR_WEIGHTS
+
+        # Repeated strings stay categorical: small chunks and cheap to format
+        place = rng.integers(0, len(locations), n)
+        chunk = pd.DataFrame({
+            'Timestamp': timestamp,
+            'Location': _categorical(place, locations),
+            'State': _categorical(place, states),
+            'Threat_Level': _categorical(level, LEVELS),
+            'Threat_Probability': np.round(probability, 2)
+        })
+        for i, column in enumerate(SENSOR_COLUMNS):
+            chunk[column] = np.round(sensors[:, i], 2)
+        for column in ('Explosive_Type', 'Fume_Signature', 'Danger_Level', 'Brisance', 'Explosive_Class'):
+            chunk[column] = _categorical(explosive, table[column])
+        chunk['Detonation_Velocity'] = table['Detonation_Velocity'][explosive]
+        chunk['Density'] = table['Density'][explosive]
+        chunk['Action'] = _categorical(level, ACTIONS)
+        yield chunk[COLUMNS]
+
+
+def _categorical(codes, values):
+    """Categorical column from codes into an array of (possibly repeated) values"""
+    categories, inverse = np.unique(values.astype(str), return_inverse=True)
+    return pd.Categorical.from_codes(inverse[codes], categories)
+
+
+# repr() of every 2-decimal value in [0, 100]: whole part + fractional part
+_WHOLE = np.array([str(i) for i in range(101)], dtype=object)
+_FRACTION = np.array([repr(i / 100)[1:] if i else '.0' for i in range(100)], dtype=object)
+
+
+def _csv_field(value: str) -> str:
+    """Quote a field the way DataFrame.to_csv does"""
+    out = io.StringIO()
+    csv.writer(out, lineterminator='').writerow([value])
+    return out.getvalue()
+
+
+def _column_strings(series: pd.Series) -> np.ndarray:
+    """CSV text of every value in a column, matching DataFrame.to_csv"""
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        categories = np.array([_csv_field(str(c)) for c in series.cat.categories] + [''], dtype=object)
+        return categories[series.cat.codes.to_numpy()]
+    values = series.to_numpy()
+    if np.issubdtype(values.dtype, np.datetime64):
+        text = values.astype('datetime64[s]').astype(str).astype(object)
+        return np.array([t.replace('T', ' ') for t in text], dtype=object)
+    if np.issubdtype(values.dtype, np.floating):
+        cents = np.rint(values * 100)
+        if len(values) and np.all(cents / 100 == values) and 0 <= cents.min() and cents.max() <= 10_000:
+            whole, fraction = np.divmod(cents.astype(np.int64), 100)
+            return _WHOLE[whole] + _FRACTION[fraction]
+    return series.astype(str).to_numpy(dtype=object)
+
+
+def csv_text(chunk: pd.DataFrame, header: bool = False) -> str:
+    """
+    Same text as chunk.to_csv(index=False, date_format='%Y-%m-%d %H:%M:%S'),
+    several times faster for generated chunks (categorical strings and
+    values rounded to 2 decimals are formatted through lookup tables)
+    """
+    columns = [_column_strings(chunk[column]) for column in chunk.columns]
+    lines = [','.join(row) for row in zip(*columns)]
+    if header:
+        lines.insert(0, ','.join(_csv_field(column) for column in chunk.columns))
+    return '\n'.join(lines) + '\n'
+
+
+def write_threat_log(chunks, output_file):
+    """
+    Stream chunks to a CSV file, or a Parquet file if the name ends in .parquet
+
+    Returns:
+        int: Rows written
+    """
+    written = 0
+    if output_file.endswith('.parquet'):
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError:
+            raise ImportError("Parquet output needs pyarrow (pip install pyarrow)")
+
+        writer = None
+        try:
+            for chunk in chunks:
+                batch = pa.Table.from_pandas(chunk, preserve_index=False)
+                if writer is None:
+                    writer = pq.ParquetWriter(output_file, batch.schema)
+                writer.write_table(batch)
+                written += len(chunk)
+        finally:
+            if writer is not None:
+                writer.close()
+        return written
+
+    with open(output_file, 'w', newline='') as f:
+        for chunk in chunks:
+            f.write(csv_text(chunk, header=(written == 0)))
+            written += len(chunk)
+    return written
+
+
+def _locations_file():
+    """locations_northeast_india.csv from the parent or current directory"""
+    locations_file = '../locations_northeast_india.csv'
+    if not os.path.exists(locations_file):
+        locations_file = 'locations_northeast_india.csv'
+    return locations_file
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="N.E.T.R.A. chunked load-test data generator")
+    parser.add_argument('num_records', type=int, nargs='?', default=1_000_000)
+    parser.add_argument('days_back', type=int, nargs='?', default=60)
+    parser.add_argument('--output', default='../netra_threat_log.csv', help="CSV or .parquet output")
+    parser.add_argument('--chunk-size', type=int, default=500_000, help="Rows generated per chunk")
+    parser.add_argument('--seed', type=int, default=None, help="Random seed for reproducible output")
+    args = parser.parse_args()
+
+    print(f"🚀 Generating {args.num_records:,} records over {args.days_back} days "
+          f"in chunks of {args.chunk_size:,}...")
+    start = time.perf_counter()
+    level_totals = np.zeros(len(LEVELS), dtype=np.int64)
+
+    def progress(chunks):
+        done = 0
+        for chunk in chunks:
+            done += len(chunk)
+            level_totals[:] += pd.Categorical(chunk['Threat_Level'], categories=LEVELS).value_counts().to_numpy()
+            print(f"  ✓ Generated {done:,}/{args.num_records:,} records...")
+            yield chunk
+
+    chunks = generate_chunks(args.num_records, args.days_back, args.chunk_size, args.seed)
+    written = write_threat_log(progress(chunks), args.output)
+    elapsed = time.perf_counter() - start
+
+    print(f"\n✅ Wrote {written:,} records in {elapsed:.1f}s ({written / elapsed:,.0f} rows/s)")
+    print(f"📁 Saved to: {args.output}")
+    print(f"\n📊 Threat Distribution:")
+    for level, count in zip(LEVELS, level_totals):
+        print(f"   {level}: {count:,} ({count / max(written, 1) * 100:.1f}%)")
+    sys.exit(0)
@@ -0,0 +1,139 @@
+"""
+Concurrency Stress Test for the shared N.E.T.R.A. engine
+Hammers one NetraAI instance from many threads, the way concurrent
+Streamlit sessions share get_netra_instance(), and checks that no scans
+are lost or duplicated
+"""
+
+import os
+import sys
+import time
+import argparse
+import threading
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from netra_core import NetraAI, NE_LOCATIONS, SENSOR_ORDER
+
+
+def run_threads(threads, scans_per_thread, batch_size=0):
+    """
+    Log scans from several threads into one fresh engine
+
+    Args:
+        threads: Number of concurrent threads
+        scans_per_thread: Scans logged by each thread
+        batch_size: Scans per log_threat_batch call (0 = one log_threat call per scan)
+
+    Returns:
+        Tuple of (engine, elapsed seconds, scan IDs returned to the threads)
+    """
+    total = threads * scans_per_thread
+    ai = NetraAI(history_capacity=total)
+    locations = [info['name'] for info in NE_LOCATIONS.values()]
+    scan_ids = [[] for _ in range(threads)]
+    barrier = threading.Barrier(threads + 1)
+
+    def worker(index):
+        rng = np.random.default_rng(index)
+        readings = rng.uniform(0, 100, size=(scans_per_thread, len(SENSOR_ORDER))).round(1)
+        barrier.wait()
+
+        if batch_size:
+            for start in range(0, scans_per_thread, batch_size):
+                matrix = readings[start:start + batch_size]
+                scores = ai.score_batch(matrix)
+                seq = ai.log_threat_batch(
+                    [locations[index % len(locations)]] * len(matrix),
+                    scores['probability'].to_numpy(), matrix, scores['confidence'].to_numpy()
+                )
+                scan_ids[index].extend(seq.tolist())
+        else:
+            for row in readings:
+                sensors = dict(zip(SENSOR_ORDER, row.tolist()))
+                probability = ai.calculate_threat_probability(sensors)
+                scan_id = ai.log_threat(locations[index % len(locations)], probability, sensors)
+                scan_ids[index].append(int(scan_id.rsplit('-', 1)[-1]))
+
+    pool = [threading.Thread(target=worker, args=(i,)) for i in range(threads)]
+    for thread in pool:
+        thread.start()
+    barrier.wait()
+    start = time.perf_counter()
+    for thread in pool:
+        thread.join()
+    elapsed = time.perf_counter() - start
+
+    return ai, elapsed, [seq for ids in scan_ids for seq in ids]
+
+
+def check_engine(ai, seqs, expected):
+    """
+    Verify that every scan was logged exactly once
+
+    Returns:
+        list: Problems found (empty if consistent)
+    """
+    problems = []
+    stats = ai.get_statistics()
+    history = ai.get_history()
+
+    if ai.analysis_count != expected:
+        problems.append(f"analysis_count {ai.analysis_count} != {expected}")
+    if stats['total_scans'] != expected:
+        problems.append(f"total_scans {stats['total_scans']} != {expected}")
+    if sum(ai.band_counts) != expected:
+        problems.append(f"band counts sum {sum(ai.band_counts)} != {expected}")
+    if len(history) != expected:
+        problems.append(f"history holds {len(history)} scans, expected {expected}")
+    if sorted(seqs) != list(range(expected)):
+        problems.append("returned scan IDs are not unique and contiguous")
+
+    logged = history['scan_id'].str.rsplit('-', n=1).str[-1].astype(int).to_numpy()
+    if not np.array_equal(logged, np.arange(expected)):
+        problems.append("history is not in sequence order")
+    if not history['timestamp'].is_monotonic_increasing:
+        problems.append("history timestamps are not monotonic")
+
+    return problems
+
+
+def run_stress_test(thread_counts=(1, 2, 4, 8, 16), scans_per_thread=2000, batch_size=0):
+    """Run the stress test for each thread count and print throughput"""
+    mode = f"log_threat_batch x{batch_size}" if batch_size else "log_threat"
+    print("=" * 60)
+    print(f"🧵 N.E.T.R.A. Engine Stress Test ({mode}, {scans_per_thread:,} scans/thread)")
+    print("=" * 60)
+
+    all_passed = True
+    for threads in thread_counts:
+        expected = threads * scans_per_thread
+        ai, elapsed, seqs = run_threads(threads, scans_per_thread, batch_size)
+        problems = check_engine(ai, seqs, expected)
+
+        status = "✅" if not problems else "❌"
+        print(f"   {status} {threads:>3} threads: {expected:>9,} scans in {elapsed:6.2f}s "
+              f"| {expected / elapsed:>12,.0f} scans/s")
+        for problem in problems:
+            print(f"      - {problem}")
+        all_passed = all_passed and not problems
+
+    print("=" * 60)
+    if all_passed:
+        print("\n✅ No lost or duplicated scans at any thread count.")
+    else:
+        print("\n❌ Concurrency problems detected.")
+    return all_passed
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="N.E.T.R.A. engine concurrency stress test")
+    parser.add_argument('--threads', type=int, nargs='+', default=[1, 2, 4, 8, 16])
+    parser.add_argument('--scans', type=int, default=2000, help="Scans per thread")
+    parser.add_argument('--batch-size', type=int, default=0, help="Use log_threat_batch with this batch size")
+    args = parser.parse_args()
+
+    success = run_stress_test(args.threads, args.scans, args.batch_size)
+    exit(0 if success else 1)
@@ -5,95 +5,34 @@ Validates CSV data quality before deployment
 
 import pandas as pd
 import os
+import sys
 from datetime import datetime
 
-def validate_threat_log(file_path='../netra_threat_log.csv'):
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from netra_explosives import EXPLOSIVES_CSV, load_explosives
+from validate_stream import (DEFAULT_BLOCK_BYTES, READINGS_REQUIRED_COLUMNS, READINGS_SENSOR_COLUMNS,
+                             validate_csv_streaming, validate_threat_log_streaming)
+
+def validate_threat_log(file_path='../netra_threat_log.csv', block_bytes=DEFAULT_BLOCK_BYTES, workers=0,
+                        incremental=False, full=False):
     """
     Validate netra_threat_log.csv for quality and integrity
     
+    Streams the file once in fixed-size blocks (see validate_stream.py), so
+    memory stays bounded for logs of any size.
+    
+    Args:
+        block_bytes: Bytes parsed per block
+        workers: Worker processes for parsing blocks (0 = in-process)
+        incremental: Validate only rows appended since the last checkpoint
+        full: With incremental, rescan everything and rewrite the checkpoint
+    
     Returns:
         bool: True if validation passes, False otherwise
     """
-    print("📊 Validating netra_threat_log.csv...")
-    
-    if not os.path.exists(file_path):
-        print(f"❌ Error: File not found: {file_path}")
-        return False
-    
-    try:
-        df = pd.read_csv(file_path)
-        issues = []
-        
-        # Check required columns
-        required_cols = [
-            'Timestamp', 'Location', 'State', 'Threat_Level', 'Threat_Probability',
-            'Fume_Detection', 'Metal_Detection', 'GPR_Reading',
-            'Ground_CV', 'Drone_CV', 'Disturbance', 'Thermal',
-            'Explosive_Type', 'Fume_Signature', 'Danger_Level', 'Action'
-        ]
-        
-        missing_cols = [col for col in required_cols if col not in df.columns]
-        if missing_cols:
-            issues.append(f"Missing columns: {missing_cols}")
-        
-        # Check record count
-        print(f"   Total records: {len(df)}")
-        
-        # Check for duplicates
-        duplicates = df.duplicated().sum()
-        if duplicates > 0:
-            issues.append(f"Found {duplicates} duplicate records")
-        
-        # Validate date range
-        df['Timestamp'] = pd.to_datetime(df['Timestamp'])
-        date_range = (df['Timestamp'].max() - df['Timestamp'].min()).days
-        print(f"   Date range: {date_range} days ({df['Timestamp'].min()} to {df['Timestamp'].max()})")
-        
-        # Check threat level distribution
-        threat_dist = df['Threat_Level'].value_counts()
-        print(f"   Threat distribution:")
-        for level, count in threat_dist.items():
-            pct = (count / len(df)) * 100
-            print(f"      {level}: {count} ({pct:.1f}%)")
-        
-        # Validate sensor readings (should be 0-100)
-        sensor_cols = ['Fume_Detection', 'Metal_Detection', 'GPR_Reading', 
-                      'Ground_CV', 'Drone_CV', 'Disturbance', 'Thermal']
-        
-        for col in sensor_cols:
-            if col in df.columns:
-                out_of_range = ((df[col] < 0) | (df[col] > 100)).sum()
-                if out_of_range > 0:
-                    issues.append(f"{col}: {out_of_range} values out of range (0-100)")
-        
-        # Check for null values
-        null_counts = df.isnull().sum()
-        if null_counts.any():
-            critical_nulls = null_counts[null_counts > 0]
-            if len(critical_nulls) > 0:
-                issues.append(f"Null values found: {dict(critical_nulls)}")
-        
-        # Validate confidence scores
-        if 'Confidence' in df.columns:
-            avg_confidence = df['Confidence'].mean()
-            print(f"   Average confidence: {avg_confidence:.2f}")
-            
-            if avg_confidence < 30:
-                issues.append(f"Low average confidence: {avg_confidence:.2f}")
-        
-        # Print results
-        if issues:
-            print(f"\n❌ Validation failed with {len(issues)} issues:")
-            for issue in issues:
-                print(f"   - {issue}")
-            return False
-        else:
-            print("   ✅ All validation checks passed!")
-            return True
-            
-    except Exception as e:
-        print(f"❌ Validation error: {str(e)}")
-        return False
+    return validate_threat_log_streaming(file_path, block_bytes, workers,
+                                         checkpoint=incremental, resume=not full)
 
 def validate_locations(file_path='../locations_northeast_india.csv'):
     """
@@ -157,41 +96,55 @@ def validate_locations(file_path='../locations_northeast_india.csv'):
         print(f"❌ Validation error: {str(e)}")
         return False
 
-def validate_sensor_readings(file_path='../sensor_readings_live.csv'):
+def validate_sensor_readings(file_path='../sensor_readings_live.csv', incremental=False, full=False):
     """
     Validate sensor_readings_live.csv
     
+    Streams the file like validate_threat_log, checking the live feed schema
+    (see netra_ingest.py) and the 0-100 range of every sensor column.
+    
+    Args:
+        incremental: Validate only readings appended since the last checkpoint
+        full: With incremental, rescan everything and rewrite the checkpoint
+    
     Returns:
         bool: True if validation passes, False otherwise
     """
     print("\n🔬 Validating sensor_readings_live.csv...")
+    return validate_csv_streaming(file_path, READINGS_REQUIRED_COLUMNS, READINGS_SENSOR_COLUMNS,
+                                  checkpoint=incremental, resume=not full)
+
+def validate_explosive_database(file_path='../explosive_database.csv'):
+    """
+    Validate explosive_database.csv
+    
+    Returns:
+        bool: True if validation passes, False otherwise
+    """
+    print("\n💣 Validating explosive_database.csv...")
     
     if not os.path.exists(file_path):
-        print(f"❌ Error: File not found: {file_path}")
-        return False
+        print("   ⚠️ Warning: explosive_database.csv not found (optional file)")
+        return True  # Not critical
     
     try:
         df = pd.read_csv(file_path)
         issues = []
         
-        # Check required columns
-        required_cols = ['Timestamp', 'Location', 'Fume_Detection', 
-                        'Metal_Detection', 'GPR_Reading']
+        print(f"   Total explosive types: {len(df)}")
         
+        # Check required columns
+        required_cols = ['Name', 'Fume_Color', 'Danger_Level']
         missing_cols = [col for col in required_cols if col not in df.columns]
+        
         if missing_cols:
             issues.append(f"Missing columns: {missing_cols}")
         
-        print(f"   Total readings: {len(df)}")
-        
-        # Validate sensor values
-        sensor_cols = [col for col in df.columns if col not in ['Timestamp', 'Location']]
-        
-        for col in sensor_cols:
-            if col in df.columns:
-                out_of_range = ((df[col] < 0) | (df[col] > 100)).sum()
-                if out_of_range > 0:
-                    issues.append(f"{col}: {out_of_range} values out of range (0-100)")
+        # Check for empty names
+        if 'Name' in df.columns:
+            empty_names = df['Name'].isna().sum()
+            if empty_names > 0:
+                issues.append(f"{empty_names} explosives with missing names")
         
         # Print results
         if issues:
@@ -207,37 +160,36 @@ def validate_sensor_readings(file_path='../sensor_readings_live.csv'):
         print(f"❌ Validation error: {str(e)}")
         return False
 
-def validate_explosive_database(file_path='../explosive_database.csv'):
+def validate_explosive_dataset(file_path=EXPLOSIVES_CSV):
     """
-    Validate explosive_database.csv
+    Validate explosives_dataset_1500_entries_Version2.csv through the
+    cached loader in netra_explosives.py
     
     Returns:
         bool: True if validation passes, False otherwise
     """
-    print("\n💣 Validating explosive_database.csv...")
+    print("\n💣 Validating explosives dataset...")
     
     if not os.path.exists(file_path):
-        print("   ⚠️ Warning: explosive_database.csv not found (optional file)")
+        print("   ⚠️ Warning: explosives dataset not found (generators use the fallback database)")
         return True  # Not critical
     
     try:
-        df = pd.read_csv(file_path)
+        table = load_explosives(file_path)
         issues = []
         
-        print(f"   Total explosive types: {len(df)}")
+        print(f"   Total explosive types: {len(table)}")
         
-        # Check required columns
-        required_cols = ['Name', 'Fume_Color', 'Danger_Level']
-        missing_cols = [col for col in required_cols if col not in df.columns]
+        if table.empty:
+            issues.append("No explosives parsed")
         
-        if missing_cols:
-            issues.append(f"Missing columns: {missing_cols}")
+        zero_velocity = int((table['velocity'] <= 0).sum())
+        if zero_velocity > 0:
+            issues.append(f"{zero_velocity} explosives without a detonation velocity")
         
-        # Check for empty names
-        if 'Name' in df.columns:
-            empty_names = df['Name'].isna().sum()
-            if empty_names > 0:
-                issues.append(f"{empty_names} explosives with missing names")
+        unknown_fumes = int((table['fume_color'] == 'Unknown').sum())
+        if unknown_fumes > 0:
+            print(f"   ⚠️ Warning: {unknown_fumes} explosives with unrecognised fume colour")
         
         # Print results
         if issues:
@@ -253,10 +205,15 @@ def validate_explosive_database(file_path='../explosive_database.csv'):
         print(f"❌ Validation error: {str(e)}")
         return False
 
-def run_full_validation():
+def run_full_validation(incremental=True, full=False):
     """
     Run complete validation suite
     
+    Args:
+        incremental: Checkpoint the append-only files (threat log, sensor
+            readings) and validate only what was appended since the last run
+        full: Ignore existing checkpoints and rescan everything
+    
     Returns:
         bool: True if all validations pass
     """
@@ -264,10 +221,11 @@ def run_full_validation():
     print("=" * 60)
     
     results = {
-        'Threat Log': validate_threat_log(),
+        'Threat Log': validate_threat_log(incremental=incremental, full=full),
         'Locations': validate_locations(),
-        'Sensor Readings': validate_sensor_readings(),
-        'Explosive Database': validate_explosive_database()
+        'Sensor Readings': validate_sensor_readings(incremental=incremental, full=full),
+        'Explosive Database': validate_explosive_database(),
+        'Explosive Dataset': validate_explosive_dataset()
     }
     
     print("\n" + "=" * 60)
@@ -290,5 +248,12 @@ def run_full_validation():
         return False
 
 if __name__ == "__main__":
-    success = run_full_validation()
+    import argparse
+    
+    parser = argparse.ArgumentParser(description="N.E.T.R.A. data validation suite")
+    parser.add_argument('--full', action='store_true', help="Ignore checkpoints and rescan append-only files")
+    parser.add_argument('--no-checkpoint', action='store_true', help="Neither read nor write checkpoints")
+    args = parser.parse_args()
+    
+    success = run_full_validation(incremental=not args.no_checkpoint, full=args.full)
     exit(0 if success else 1)
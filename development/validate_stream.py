@@ -0,0 +1,607 @@
+"""
+Streaming Threat Log Validator for N.E.T.R.A. System
+Validates netra_threat_log.csv files of any size in a single pass
+
+The file is read in fixed-size byte blocks cut at line boundaries. Each
+block is parsed and summarized once (row count, nulls, timestamp range,
+threat levels, sensor ranges, confidence, row digests); block summaries are
+merged as they arrive, so memory stays bounded by a few blocks plus the
+duplicate set (8-16 bytes per distinct row). Blocks can be summarized in
+worker processes.
+
+Rows must not contain quoted newlines (true for every N.E.T.R.A. export).
+
+Append-only files (the threat log, sensor_readings_live.csv) can be
+validated incrementally. With checkpointing on, each run saves its byte
+offset, merged summary and duplicate-digest table to a '<csv>.checkpoint.npz'
+sidecar. The next run hashes the header, the first MiB and the bytes just
+before the saved offset. If they are unchanged it parses only the appended
+tail and merges it into the saved summary. A truncated or rewritten file
+fails those checks and gets a full pass. An unterminated last line (a write
+in progress) is validated but left out of the checkpoint.
+
+Usage:
+    python validate_stream.py ../netra_threat_log.csv
+    python validate_stream.py big_log.csv --block-mb 64 --workers 4
+    python validate_stream.py ../netra_threat_log.csv --checkpoint
+    python validate_stream.py ../sensor_readings_live.csv --readings --checkpoint
+"""
+
+import io
+import os
+import hashlib
+import sys
+import time
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+
+REQUIRED_COLUMNS = [
+    'Timestamp', 'Location', 'State', 'Threat_Level', 'Threat_Probability',
+    'Fume_Detection', 'Metal_Detection', 'GPR_Reading',
+    'Ground_CV', 'Drone_CV', 'Disturbance', 'Thermal',
+    'Explosive_Type', 'Fume_Signature', 'Danger_Level', 'Action'
+]
+SENSOR_COLUMNS = ['Fume_Detection', 'Metal_Detection', 'GPR_Reading',
+                  'Ground_CV', 'Drone_CV', 'Disturbance', 'Thermal']
+
+# sensor_readings_live.csv schema (see netra_ingest.py)
+READINGS_SENSOR_COLUMNS = ['fume', 'metal', 'gpr', 'ground_cv', 'drone_cv', 'disturbance', 'thermal']
+READINGS_REQUIRED_COLUMNS = ['Timestamp', 'Location_ID', 'Location', 'State',
+                             'Latitude', 'Longitude', *READINGS_SENSOR_COLUMNS]
+
+DEFAULT_BLOCK_BYTES = 32 << 20
+
+# Bump when the checkpoint layout or summary fields change so old sidecars are ignored
+CHECKPOINT_VERSION = 1
+PREFIX_BYTES = 1 << 20
+ANCHOR_BYTES = 64 << 10
+
+
+class DigestSet:
+    """
+    Open-addressing hash set of 64-bit row digests
+
+    Inserts whole arrays at once (vectorized linear probing) and reports
+    how many of them were already present.
+    """
+
+    def __init__(self, capacity: int = 1 << 16):
+        self._table = np.zeros(capacity, dtype=np.uint64)
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    @classmethod
+    def from_table(cls, table: np.ndarray) -> 'DigestSet':
+        """Rebuild a set from its saved table (see table)"""
+        digests = cls.__new__(cls)
+        digests._table = np.asarray(table, dtype=np.uint64).copy()
+        digests._size = int(np.count_nonzero(digests._table))
+        return digests
+
+    @property
+    def table(self) -> np.ndarray:
+        """Backing hash table (0 = empty slot)"""
+        return self._table
+
+    def contains(self, digests: np.ndarray) -> np.ndarray:
+        """Which digests are already in the set, without inserting them"""
+        keys = np.asarray(digests, dtype=np.uint64)
+        keys = np.where(keys == 0, np.uint64(1), keys)
+        mask = np.uint64(len(self._table) - 1)
+        position = keys & mask
+        index = np.arange(len(keys))
+        found = np.zeros(len(keys), dtype=bool)
+
+        while len(keys):
+            slot = self._table[position]
+            hit = slot == keys
+            found[index[hit]] = True
+            probe = ~(hit | (slot == 0))
+            keys, index = keys[probe], index[probe]
+            position = (position[probe] + np.uint64(1)) & mask
+        return found
+
+    def add(self, digests: np.ndarray) -> int:
+        """
+        Insert digests
+
+        Returns:
+            int: How many were duplicates (of the set or of each other)
+        """
+        digests = np.asarray(digests, dtype=np.uint64)
+        digests = np.where(digests == 0, np.uint64(1), digests)  # 0 marks an empty slot
+        unique = np.unique(digests)
+
+        if 2 * (self._size + len(unique)) > len(self._table):
+            self._grow(self._size + len(unique))
+        present = self._insert(self._table, unique)
+        self._size += len(unique) - present
+        return len(digests) - len(unique) + present
+
+    @staticmethod
+    def _insert(table: np.ndarray, keys: np.ndarray) -> int:
+        mask = np.uint64(len(table) - 1)
+        position = keys & mask
+        found = 0
+
+        while len(keys):
+            slot = table[position]
+            present = slot == keys
+            found += int(present.sum())
+
+            # Claim empty slots; when several keys race for one slot, one wins
+            empty = slot == 0
+            table[position[empty]] = keys[empty]
+            placed = present | (empty & (table[position] == keys))
+
+            keys = keys[~placed]
+            position = (position[~placed] + np.uint64(1)) & mask
+        return found
+
+    def _grow(self, needed: int) -> None:
+        capacity = len(self._table)
+        while 2 * needed > capacity:
+            capacity *= 2
+        table = np.zeros(capacity, dtype=np.uint64)
+        self._insert(table, self._table[self._table != 0])
+        self._table = table
+
+
+def read_blocks(path: str, block_bytes: int = DEFAULT_BLOCK_BYTES,
+                start: int = 0) -> Iterator[Tuple[int, bytes]]:
+    """
+    Yield (offset, bytes) blocks of complete lines
+
+    Args:
+        path: File to read
+        block_bytes: Approximate block size
+        start: Byte offset to start from (must be a line start)
+
+    Yields:
+        Tuples of (file offset of the block, block bytes ending in a newline
+        unless it is the file's unterminated last line)
+    """
+    with open(path, 'rb') as f:
+        f.seek(start)
+        offset = start
+        carry = b''
+        while True:
+            data = f.read(block_bytes)
+            if not data:
+                if carry:
+                    yield offset, carry
+                return
+            data = carry + data
+            cut = data.rfind(b'\n') + 1
+            if cut == 0:
+                carry = data
+                continue
+            yield offset, data[:cut]
+            offset += cut
+            carry = data[cut:]
+
+
+def _numeric(column: pd.Series) -> pd.Series:
+    """Text column as floats; non-numeric entries become NaN"""
+    try:
+        return column.astype(np.float64)
+    except ValueError:
+        return pd.to_numeric(column, errors='coerce')
+
+
+def summarize_block(columns: List[str], data: bytes,
+                    sensor_columns: List[str] = SENSOR_COLUMNS) -> Dict:
+    """
+    Summarize one block of CSV lines (runs in worker processes)
+
+    Args:
+        columns: Column names from the header
+        data: Complete CSV data lines
+        sensor_columns: Columns checked for the 0-100 sensor range
+
+    Returns:
+        dict: Mergeable block summary (see merge_summary) plus row 'digests'
+    """
+    df = pd.read_csv(io.BytesIO(data), header=None, names=columns, dtype=str)
+    summary = empty_summary(columns, len(sensor_columns))
+    summary['rows'] = len(df)
+    summary['nulls'] = df.isnull().sum().to_numpy(dtype=np.int64)
+
+    # Every column as text, so equal rows hash alike whatever the block's type inference
+    summary['digests'] = pd.util.hash_pandas_object(df, index=False).to_numpy(dtype=np.uint64)
+
+    if 'Timestamp' in df.columns:
+        timestamp = pd.to_datetime(df['Timestamp'], errors='coerce')
+        summary['bad_timestamps'] = int((timestamp.isna() & df['Timestamp'].notna()).sum())
+        if timestamp.notna().any():
+            summary['first'] = timestamp.min()
+            summary['last'] = timestamp.max()
+
+    if 'Threat_Level' in df.columns:
+        summary['levels'] = df['Threat_Level'].value_counts().to_dict()
+
+    for i, column in enumerate(sensor_columns):
+        if column not in df.columns:
+            continue
+        values = _numeric(df[column])
+        summary['non_numeric'][i] = int((values.isna() & df[column].notna()).sum())
+        summary['out_of_range'][i] = int(((values < 0) | (values > 100)).sum())
+        summary['sensor_sum'][i] = float(values.sum())
+        summary['sensor_count'][i] = int(values.count())
+        summary['sensor_min'][i] = float(values.min()) if values.count() else np.inf
+        summary['sensor_max'][i] = float(values.max()) if values.count() else -np.inf
+
+    for column, key in (('Confidence', 'confidence'), ('Threat_Probability', 'probability')):
+        if column in df.columns:
+            values = _numeric(df[column])
+            summary[f'{key}_sum'] = float(values.sum())
+            summary[f'{key}_count'] = int(values.count())
+    return summary
+
+
+def empty_summary(columns: List[str], sensors: int = len(SENSOR_COLUMNS)) -> Dict:
+    """Summary of zero rows (sensors = number of range-checked columns)"""
+    return {
+        'rows': 0,
+        'duplicates': 0,
+        'nulls': np.zeros(len(columns), dtype=np.int64),
+        'bad_timestamps': 0,
+        'first': None,
+        'last': None,
+        'levels': {},
+        'non_numeric': np.zeros(sensors, dtype=np.int64),
+        'out_of_range': np.zeros(sensors, dtype=np.int64),
+        'sensor_sum': np.zeros(sensors),
+        'sensor_count': np.zeros(sensors, dtype=np.int64),
+        'sensor_min': np.full(sensors, np.inf),
+        'sensor_max': np.full(sensors, -np.inf),
+        'confidence_sum': 0.0,
+        'confidence_count': 0,
+        'probability_sum': 0.0,
+        'probability_count': 0
+    }
+
+
+def merge_summary(total: Dict, block: Dict) -> None:
+    """Fold a block summary into a running total (in place)"""
+    for key in ('rows', 'bad_timestamps', 'confidence_sum', 'confidence_count',
+                'probability_sum', 'probability_count'):
+        total[key] += block[key]
+    for key in ('nulls', 'non_numeric', 'out_of_range', 'sensor_sum', 'sensor_count'):
+        total[key] = total[key] + block[key]
+    total['sensor_min'] = np.minimum(total['sensor_min'], block['sensor_min'])
+    total['sensor_max'] = np.maximum(total['sensor_max'], block['sensor_max'])
+    if block['first'] is not None:
+        total['first'] = block['first'] if total['first'] is None else min(total['first'], block['first'])
+        total['last'] = block['last'] if total['last'] is None else max(total['last'], block['last'])
+    for level, count in block['levels'].items():
+        total['levels'][level] = total['levels'].get(level, 0) + count
+
+
+def _summaries(columns: List[str], blocks: Iterator[Tuple[int, bytes]], workers: int,
+               sensor_columns: List[str] = SENSOR_COLUMNS) -> Iterator[Tuple[int, int, Dict]]:
+    """Yield (offset, length, summary) per block, in file order"""
+    if workers <= 1:
+        for offset, data in blocks:
+            yield offset, len(data), summarize_block(columns, data, sensor_columns)
+        return
+
+    # At most 2 blocks in flight per worker keeps memory bounded
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending = []
+        for offset, data in blocks:
+            pending.append((offset, len(data), pool.submit(summarize_block, columns, data, sensor_columns)))
+            if len(pending) >= 2 * workers:
+                offset, length, future = pending.pop(0)
+                yield offset, length, future.result()
+        for offset, length, future in pending:
+            yield offset, length, future.result()
+
+
+def checkpoint_path(file_path: str) -> str:
+    """Checkpoint sidecar of a validated file"""
+    return f"{file_path}.checkpoint.npz"
+
+
+def _range_hash(file_path: str, start: int, stop: int) -> str:
+    with open(file_path, 'rb') as f:
+        f.seek(start)
+        return hashlib.sha256(f.read(max(stop - start, 0))).hexdigest()
+
+
+def _fingerprint(file_path: str, header: bytes, offset: int) -> Dict[str, str]:
+    """Hashes of the header, the first PREFIX_BYTES and the ANCHOR_BYTES before offset"""
+    return {
+        'header_sha256': hashlib.sha256(header).hexdigest(),
+        'prefix_sha256': _range_hash(file_path, 0, min(offset, PREFIX_BYTES)),
+        'anchor_sha256': _range_hash(file_path, max(offset - ANCHOR_BYTES, 0), offset)
+    }
+
+
+def save_checkpoint(file_path: str, header: bytes, offset: int,
+                    summary: Dict, seen: DigestSet) -> str:
+    """
+    Save the state of a scan that ended at offset (tmp file + rename)
+
+    Returns:
+        str: Path to the checkpoint
+    """
+    levels = summary['levels']
+    arrays = {
+        'version': CHECKPOINT_VERSION,
+        'pandas_version': pd.__version__,
+        'offset': offset,
+        'columns': np.array(summary['columns'], dtype=str),
+        'sensor_columns': np.array(summary['sensor_columns'], dtype=str),
+        'level_names': np.array(list(levels), dtype=str),
+        'level_counts': np.array(list(levels.values()), dtype=np.int64),
+        'first': np.datetime64(summary['first'] if summary['first'] is not None else 'NaT', 'ns'),
+        'last': np.datetime64(summary['last'] if summary['last'] is not None else 'NaT', 'ns'),
+        'digests': seen.table,
+        **_fingerprint(file_path, header, offset)
+    }
+    for key, value in summary.items():
+        if key not in arrays and key not in ('levels', 'first', 'last'):
+            arrays[key] = value
+
+    path = checkpoint_path(file_path)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'wb') as f:
+        np.savez(f, **{key: np.asarray(value) for key, value in arrays.items()})
+    os.replace(tmp_path, path)
+    return path
+
+
+def load_checkpoint(file_path: str, header: bytes,
+                    sensor_columns: List[str]) -> Tuple[Optional[Tuple[int, Dict, DigestSet]], str]:
+    """
+    Load a checkpoint if it still describes a prefix of the file
+
+    Returns:
+        Tuple of ((offset, summary, digest set) or None, status message)
+    """
+    try:
+        with np.load(checkpoint_path(file_path), allow_pickle=False) as saved:
+            saved = {key: saved[key] for key in saved.files}
+    except FileNotFoundError:
+        return None, "no checkpoint"
+    except (OSError, ValueError):
+        return None, "unreadable checkpoint"
+
+    try:
+        if int(saved['version']) != CHECKPOINT_VERSION or str(saved['pandas_version']) != pd.__version__:
+            return None, "checkpoint from another version"
+        offset = int(saved['offset'])
+        columns = header.decode('utf-8-sig').strip().split(',')
+        if saved['columns'].tolist() != columns or saved['sensor_columns'].tolist() != list(sensor_columns):
+            return None, "header changed"
+        if os.path.getsize(file_path) < offset:
+            return None, "file truncated"
+        for key, digest in _fingerprint(file_path, header, offset).items():
+            if str(saved[key]) != digest:
+                return None, "header changed" if key == 'header_sha256' else "file rewritten"
+
+        summary = empty_summary(columns, len(sensor_columns))
+        for key, value in summary.items():
+            if key in saved and key not in ('first', 'last', 'levels'):
+                summary[key] = saved[key] if isinstance(value, np.ndarray) else type(value)(saved[key])
+        summary['levels'] = dict(zip(saved['level_names'].tolist(), saved['level_counts'].tolist()))
+        for key in ('first', 'last'):
+            summary[key] = None if np.isnat(saved[key]) else pd.Timestamp(saved[key][()])
+        summary['columns'] = columns
+        summary['sensor_columns'] = list(sensor_columns)
+        return (offset, summary, DigestSet.from_table(saved['digests'])), "resumed"
+    except KeyError:
+        return None, "incomplete checkpoint"
+
+
+def _complete_lines(blocks: Iterator[Tuple[int, bytes]],
+                    partial: List[Tuple[int, bytes]]) -> Iterator[Tuple[int, bytes]]:
+    """Pass through newline-terminated blocks; set aside an unterminated last line"""
+    for offset, data in blocks:
+        if data.endswith(b'\n'):
+            yield offset, data
+        else:
+            partial.append((offset, data))
+
+
+def scan_threat_log(file_path: str, block_bytes: int = DEFAULT_BLOCK_BYTES,
+                    workers: int = 0, sensor_columns: Optional[List[str]] = None,
+                    checkpoint: bool = False, resume: bool = True) -> Dict:
+    """
+    Compute every threat log check and statistic in one pass
+
+    Args:
+        file_path: netra_threat_log.csv-style file (or any append-only CSV)
+        block_bytes: Bytes read per block
+        workers: Worker processes for parsing blocks (0 or 1 = in-process)
+        sensor_columns: Columns checked for the 0-100 range (default: SENSOR_COLUMNS)
+        checkpoint: Save the scan state to the checkpoint sidecar
+        resume: With checkpoint, continue from a valid saved state instead of
+            rescanning the whole file
+
+    Returns:
+        dict: Merged summary with 'columns', 'sensor_columns', 'duplicates',
+        'scanned_from' (byte offset this run started at) and 'checkpoint' (status)
+    """
+    sensor_columns = list(SENSOR_COLUMNS if sensor_columns is None else sensor_columns)
+    with open(file_path, 'rb') as f:
+        header = f.readline()
+    columns = header.decode('utf-8-sig').strip().split(',')
+
+    state, status = load_checkpoint(file_path, header, sensor_columns) if checkpoint and resume else (None, "full pass")
+    if state is not None:
+        start, total, seen = state
+    else:
+        start, seen = len(header), DigestSet()
+        total = empty_summary(columns, len(sensor_columns))
+        total['columns'] = columns
+        total['sensor_columns'] = sensor_columns
+
+    end = start
+    partial = []
+    blocks = _complete_lines(read_blocks(file_path, block_bytes, start), partial)
+    for offset, length, block in _summaries(columns, blocks, workers, sensor_columns):
+        total['duplicates'] += seen.add(block.pop('digests'))
+        merge_summary(total, block)
+        end = offset + length
+
+    if checkpoint:
+        save_checkpoint(file_path, header, end, total, seen)
+        if state is None and resume:
+            status = f"full pass ({status})"
+
+    # A line still being written counts in this report but not in the checkpoint
+    for _, data in partial:
+        block = summarize_block(columns, data, sensor_columns)
+        digests = block.pop('digests')
+        total = dict(total, levels=dict(total['levels']))
+        total['duplicates'] += int(seen.contains(digests).sum())
+        merge_summary(total, block)
+
+    total['scanned_from'] = start
+    total['checkpoint'] = status
+    return total
+
+
+def report_issues(summary: Dict, required_columns: List[str] = REQUIRED_COLUMNS) -> List[str]:
+    """Validation issues of a merged summary (same checks as validate_threat_log)"""
+    columns = summary['columns']
+    issues = []
+
+    missing = [column for column in required_columns if column not in columns]
+    if missing:
+        issues.append(f"Missing columns: {missing}")
+    if summary['duplicates']:
+        issues.append(f"Found {summary['duplicates']} duplicate records")
+    if summary['bad_timestamps']:
+        issues.append(f"{summary['bad_timestamps']} unparseable timestamps")
+
+    for i, column in enumerate(summary['sensor_columns']):
+        if summary['non_numeric'][i]:
+            issues.append(f"{column}: {summary['non_numeric'][i]} non-numeric values")
+        if summary['out_of_range'][i]:
+            issues.append(f"{column}: {summary['out_of_range'][i]} values out of range (0-100)")
+
+    nulls = {column: int(count) for column, count in zip(columns, summary['nulls']) if count}
+    if nulls:
+        issues.append(f"Null values found: {nulls}")
+
+    if summary['confidence_count']:
+        average = summary['confidence_sum'] / summary['confidence_count']
+        if average < 30:
+            issues.append(f"Low average confidence: {average:.2f}")
+    return issues
+
+
+def print_summary(summary: Dict) -> None:
+    """Print record count, date range, distributions and sensor statistics"""
+    rows = summary['rows']
+    print(f"   Total records: {rows:,}")
+    if summary['first'] is not None:
+        print(f"   Date range: {(summary['last'] - summary['first']).days} days "
+              f"({summary['first']} to {summary['last']})")
+
+    if summary['levels']:
+        print(f"   Threat distribution:")
+        for level, count in sorted(summary['levels'].items(), key=lambda item: -item[1]):
+            print(f"      {level}: {count:,} ({count / max(rows, 1) * 100:.1f}%)")
+
+    print(f"   Sensor ranges:")
+    for i, column in enumerate(summary['sensor_columns']):
+        if summary['sensor_count'][i]:
+            mean = summary['sensor_sum'][i] / summary['sensor_count'][i]
+            print(f"      {column}: {summary['sensor_min'][i]:.2f} - {summary['sensor_max'][i]:.2f} "
+                  f"(mean {mean:.2f})")
+
+    if summary['probability_count']:
+        print(f"   Average threat probability: {summary['probability_sum'] / summary['probability_count']:.2f}")
+    if summary['confidence_count']:
+        print(f"   Average confidence: {summary['confidence_sum'] / summary['confidence_count']:.2f}")
+
+
+def validate_csv_streaming(file_path: str, required_columns: List[str] = REQUIRED_COLUMNS,
+                           sensor_columns: List[str] = SENSOR_COLUMNS,
+                           block_bytes: int = DEFAULT_BLOCK_BYTES, workers: int = 0,
+                           checkpoint: bool = False, resume: bool = True) -> bool:
+    """
+    Validate a CSV of any size in one streaming pass
+
+    Args:
+        file_path: File to validate
+        required_columns: Columns that must be present
+        sensor_columns: Columns checked for the 0-100 range
+        block_bytes: Bytes parsed per block
+        workers: Worker processes for parsing blocks (0 = in-process)
+        checkpoint: Save a checkpoint so the next run validates only appended rows
+        resume: With checkpoint, start from the saved checkpoint when it is valid
+
+    Returns:
+        bool: True if validation passes, False otherwise
+    """
+    print(f"📊 Validating {os.path.basename(file_path)} (streaming)...")
+
+    if not os.path.exists(file_path):
+        print(f"❌ Error: File not found: {file_path}")
+        return False
+
+    try:
+        start = time.perf_counter()
+        summary = scan_threat_log(file_path, block_bytes, workers, sensor_columns, checkpoint, resume)
+        elapsed = time.perf_counter() - start
+        print_summary(summary)
+        scanned = os.path.getsize(file_path) - summary['scanned_from']
+        print(f"   Scanned {scanned / 1e6:,.1f} MB in {elapsed:.2f}s")
+        if checkpoint:
+            print(f"   Checkpoint: {summary['checkpoint']} "
+                  f"(started at byte {summary['scanned_from']:,})")
+
+        issues = report_issues(summary, required_columns)
+        if issues:
+            print(f"\n❌ Validation failed with {len(issues)} issues:")
+            for issue in issues:
+                print(f"   - {issue}")
+            return False
+        print("   ✅ All validation checks passed!")
+        return True
+
+    except Exception as e:
+        print(f"❌ Validation error: {str(e)}")
+        return False
+
+
+def validate_threat_log_streaming(file_path: str = '../netra_threat_log.csv',
+                                  block_bytes: int = DEFAULT_BLOCK_BYTES, workers: int = 0,
+                                  checkpoint: bool = False, resume: bool = True) -> bool:
+    """
+    Validate a threat log of any size in one streaming pass
+
+    Returns:
+        bool: True if validation passes, False otherwise
+    """
+    return validate_csv_streaming(file_path, REQUIRED_COLUMNS, SENSOR_COLUMNS,
+                                  block_bytes, workers, checkpoint, resume)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="N.E.T.R.A. streaming threat log validator")
+    parser.add_argument('file', nargs='?', default='../netra_threat_log.csv')
+    parser.add_argument('--block-mb', type=float, default=DEFAULT_BLOCK_BYTES / (1 << 20), help="Block size in MiB")
+    parser.add_argument('--workers', type=int, default=0, help="Worker processes (0 = in-process)")
+    parser.add_argument('--readings', action='store_true', help="File has the sensor_readings_live.csv schema")
+    parser.add_argument('--checkpoint', action='store_true', help="Validate only rows appended since the last checkpoint")
+    parser.add_argument('--full', action='store_true', help="With --checkpoint, rescan everything and rewrite the checkpoint")
+    args = parser.parse_args()
+
+    required, sensors = ((READINGS_REQUIRED_COLUMNS, READINGS_SENSOR_COLUMNS) if args.readings
+                         else (REQUIRED_COLUMNS, SENSOR_COLUMNS))
+    success = validate_csv_streaming(args.file, required, sensors, int(args.block_mb * (1 << 20)),
+                                     args.workers, args.checkpoint, not args.full)
+    sys.exit(0 if success else 1)
@@ -0,0 +1,106 @@
+"""
+N.E.T.R.A. Threat Banding
+
+Single source of truth for threat-level bands. Every band is one row of
+THREAT_BANDS; the lookup arrays below are built from it once at import, so
+classifying a whole probability array is one np.searchsorted call and
+mapping bands to labels, colours or recommendations is a fancy-index into
+interned, immutable values.
+
+Used by both the core engine and the Streamlit app.
+"""
+
+import bisect
+from typing import NamedTuple, Tuple
+
+import numpy as np
+
+
+class ThreatBand(NamedTuple):
+    """One threat-level band"""
+    min_probability: float           # Inclusive lower bound (%)
+    name: str                        # Plain name used in CSV logs
+    label: str                       # Display label
+    color: str                       # Hex colour
+    description: str                 # Short classification
+    action: str                      # One-line action used in threat logs
+    recommendations: Tuple[str, ...]
+
+
+# Bands in ascending order of probability
+THREAT_BANDS: Tuple[ThreatBand, ...] = (
+    ThreatBand(0, 'LOW', "⚪ LOW", "#3b82f6", "Area Cleared",
+               'Standard patrol procedures', (
+                   "✅ AREA CLEARED - No immediate threat",
+                   "📝 UPDATE digital twin database",
+                   "🚦 SAFE for normal traffic operations",
+                   "📊 ARCHIVE scan data for future reference"
+               )),
+    ThreatBand(25, 'MODERATE', "🟢 MODERATE", "#10b981", "Routine Monitoring",
+               'Enhanced monitoring and caution advised', (
+                   "👀 MONITOR area with routine patrols",
+                   "📊 LOG sensor data for pattern analysis",
+                   "🔄 SCHEDULE follow-up scans in 2 hours",
+                   "📝 UPDATE threat database",
+                   "✅ MAINTAIN low-risk status"
+               )),
+    ThreatBand(50, 'HIGH', "🟡 HIGH", "#f59e0b", "Enhanced Monitoring",
+               'Route diversion and increased surveillance', (
+                   "🔍 CONDUCT detailed ground investigation",
+                   "🚧 PLACE warning markers and caution tape",
+                   "🚁 INCREASE drone surveillance frequency",
+                   "📸 DOCUMENT area with multiple angles",
+                   "⏱️ REASSESS threat level every 15 minutes",
+                   "📞 NOTIFY local security personnel",
+                   "🗺️ PREPARE evacuation routes"
+               )),
+    ThreatBand(75, 'CRITICAL', "🔴 CRITICAL", "#dc2626", "Immediate Action Required",
+               'Immediate evacuation and EOD deployment', (
+                   "⚠️ EVACUATE 200m radius IMMEDIATELY",
+                   "🚫 BLOCK all vehicle and pedestrian traffic",
+                   "⚡ DEPLOY bomb disposal unit",
+                   "📡 ALERT military and civilian authorities",
+                   "🚁 MAINTAIN continuous aerial surveillance",
+                   "📸 CAPTURE high-resolution evidence",
+                   "🔒 SECURE perimeter with armed forces"
+               )),
+)
+
+# Band indices
+LOW, MODERATE, HIGH, CRITICAL = range(len(THREAT_BANDS))
+
+# Lower bounds of every band above LOW
+BAND_THRESHOLDS = np.array([band.min_probability for band in THREAT_BANDS[1:]], dtype=np.float64)
+_THRESHOLD_LIST = BAND_THRESHOLDS.tolist()
+
+# Lookup arrays indexed by band
+BAND_NAMES = np.array([band.name for band in THREAT_BANDS], dtype=object)
+BAND_LABELS = np.array([band.label for band in THREAT_BANDS], dtype=object)
+BAND_COLORS = np.array([band.color for band in THREAT_BANDS], dtype=object)
+BAND_ACTIONS = np.array([band.action for band in THREAT_BANDS], dtype=object)
+
+# Band index by plain name, e.g. for the Threat_Level column of threat logs
+BAND_INDEX = {band.name: i for i, band in enumerate(THREAT_BANDS)}
+
+
+def classify(probabilities) -> np.ndarray:
+    """
+    Band index for every probability in one vectorized call
+
+    Args:
+        probabilities: Array of threat probabilities (0-100%, no NaN)
+
+    Returns:
+        np.ndarray: Band indices (LOW=0 ... CRITICAL=3)
+    """
+    return np.searchsorted(BAND_THRESHOLDS, probabilities, side='right')
+
+
+def band_index(probability: float) -> int:
+    """Band index of a single probability"""
+    return bisect.bisect_right(_THRESHOLD_LIST, probability)
+
+
+def band_of(probability: float) -> ThreatBand:
+    """Band of a single probability"""
+    return THREAT_BANDS[band_index(probability)]
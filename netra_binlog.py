@@ -0,0 +1,431 @@
+"""
+N.E.T.R.A. Binary Scan Log
+
+Append-only, fixed-width binary format for scan records, readable with
+np.memmap without parsing.
+
+File layout:
+    <log>.bin   64-byte header, then RECORD_DTYPE records back to back
+    <log>.bin.strings
+                String table: one JSON-encoded string per line; line n holds
+                code n (code 0, the empty string, is implicit)
+
+Text columns (location, state, explosive metadata, the scan ID's session)
+are stored as string
+codes, so every record has the same width. Appends are O(1): one record
+write, plus one string-table line the first time a new string is seen.
+Readers use the file size to find the record count and ignore a trailing
+partial record left by an interrupted write.
+
+Converters map to and from both the netra_threat_log.csv schema and the
+NetraAI.export_history_to_csv schema.
+
+Usage:
+    python netra_binlog.py to-bin netra_threat_log.csv netra_threat_log.bin
+    python netra_binlog.py to-csv netra_threat_log.bin netra_threat_log_copy.csv
+    python netra_binlog.py info netra_threat_log.bin
+"""
+
+import os
+import sys
+import json
+import time
+import struct
+import argparse
+from datetime import datetime
+from typing import Dict, List, Tuple
+
+import numpy as np
+import pandas as pd
+
+from netra_bands import BAND_ACTIONS, BAND_INDEX, BAND_LABELS, BAND_NAMES, classify
+from netra_core import SENSOR_ORDER, LOG_SENSOR_COLUMNS, scan_ids
+from netra_locations import get_location_registry
+
+
+MAGIC = b'NETRALOG'
+FORMAT_VERSION = 1
+HEADER_SIZE = 64
+
+# magic, format version, header size, record size, sensors per record
+_HEADER = struct.Struct('<8sHHHH')
+
+RECORD_DTYPE = np.dtype([
+    ('seq', '<i8'),
+    ('timestamp', '<M8[us]'),
+    ('probability', '<f8'),
+    ('confidence', '<f8'),
+    ('sensors', '<f8', (len(SENSOR_ORDER),)),
+    ('density', '<f8'),
+    ('location', '<u4'),
+    ('state', '<u4'),
+    ('explosive_type', '<u4'),
+    ('fume_signature', '<u4'),
+    ('danger_level', '<u4'),
+    ('brisance', '<u4'),
+    ('explosive_class', '<u4'),
+    ('detonation_velocity', '<i4'),
+    ('level', 'u1'),
+    ('_pad', 'V3'),
+    ('session', '<u4')  # Formerly padding, so older logs read as session '' (code 0)
+])
+
+# String-coded record fields and their threat log columns
+STRING_FIELDS = {
+    'location': 'Location',
+    'state': 'State',
+    'explosive_type': 'Explosive_Type',
+    'fume_signature': 'Fume_Signature',
+    'danger_level': 'Danger_Level',
+    'brisance': 'Brisance',
+    'explosive_class': 'Explosive_Class'
+}
+
+
+class StringTable:
+    """Append-only string table backing the string-coded fields"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self.strings: List[str] = ['']
+        self.codes: Dict[str, int] = {'': 0}
+        self._torn_at = None  # Size to truncate to before the next append
+
+        if os.path.exists(path):
+            with open(path, 'rb') as f:
+                data = f.read()
+            complete = data.rfind(b'\n') + 1
+            for line in data[:complete].decode('utf-8').splitlines():
+                self._add(json.loads(line))
+            # A torn last line is ignored here and cut off before the next append;
+            # appending after it would fuse the two lines and shift every later code
+            if complete < len(data):
+                self._torn_at = complete
+
+    def _add(self, value: str) -> int:
+        code = len(self.strings)
+        self.strings.append(value)
+        self.codes[value] = code
+        return code
+
+    def code(self, value: str) -> int:
+        """Code for a string, appending it to the table if new"""
+        code = self.codes.get(value)
+        if code is None:
+            code = self._add(value)
+            if self._torn_at is not None:
+                os.truncate(self.path, self._torn_at)
+                self._torn_at = None
+            with open(self.path, 'a', encoding='utf-8') as f:
+                f.write(json.dumps(value) + '\n')
+        return code
+
+    def encode(self, values) -> np.ndarray:
+        """Codes for an array of strings (NaN/None become '')"""
+        values = pd.Series(values, dtype=object).fillna('').astype(str).to_numpy()
+        if len(values) == 0:
+            return np.zeros(0, dtype=np.uint32)
+        unique, inverse = np.unique(values, return_inverse=True)
+        return np.array([self.code(v) for v in unique], dtype=np.uint32)[inverse]
+
+    def decode(self, codes: np.ndarray) -> np.ndarray:
+        """Strings for an array of codes"""
+        return np.asarray(self.strings, dtype=object)[codes]
+
+
+def _check_header(header: bytes, path: str) -> None:
+    if len(header) < _HEADER.size:
+        raise ValueError(f"Truncated binary log header: {path}")
+    magic, version, header_size, record_size, sensors = _HEADER.unpack_from(header)
+    if magic != MAGIC:
+        raise ValueError(f"Not a NETRA binary log: {path}")
+    if version != FORMAT_VERSION or header_size != HEADER_SIZE:
+        raise ValueError(f"Unsupported binary log version {version}: {path}")
+    if record_size != RECORD_DTYPE.itemsize or sensors != len(SENSOR_ORDER):
+        raise ValueError(f"Binary log record layout mismatch: {path}")
+
+
+class BinaryLogWriter:
+    """
+    O(1) appender for a binary scan log
+
+    Batches (append_batch, append_records) are flushed to the OS as they
+    are written; single appends are flushed once flush_interval seconds have
+    passed since the last flush, and on flush() or close().
+
+    Args:
+        path: Log file (created with a header if missing)
+        flush_interval: Longest time in seconds single appends stay buffered
+    """
+
+    def __init__(self, path: str, flush_interval: float = 1.0):
+        self.path = path
+        self.flush_interval = flush_interval
+        self.strings = StringTable(f"{path}.strings")
+
+        if not os.path.exists(path) or os.path.getsize(path) == 0:
+            with open(path, 'wb') as f:
+                header = _HEADER.pack(MAGIC, FORMAT_VERSION, HEADER_SIZE,
+                                      RECORD_DTYPE.itemsize, len(SENSOR_ORDER))
+                f.write(header.ljust(HEADER_SIZE, b'\0'))
+        else:
+            with open(path, 'rb') as f:
+                _check_header(f.read(HEADER_SIZE), path)
+            # Drop a partial record left by an interrupted write
+            size = os.path.getsize(path)
+            whole = HEADER_SIZE + (size - HEADER_SIZE) // RECORD_DTYPE.itemsize * RECORD_DTYPE.itemsize
+            if whole != size:
+                os.truncate(path, whole)
+
+        self._file = open(path, 'ab')
+        self._record = np.zeros(1, dtype=RECORD_DTYPE)
+        self._flushed = time.monotonic()
+
+    def append(self, seq: int, timestamp: datetime, location: str, probability: float,
+               confidence: float, sensors: Dict[str, float], session: str = '') -> None:
+        """Append one engine scan"""
+        record = self._record[0]
+        record['seq'] = seq
+        record['timestamp'] = np.datetime64(timestamp, 'us')
+        record['location'] = self.strings.code(location)
+        record['state'] = self.strings.code(get_location_registry().attribute(location, 'state', ''))
+        record['probability'] = probability
+        record['confidence'] = confidence
+        record['sensors'] = [sensors[sensor] for sensor in SENSOR_ORDER]
+        record['level'] = classify(probability)
+        record['session'] = self.strings.code(session)
+        self._file.write(self._record.tobytes())
+        if time.monotonic() - self._flushed >= self.flush_interval:
+            self.flush()
+
+    def append_batch(self, seq: np.ndarray, timestamp: datetime, locations,
+                     probability: np.ndarray, confidence: np.ndarray,
+                     sensors: np.ndarray, session: str = '') -> None:
+        """Append a batch of engine scans sharing one timestamp"""
+        locations = pd.Series(locations, dtype=object)
+        records = np.zeros(len(seq), dtype=RECORD_DTYPE)
+        records['seq'] = seq
+        records['timestamp'] = np.datetime64(timestamp, 'us')
+        records['location'] = self.strings.encode(locations)
+        records['state'] = self.strings.encode(
+            get_location_registry().join(locations.to_frame('location'), 'location', ['state'])['state']
+        )
+        records['probability'] = probability
+        records['confidence'] = confidence
+        records['sensors'] = sensors
+        records['level'] = classify(probability)
+        records['session'] = self.strings.code(session)
+        self.append_records(records)
+
+    def append_records(self, records: np.ndarray) -> None:
+        """Append an array of RECORD_DTYPE records in one write"""
+        self._file.write(np.ascontiguousarray(records, dtype=RECORD_DTYPE).tobytes())
+        self.flush()
+
+    def flush(self) -> None:
+        self._file.flush()
+        self._flushed = time.monotonic()
+
+    def close(self) -> None:
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def read_binlog(path: str) -> Tuple[np.ndarray, StringTable]:
+    """
+    Memory-map a binary scan log
+
+    Args:
+        path: Log file
+
+    Returns:
+        Tuple of (read-only RECORD_DTYPE memmap, string table)
+    """
+    with open(path, 'rb') as f:
+        _check_header(f.read(HEADER_SIZE), path)
+
+    count = (os.path.getsize(path) - HEADER_SIZE) // RECORD_DTYPE.itemsize
+    strings = StringTable(f"{path}.strings")
+
+    if count == 0:
+        return np.zeros(0, dtype=RECORD_DTYPE), strings
+    records = np.memmap(path, dtype=RECORD_DTYPE, mode='r', offset=HEADER_SIZE, shape=(count,))
+    return records, strings
+
+
+def binlog_frame(path: str, schema: str = 'threat_log') -> pd.DataFrame:
+    """
+    Load a binary scan log as a DataFrame
+
+    Args:
+        path: Log file
+        schema: 'threat_log' (netra_threat_log.csv columns) or 'export'
+            (export_history_to_csv columns)
+
+    Returns:
+        DataFrame in the requested schema
+    """
+    records, strings = read_binlog(path)
+    level = records['level']
+    sensors = records['sensors']
+
+    if schema == 'export':
+        timestamp = pd.Series(records['timestamp'])
+        frame = pd.DataFrame({
+            'scan_id': scan_ids(timestamp, strings.decode(records['session']), records['seq']),
+            'timestamp': timestamp,
+            'location': strings.decode(records['location']),
+            'probability': records['probability'],
+            'threat_level': BAND_LABELS[level],
+            'confidence': records['confidence']
+        })
+        for i, sensor in enumerate(SENSOR_ORDER):
+            frame[sensor] = sensors[:, i]
+        return frame
+
+    frame = pd.DataFrame({
+        'Timestamp': records['timestamp'],
+        'Location': strings.decode(records['location']),
+        'State': strings.decode(records['state']),
+        'Threat_Level': BAND_NAMES[level],
+        'Threat_Probability': records['probability']
+    })
+    for i, column in enumerate(LOG_SENSOR_COLUMNS):
+        frame[column] = sensors[:, i]
+    frame['Explosive_Type'] = strings.decode(records['explosive_type'])
+    frame['Fume_Signature'] = strings.decode(records['fume_signature'])
+    frame['Danger_Level'] = strings.decode(records['danger_level'])
+    frame['Detonation_Velocity'] = records['detonation_velocity']
+    frame['Density'] = records['density']
+    frame['Brisance'] = strings.decode(records['brisance'])
+    frame['Explosive_Class'] = strings.decode(records['explosive_class'])
+    frame['Action'] = BAND_ACTIONS[level]
+    frame['Confidence'] = records['confidence']
+    return frame
+
+
+def _levels(values: pd.Series, probability: np.ndarray) -> np.ndarray:
+    """Band indices from a Threat_Level column (plain or emoji labels)"""
+    names = values.astype(str).str.split().str[-1].map(BAND_INDEX)
+    return np.where(names.isna(), classify(probability), names.fillna(0)).astype(np.uint8)
+
+
+def csv_to_binlog(csv_path: str, bin_path: str, chunksize: int = 500_000) -> int:
+    """
+    Convert a threat log or history export CSV to a binary log
+
+    Args:
+        csv_path: netra_threat_log.csv-style or export_history_to_csv-style file
+        bin_path: Binary log to create or append to
+        chunksize: Rows converted per chunk
+
+    Returns:
+        int: Number of records written
+    """
+    from netra_core import NetraAI
+    engine = NetraAI(history_capacity=1)
+    written = 0
+
+    with BinaryLogWriter(bin_path) as writer:
+        for chunk in pd.read_csv(csv_path, chunksize=chunksize):
+            records = np.zeros(len(chunk), dtype=RECORD_DTYPE)
+
+            if 'scan_id' in chunk.columns:
+                # export_history_to_csv schema
+                sensors = chunk[list(SENSOR_ORDER)].to_numpy(dtype=np.float64)
+                parts = chunk['scan_id'].str.split('-')
+                records['seq'] = parts.str[-1].astype(np.int64)
+                records['session'] = writer.strings.encode(parts.str[2].where(parts.str.len() == 4, ''))
+                records['timestamp'] = pd.to_datetime(chunk['timestamp']).to_numpy()
+                records['location'] = writer.strings.encode(chunk['location'])
+                records['probability'] = chunk['probability']
+                records['confidence'] = chunk['confidence']
+                records['level'] = _levels(chunk['threat_level'], records['probability'])
+            else:
+                # netra_threat_log.csv schema
+                sensors = chunk[list(LOG_SENSOR_COLUMNS)].to_numpy(dtype=np.float64)
+                records['seq'] = np.arange(written, written + len(chunk))
+                records['timestamp'] = pd.to_datetime(chunk['Timestamp']).to_numpy()
+                records['probability'] = chunk['Threat_Probability']
+                records['confidence'] = (chunk['Confidence'] if 'Confidence' in chunk.columns
+                                         else engine.get_confidence_score_batch(sensors))
+                records['level'] = _levels(chunk['Threat_Level'], records['probability'])
+                for field, column in STRING_FIELDS.items():
+                    if column in chunk.columns:
+                        records[field] = writer.strings.encode(chunk[column])
+                if 'Detonation_Velocity' in chunk.columns:
+                    records['detonation_velocity'] = chunk['Detonation_Velocity'].fillna(0)
+                if 'Density' in chunk.columns:
+                    records['density'] = chunk['Density'].fillna(0)
+
+            records['sensors'] = sensors
+            writer.append_records(records)
+            written += len(chunk)
+
+    return written
+
+
+def binlog_to_csv(bin_path: str, csv_path: str, schema: str = 'threat_log') -> int:
+    """
+    Convert a binary log back to CSV
+
+    Args:
+        bin_path: Binary log
+        csv_path: Output CSV
+        schema: 'threat_log' or 'export' (see binlog_frame)
+
+    Returns:
+        int: Number of records written
+    """
+    frame = binlog_frame(bin_path, schema)
+    column = 'timestamp' if schema == 'export' else 'Timestamp'
+    frame[column] = pd.Series(frame[column]).dt.strftime('%Y-%m-%d %H:%M:%S')
+    if schema == 'threat_log':
+        frame = frame.drop(columns=['Confidence'])
+    frame.to_csv(csv_path, index=False)
+    return len(frame)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="N.E.T.R.A. binary scan log tools")
+    sub = parser.add_subparsers(dest='command', required=True)
+
+    to_bin = sub.add_parser('to-bin', help="Convert CSV to a binary log")
+    to_bin.add_argument('csv')
+    to_bin.add_argument('bin')
+
+    to_csv = sub.add_parser('to-csv', help="Convert a binary log to CSV")
+    to_csv.add_argument('bin')
+    to_csv.add_argument('csv')
+    to_csv.add_argument('--schema', choices=['threat_log', 'export'], default='threat_log')
+
+    info = sub.add_parser('info', help="Summarize a binary log")
+    info.add_argument('bin')
+
+    args = parser.parse_args()
+
+    if args.command == 'to-bin':
+        count = csv_to_binlog(args.csv, args.bin)
+        print(f"✅ Wrote {count:,} records to {args.bin}")
+    elif args.command == 'to-csv':
+        count = binlog_to_csv(args.bin, args.csv, args.schema)
+        print(f"✅ Wrote {count:,} records to {args.csv}")
+    else:
+        records, strings = read_binlog(args.bin)
+        print(f"📦 {args.bin}: {len(records):,} records x {RECORD_DTYPE.itemsize} bytes, "
+              f"{len(strings.strings)} strings")
+        if len(records):
+            print(f"   Time range: {records['timestamp'].min()} to {records['timestamp'].max()}")
+            counts = np.bincount(records['level'], minlength=len(BAND_NAMES))
+            for name, count in zip(BAND_NAMES, counts):
+                print(f"      {name}: {count:,}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,403 @@
+"""
+N.E.T.R.A. Weight Calibration
+
+Fits sensor weights and correlation-boost thresholds against the labelled
+Threat_Level column of a threat log (netra_threat_log.csv schema).
+
+Candidates are (7 weights on the simplex, 5 correlation thresholds). They
+are scored many at a time by a vectorized kernel: one matrix product for
+the weighted sums, and one broadcast comparison per boost. Each boost
+depends only on a precomputed per-row statistic, e.g. min(fume, metal) for
+the chemical + metal rule or the 4th-highest reading for the multi-sensor
+rule. Candidate chunks are spread over a process pool whose workers receive
+the labelled data once.
+
+Search methods:
+    grid    - simplex lattice of weights x evenly spaced thresholds
+    random  - Dirichlet weights x uniform thresholds
+    scipy   - scipy.optimize.differential_evolution
+
+The best candidate is written to a versioned JSON weight file that
+NetraAI(weights_file=...) and netra_replay.py --weights can load.
+
+Usage:
+    python netra_calibration.py netra_threat_log.csv --method random --candidates 20000
+    python netra_calibration.py netra_threat_log.csv --method grid --weight-steps 5 -o netra_weights.json
+    python netra_calibration.py netra_threat_log.csv --method scipy --workers 4
+"""
+
+import os
+import sys
+import json
+import time
+import argparse
+import itertools
+from datetime import datetime
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterator, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from netra_bands import BAND_INDEX, classify
+from netra_core import (NetraAI, SENSOR_ORDER, LOG_SENSOR_COLUMNS, WEIGHT_FILE_FORMAT,
+                        load_weight_file)
+
+
+# Correlation thresholds in candidate-vector order, with search ranges (%)
+THRESHOLD_RANGES = {
+    'fume_metal': (50, 90),
+    'visual_agreement': (5, 30),
+    'thermal_fume': (40, 80),
+    'buried_device': (45, 85),
+    'multi_sensor': (60, 90)
+}
+THRESHOLD_KEYS = tuple(THRESHOLD_RANGES)
+
+# Rows x candidates evaluated per kernel call (bounds temporary memory)
+_CELLS_PER_CALL = 2_000_000
+
+
+# ==================== DATA ====================
+def load_labelled_log(path: str) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Load sensor readings and threat-band labels from a threat log
+
+    Args:
+        path: CSV with LOG_SENSOR_COLUMNS and a Threat_Level column
+
+    Returns:
+        Tuple of ((N, 7) sensor matrix in SENSOR_ORDER, band index per row)
+    """
+    df = pd.read_csv(path, usecols=list(LOG_SENSOR_COLUMNS) + ['Threat_Level'])
+    labels = df['Threat_Level'].map(BAND_INDEX)
+    if labels.isna().any():
+        unknown = sorted(df.loc[labels.isna(), 'Threat_Level'].astype(str).unique())
+        raise ValueError(f"Unknown threat levels in {path}: {unknown}")
+
+    X = df[list(LOG_SENSOR_COLUMNS)].to_numpy(dtype=np.float64)
+    return X, labels.to_numpy(dtype=np.int64)
+
+
+def _row_features(X: np.ndarray) -> Dict[str, np.ndarray]:
+    """Per-row statistics that each correlation rule compares to its threshold"""
+    col = {sensor: X[:, i] for i, sensor in enumerate(SENSOR_ORDER)}
+    return {
+        'fume_metal': np.minimum(col['fume'], col['metal']),
+        'visual_agreement': np.abs(col['drone_cv'] - col['ground_cv']),
+        'thermal_fume': np.minimum(col['thermal'], col['fume']),
+        'buried_device': np.minimum(col['disturbance'], col['gpr']),
+        'multi_sensor': np.sort(X, axis=1)[:, -4]  # 4+ above t <=> 4th highest above t
+    }
+
+
+# ==================== KERNEL ====================
+def score_candidates(X: np.ndarray, weights: np.ndarray, thresholds: np.ndarray,
+                     features: Optional[Dict[str, np.ndarray]] = None) -> np.ndarray:
+    """
+    Threat probabilities for many candidates at once
+
+    Mirrors NetraAI.calculate_threat_probability (boosts 12/8/7/6/5, cap at
+    100, 2-decimal rounding) but sums weights with a matrix product, so
+    results may differ from the engine in the last bit.
+
+    Args:
+        X: (N, 7) sensor matrix in SENSOR_ORDER
+        weights: (K, 7) sensor weights per candidate
+        thresholds: (K, 5) correlation thresholds per candidate (THRESHOLD_KEYS order)
+        features: Precomputed _row_features(X)
+
+    Returns:
+        np.ndarray: (N, K) probabilities
+    """
+    if features is None:
+        features = _row_features(X)
+    t = np.asarray(thresholds, dtype=np.float64).T
+
+    score = X @ np.asarray(weights, dtype=np.float64).T
+    score += 12 * (features['fume_metal'][:, None] > t[0])
+    score += 8 * (features['visual_agreement'][:, None] < t[1])
+    score += 7 * (features['thermal_fume'][:, None] > t[2])
+    score += 6 * (features['buried_device'][:, None] > t[3])
+    score += 5 * (features['multi_sensor'][:, None] > t[4])
+
+    return np.round(np.minimum(score, 100), 2)
+
+
+def evaluate_candidates(X: np.ndarray, y: np.ndarray, weights: np.ndarray,
+                        thresholds: np.ndarray,
+                        features: Optional[Dict[str, np.ndarray]] = None) -> np.ndarray:
+    """
+    Band accuracy of each candidate against the labels
+
+    Returns:
+        np.ndarray: (K,) fraction of rows whose predicted band matches y
+    """
+    if features is None:
+        features = _row_features(X)
+
+    step = max(1, _CELLS_PER_CALL // max(1, len(X)))
+    accuracy = np.empty(len(weights))
+    for start in range(0, len(weights), step):
+        stop = start + step
+        bands = classify(score_candidates(X, weights[start:stop], thresholds[start:stop], features))
+        accuracy[start:stop] = (bands == y[:, None]).mean(axis=0)
+    return accuracy
+
+
+# ==================== WORKERS ====================
+# Per-process copy of the labelled data, set by _init_worker
+_DATA: Dict[str, object] = {}
+
+
+def _init_worker(X: np.ndarray, y: np.ndarray) -> None:
+    _DATA['X'] = X
+    _DATA['y'] = y
+    _DATA['features'] = _row_features(X)
+
+
+def _evaluate_chunk(weights: np.ndarray, thresholds: np.ndarray) -> np.ndarray:
+    return evaluate_candidates(_DATA['X'], _DATA['y'], weights, thresholds, _DATA['features'])
+
+
+class _Evaluator:
+    """Evaluate candidate arrays in chunks, on a pool or in-process"""
+
+    def __init__(self, X: np.ndarray, y: np.ndarray, workers: int, chunk_size: int):
+        self.chunk_size = chunk_size
+        self.evaluated = 0
+        self.pool = None
+        if workers > 1:
+            self.pool = ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                            initargs=(X, y))
+        else:
+            _init_worker(X, y)
+
+    def __call__(self, weights: np.ndarray, thresholds: np.ndarray) -> np.ndarray:
+        self.evaluated += len(weights)
+        if self.pool is None:
+            return _evaluate_chunk(weights, thresholds)
+
+        starts = range(0, len(weights), self.chunk_size)
+        chunks = self.pool.map(
+            _evaluate_chunk,
+            [weights[i:i + self.chunk_size] for i in starts],
+            [thresholds[i:i + self.chunk_size] for i in starts]
+        )
+        return np.concatenate(list(chunks))
+
+    def close(self) -> None:
+        if self.pool is not None:
+            self.pool.shutdown()
+
+
+# ==================== SEARCH SPACES ====================
+def grid_candidates(weight_steps: int = 4, threshold_steps: int = 3,
+                    batch: int = 50_000) -> Iterator[Tuple[np.ndarray, np.ndarray]]:
+    """
+    Simplex lattice of weights (multiples of 1/weight_steps) crossed with
+    evenly spaced thresholds, yielded in batches
+
+    Yields:
+        (weights (B, 7), thresholds (B, 5)) arrays
+    """
+    n = len(SENSOR_ORDER)
+    # Stars and bars: every way to split weight_steps units over n sensors
+    lattice = []
+    for bars in itertools.combinations(range(weight_steps + n - 1), n - 1):
+        edges = (-1,) + bars + (weight_steps + n - 1,)
+        lattice.append([edges[i + 1] - edges[i] - 1 for i in range(n)])
+    lattice = np.array(lattice, dtype=np.float64) / weight_steps
+
+    axes = [np.linspace(low, high, threshold_steps) for low, high in THRESHOLD_RANGES.values()]
+    grid = np.array(list(itertools.product(*axes)), dtype=np.float64)
+
+    w_index, t_index = np.divmod(np.arange(len(lattice) * len(grid)), len(grid))
+    for start in range(0, len(w_index), batch):
+        yield lattice[w_index[start:start + batch]], grid[t_index[start:start + batch]]
+
+
+def random_candidates(count: int, seed: int = 0,
+                      batch: int = 50_000) -> Iterator[Tuple[np.ndarray, np.ndarray]]:
+    """
+    Dirichlet-distributed weights with uniform thresholds, yielded in batches
+
+    Yields:
+        (weights (B, 7), thresholds (B, 5)) arrays
+    """
+    rng = np.random.default_rng(seed)
+    low = np.array([r[0] for r in THRESHOLD_RANGES.values()], dtype=np.float64)
+    high = np.array([r[1] for r in THRESHOLD_RANGES.values()], dtype=np.float64)
+
+    for start in range(0, count, batch):
+        size = min(batch, count - start)
+        yield (rng.dirichlet(np.ones(len(SENSOR_ORDER)), size),
+               rng.uniform(low, high, (size, len(THRESHOLD_KEYS))))
+
+
+# ==================== CALIBRATION ====================
+def calibrate(path: str, method: str = 'random', candidates: int = 20_000,
+              workers: Optional[int] = None, seed: int = 0, weight_steps: int = 4,
+              threshold_steps: int = 3, chunk_size: int = 1024,
+              maxiter: int = 50) -> Dict:
+    """
+    Search for the weights and thresholds that best reproduce the labels
+
+    Args:
+        path: Labelled threat log CSV
+        method: 'grid', 'random' or 'scipy'
+        candidates: Number of random candidates (random method)
+        workers: Worker processes (None = all cores, 1 = in-process)
+        seed: Random seed (random and scipy methods)
+        weight_steps: Lattice resolution per weight (grid method)
+        threshold_steps: Values per threshold (grid method)
+        chunk_size: Candidates per pool task
+        maxiter: Generations (scipy method)
+
+    Returns:
+        Dictionary with the best sensor_weights, correlation_thresholds and
+        metrics (accuracy, baseline accuracy, candidates/second)
+    """
+    if method not in ('grid', 'random', 'scipy'):
+        raise ValueError(f"Unknown calibration method: {method}")
+
+    X, y = load_labelled_log(path)
+    workers = workers or os.cpu_count() or 1
+
+    engine = NetraAI(history_capacity=1)
+    default_weights = np.array([[engine.sensor_weights[s] for s in SENSOR_ORDER]])
+    default_thresholds = np.array([[engine.correlation_thresholds[k] for k in THRESHOLD_KEYS]])
+    baseline = float(evaluate_candidates(X, y, default_weights, default_thresholds)[0])
+
+    best_accuracy = baseline
+    best = (default_weights[0], default_thresholds[0])
+
+    evaluator = _Evaluator(X, y, workers, chunk_size)
+    start = time.perf_counter()
+    try:
+        if method == 'scipy':
+            from scipy.optimize import differential_evolution
+
+            bounds = [(1e-3, 1.0)] * len(SENSOR_ORDER) + list(THRESHOLD_RANGES.values())
+
+            def objective(population: np.ndarray) -> np.ndarray:
+                # Vectorized call: population has shape (parameters, S)
+                params = np.atleast_2d(population.T)
+                weights = params[:, :len(SENSOR_ORDER)]
+                weights = weights / weights.sum(axis=1, keepdims=True)
+                return -evaluator(weights, params[:, len(SENSOR_ORDER):])
+
+            result = differential_evolution(objective, bounds, maxiter=maxiter, seed=seed,
+                                            vectorized=True, updating='deferred',
+                                            polish=False)
+            weights = result.x[:len(SENSOR_ORDER)] / result.x[:len(SENSOR_ORDER)].sum()
+            if -result.fun > best_accuracy:
+                best_accuracy = float(-result.fun)
+                best = (weights, result.x[len(SENSOR_ORDER):])
+        else:
+            batches = (grid_candidates(weight_steps, threshold_steps) if method == 'grid'
+                       else random_candidates(candidates, seed))
+            for weights, thresholds in batches:
+                accuracy = evaluator(weights, thresholds)
+                i = int(np.argmax(accuracy))
+                if accuracy[i] > best_accuracy:
+                    best_accuracy = float(accuracy[i])
+                    best = (weights[i], thresholds[i])
+    finally:
+        evaluator.close()
+    elapsed = time.perf_counter() - start
+
+    weights, thresholds = best
+    weights = np.round(weights, 6)
+    weights[np.argmax(weights)] += 1.0 - weights.sum()  # Keep an exact sum of 1 after rounding
+
+    return {
+        'method': method,
+        'source': os.path.basename(path),
+        'sensor_weights': {s: float(w) for s, w in zip(SENSOR_ORDER, weights)},
+        'correlation_thresholds': {k: round(float(t), 3) for k, t in zip(THRESHOLD_KEYS, thresholds)},
+        'metrics': {
+            'accuracy': round(best_accuracy, 6),
+            'baseline_accuracy': round(baseline, 6),
+            'rows': int(len(y)),
+            'candidates': evaluator.evaluated,
+            'workers': workers,
+            'elapsed': round(elapsed, 3),
+            'candidates_per_second': round(evaluator.evaluated / elapsed, 1) if elapsed > 0 else 0.0
+        }
+    }
+
+
+def save_weight_file(result: Dict, path: str) -> int:
+    """
+    Write a calibration result as a versioned weight file
+
+    The version is one higher than that of the file being replaced.
+
+    Args:
+        result: Output of calibrate()
+        path: Destination JSON file
+
+    Returns:
+        int: Version number written
+    """
+    version = 1
+    if os.path.exists(path):
+        try:
+            version = int(load_weight_file(path)['version']) + 1
+        except (ValueError, KeyError, json.JSONDecodeError):
+            pass
+
+    document = {
+        'format': WEIGHT_FILE_FORMAT,
+        'version': version,
+        'created': datetime.utcnow().strftime('%Y-%m-%d %H:%M:%S'),
+        **result
+    }
+
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'w') as f:
+        json.dump(document, f, indent=2)
+    os.replace(tmp_path, path)
+    return version
+
+
+def main():
+    parser = argparse.ArgumentParser(description="N.E.T.R.A. sensor weight calibration")
+    parser.add_argument('log', help="Labelled threat log CSV")
+    parser.add_argument('-o', '--output', default='netra_weights.json', help="Weight file to write")
+    parser.add_argument('--method', choices=['grid', 'random', 'scipy'], default='random')
+    parser.add_argument('--candidates', type=int, default=20_000, help="Random candidates")
+    parser.add_argument('--weight-steps', type=int, default=4, help="Grid lattice resolution")
+    parser.add_argument('--threshold-steps', type=int, default=3, help="Grid values per threshold")
+    parser.add_argument('--maxiter', type=int, default=50, help="Differential evolution generations")
+    parser.add_argument('--workers', type=int, default=None, help="Worker processes (default: all cores)")
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    if not os.path.exists(args.log):
+        print(f"❌ Error: File not found: {args.log}")
+        return 1
+
+    print(f"🎯 Calibrating against {args.log} ({args.method} search)...")
+    result = calibrate(args.log, args.method, args.candidates, args.workers, args.seed,
+                       args.weight_steps, args.threshold_steps, maxiter=args.maxiter)
+    metrics = result['metrics']
+
+    print(f"   Evaluated {metrics['candidates']:,} candidates in {metrics['elapsed']:.2f}s "
+          f"({metrics['candidates_per_second']:,.0f} candidates/s, {metrics['workers']} workers)")
+    print(f"   Accuracy: {metrics['baseline_accuracy']:.1%} (current) -> {metrics['accuracy']:.1%} (best)")
+    print(f"\n⚖️ Sensor weights:")
+    for sensor, weight in result['sensor_weights'].items():
+        print(f"   {sensor}: {weight:.4f}")
+    print(f"\n🔗 Correlation thresholds:")
+    for key, value in result['correlation_thresholds'].items():
+        print(f"   {key}: {value:.1f}")
+
+    version = save_weight_file(result, args.output)
+    print(f"\n📁 Saved weight file v{version} to: {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -8,96 +8,468 @@ for use in production environments (Streamlit, API, etc.)
 
 import numpy as np
 import pandas as pd
-from datetime import datetime
+from datetime import datetime, timedelta
 from typing import Dict, Tuple, List, Optional
 import json
+import os
+import uuid
+import hashlib
+import atexit
+import threading
 
+from netra_bands import THREAT_BANDS, BAND_LABELS, classify, band_index
+from netra_locations import NE_LOCATIONS, get_location_registry
+from netra_trends import TrendAggregator
+from netra_evidence import EvidenceAccumulator
 
-# North-East India Strategic Locations Database
-NE_LOCATIONS = {
-    'Guwahati_Airport': {
-        'lat': 26.1061,
-        'lon': 91.5859,
-        'name': 'Guwahati Airport Road, Assam',
-        'state': 'Assam',
-        'type': 'Critical Infrastructure'
-    },
-    'Imphal_City': {
-        'lat': 24.8170,
-        'lon': 93.9368,
-        'name': 'Imphal City Center, Manipur',
-        'state': 'Manipur',
-        'type': 'Urban Center'
-    },
-    'Kohima_NH29': {
-        'lat': 25.6747,
-        'lon': 94.1078,
-        'name': 'Kohima NH-29, Nagaland',
-        'state': 'Nagaland',
-        'type': 'Highway'
-    },
-    'Shillong_Bypass': {
-        'lat': 25.5788,
-        'lon': 91.8933,
-        'name': 'Shillong Bypass Road, Meghalaya',
-        'state': 'Meghalaya',
-        'type': 'Highway'
-    },
-    'Agartala_Station': {
-        'lat': 23.8315,
-        'lon': 91.2868,
-        'name': 'Agartala Railway Station, Tripura',
-        'state': 'Tripura',
-        'type': 'Critical Infrastructure'
-    },
-    'Itanagar_Zero': {
-        'lat': 27.0844,
-        'lon': 93.6053,
-        'name': 'Itanagar Zero Point, Arunachal Pradesh',
-        'state': 'Arunachal Pradesh',
-        'type': 'Urban Center'
-    },
-    'Aizawl_NH54': {
-        'lat': 23.7271,
-        'lon': 92.7176,
-        'name': 'Aizawl NH-54, Mizoram',
-        'state': 'Mizoram',
-        'type': 'Highway'
-    },
-    'Dimapur_Junction': {
-        'lat': 25.9097,
-        'lon': 93.7267,
-        'name': 'Dimapur Junction, Nagaland',
-        'state': 'Nagaland',
-        'type': 'Critical Infrastructure'
-    },
-    'Silchar_Medical': {
-        'lat': 24.8333,
-        'lon': 92.7789,
-        'name': 'Silchar Medical College Road, Assam',
-        'state': 'Assam',
-        'type': 'Medical Facility'
-    },
-    'Tinsukia_Border': {
-        'lat': 27.4900,
-        'lon': 95.3600,
-        'name': 'Tinsukia Border Checkpoint, Assam',
-        'state': 'Assam',
-        'type': 'Border Area'
-    }
+
+# Fixed sensor column order for (N, 7) sensor matrices used by the batch API
+SENSOR_ORDER = ('fume', 'metal', 'gpr', 'ground_cv', 'drone_cv', 'disturbance', 'thermal')
+
+# Sensor column names used by netra_threat_log.csv, in SENSOR_ORDER
+LOG_SENSOR_COLUMNS = ('Fume_Detection', 'Metal_Detection', 'GPR_Reading', 'Ground_CV',
+                      'Drone_CV', 'Disturbance', 'Thermal')
+
+# Per-row sensor validation error codes (bit flags, OR-ed together per row)
+SENSOR_OK = 0
+SENSOR_MISSING = 1        # Sensor column absent
+SENSOR_NON_NUMERIC = 2    # Value could not be parsed as a number
+SENSOR_OUT_OF_RANGE = 4   # Value outside [0, 100]
+SENSOR_NAN = 8            # Value missing (NaN/empty)
+SENSOR_MALFORMED = 16     # Feed line has more fields than the header (not parseable)
+SENSOR_BAD_COORDINATES = 32  # Coordinate-only feed row without a valid Latitude/Longitude
+SENSOR_NO_NEARBY_SITE = 64   # Coordinate-only feed row too far from every known site
+SENSOR_NO_LOCATION = 128     # Location column blank or missing
+
+SENSOR_ERROR_NAMES = {
+    SENSOR_MISSING: 'missing_column',
+    SENSOR_NON_NUMERIC: 'non_numeric',
+    SENSOR_OUT_OF_RANGE: 'out_of_range',
+    SENSOR_NAN: 'nan',
+    SENSOR_MALFORMED: 'malformed_line',
+    SENSOR_BAD_COORDINATES: 'bad_coordinates',
+    SENSOR_NO_NEARBY_SITE: 'no_nearby_site',
+    SENSOR_NO_LOCATION: 'missing_location'
 }
 
 
+# Hex digits of the session ID carried in every scan ID
+SCAN_SESSION_LENGTH = 8
+
+# Bytes before an export watermark's offset that must be unchanged to append
+EXPORT_ANCHOR_BYTES = 64 << 10
+
+
+# Readable text for every combination of error flags
+_SENSOR_ERROR_TEXT = np.array([
+    ';'.join(name for flag, name in SENSOR_ERROR_NAMES.items() if code & flag)
+    for code in range(2 * max(SENSOR_ERROR_NAMES))
+], dtype=object)
+
+
+def describe_sensor_errors(codes: np.ndarray) -> np.ndarray:
+    """
+    Readable form of sensor error codes, e.g. 'non_numeric;out_of_range'
+
+    Args:
+        codes: Error codes from NetraAI.validate_sensor_batch
+
+    Returns:
+        np.ndarray: One string per row ('' for valid rows)
+    """
+    return _SENSOR_ERROR_TEXT[np.asarray(codes, dtype=np.uint8)]
+
+
+def _round_scores(values: np.ndarray) -> np.ndarray:
+    """
+    Round an array to 2 decimals exactly like Python's built-in round()
+
+    np.round scales by 100 before rounding, which can land on the wrong side
+    of a .5 tie; those few rows are re-rounded with round() so the batch
+    path matches the scalar path bit-for-bit.
+    """
+    scaled = values * 100
+    rounded = np.round(scaled) / 100
+    ambiguous = np.abs(scaled - np.floor(scaled) - 0.5) < 1e-6
+    if ambiguous.any():
+        rounded[ambiguous] = [round(float(v), 2) for v in values[ambiguous]]
+    return rounded
+
+
+def _threat_labels(probability: np.ndarray) -> np.ndarray:
+    """Vectorized get_threat_level labels for an array of probabilities"""
+    return BAND_LABELS[classify(probability)]
+
+
+# get_threat_level results, one interned tuple per band
+_LEVEL_TUPLES = tuple((band.label, band.color, band.description) for band in THREAT_BANDS)
+
+
+# Identifies JSON weight files written by netra_calibration.py
+WEIGHT_FILE_FORMAT = 'netra-weights'
+
+
+def load_weight_file(path: str) -> Dict:
+    """
+    Read and check a versioned weight file
+    
+    Args:
+        path: JSON weight file
+        
+    Returns:
+        Dictionary with version, sensor_weights, correlation_thresholds and metrics
+    """
+    with open(path) as f:
+        weights = json.load(f)
+    
+    if weights.get('format') != WEIGHT_FILE_FORMAT:
+        raise ValueError(f"Not a NETRA weight file: {path}")
+    
+    sensors = set(weights.get('sensor_weights', {}))
+    if sensors != set(SENSOR_ORDER):
+        raise ValueError(f"Weight file must define exactly {set(SENSOR_ORDER)}, got {sensors}")
+    
+    total = sum(weights['sensor_weights'].values())
+    if not np.isclose(total, 1.0, atol=1e-6):
+        raise ValueError(f"Sensor weights must sum to 1.0, got {total}")
+    
+    weights.setdefault('correlation_thresholds', {})
+    return weights
+
+
+class RunningStats:
+    """
+    Running mean and variance (Welford's algorithm)
+    
+    Each update is O(1) and numerically stable, so summaries never need to
+    revisit past values.
+    """
+
+    __slots__ = ('count', 'mean', '_m2')
+
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self._m2 = 0.0
+
+    def update(self, value: float) -> None:
+        """Add one observation"""
+        value = float(value)
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self._m2 += delta * (value - self.mean)
+
+    def update_batch(self, values: np.ndarray) -> None:
+        """Add an array of observations (Chan et al. parallel merge)"""
+        values = np.asarray(values, dtype=np.float64)
+        n = len(values)
+        if n == 0:
+            return
+        batch_mean = float(values.mean())
+        batch_m2 = float(((values - batch_mean) ** 2).sum())
+        
+        total = self.count + n
+        delta = batch_mean - self.mean
+        self.mean += delta * n / total
+        self._m2 += batch_m2 + delta * delta * self.count * n / total
+        self.count = total
+
+    @property
+    def variance(self) -> float:
+        """Population variance of all observations"""
+        return self._m2 / self.count if self.count else 0.0
+
+    @property
+    def std(self) -> float:
+        """Population standard deviation of all observations"""
+        return float(np.sqrt(self.variance))
+
+
+def _read_watermark(path: str) -> Optional[Dict]:
+    """Load an export watermark, or None if missing or unreadable"""
+    try:
+        with open(path, 'r') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _write_watermark(path: str, watermark: Dict) -> None:
+    """Atomically replace an export watermark"""
+    tmp = f"{path}.tmp"
+    with open(tmp, 'w') as f:
+        json.dump(watermark, f)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+
+
+def scan_ids(timestamp: pd.Series, session, seq) -> pd.Series:
+    """
+    Scan IDs NETRA-<second>-<session>-<seq:04d>, vectorized
+
+    Sequence numbers restart with every NetraAI instance, so the session
+    keeps IDs from concurrent instances apart; the sequence number stays
+    last so it can be recovered with rsplit('-', 1). An empty session (scans
+    converted from files that never carried one) is left out.
+
+    Args:
+        timestamp: Scan times
+        session: Session tag, one string or one per scan
+        seq: Sequence numbers
+    """
+    session = pd.Series(np.broadcast_to(np.asarray(session, dtype=object), len(timestamp)))
+    session = session.where(session == '', '-' + session)
+    return ('NETRA-' + timestamp.dt.strftime('%Y%m%d%H%M%S') + session.to_numpy() + '-'
+            + pd.Series(seq).astype(str).str.zfill(4).to_numpy())
+
+
+def _export_fingerprint(path: str, offset: int) -> Dict[str, str]:
+    """Hashes of an export's header line and of the EXPORT_ANCHOR_BYTES before offset"""
+    with open(path, 'rb') as f:
+        header = f.readline()
+        f.seek(max(offset - EXPORT_ANCHOR_BYTES, 0))
+        anchor = f.read(offset - max(offset - EXPORT_ANCHOR_BYTES, 0))
+    return {
+        'header_sha256': hashlib.sha256(header).hexdigest(),
+        'anchor_sha256': hashlib.sha256(anchor).hexdigest()
+    }
+
+
+def _recover_tail(path: str, offset: int) -> Dict[str, int]:
+    """
+    Reconcile an export file that grew past its watermark offset
+    
+    Rows appended by an export that crashed before its watermark was
+    written are kept; a trailing partial row is truncated.
+    
+    Returns:
+        Highest scan sequence number in the tail per scan ID session
+    """
+    with open(path, 'rb+') as f:
+        f.seek(offset)
+        tail = f.read()
+        complete = tail.rfind(b'\n') + 1
+        if complete < len(tail):
+            f.truncate(offset + complete)
+    
+    recovered = {}
+    for line in tail[:complete].splitlines():
+        if line.strip():
+            parts = line.split(b',', 1)[0].decode().split('-')
+            session = parts[2] if len(parts) == 4 else ''
+            recovered[session] = max(recovered.get(session, -1), int(parts[-1]))
+    return recovered
+
+
+class ThreatHistory:
+    """
+    Preallocated columnar ring buffer for scan records
+    
+    Each column is a fixed-dtype array of length `capacity`; once full, the
+    oldest scan is overwritten. Location names are stored once in a string
+    table and referenced by integer code.
+    """
+
+    def __init__(self, capacity: int = 100_000, session: str = ''):
+        """
+        Args:
+            capacity: Maximum number of scans retained
+            session: Session tag carried in the scan IDs (see scan_ids)
+        """
+        if capacity <= 0:
+            raise ValueError(f"History capacity must be positive, got {capacity}")
+        
+        self.capacity = capacity
+        self.session = session
+        self.seq = np.zeros(capacity, dtype=np.int64)
+        self.timestamp = np.zeros(capacity, dtype='datetime64[us]')
+        self.location = np.zeros(capacity, dtype=np.int32)
+        self.probability = np.zeros(capacity, dtype=np.float64)
+        self.confidence = np.zeros(capacity, dtype=np.float64)
+        self.sensors = np.zeros((capacity, len(SENSOR_ORDER)), dtype=np.float64)
+        self.health = np.zeros(capacity, dtype=np.int32)
+        
+        # Location string table
+        self.locations: List[str] = []
+        self._location_codes: Dict[str, int] = {}
+        
+        # Sensor health note table (code 0: no unhealthy channel)
+        self.health_notes: List[str] = ['']
+        self._health_codes: Dict[str, int] = {'': 0}
+        
+        self._head = 0  # Next slot to write
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def location_code(self, name: str) -> int:
+        """Get (or assign) the string-table code for a location name"""
+        code = self._location_codes.get(name)
+        if code is None:
+            code = len(self.locations)
+            self.locations.append(name)
+            self._location_codes[name] = code
+        return code
+
+    def health_code(self, note: str) -> int:
+        """Get (or assign) the string-table code for a sensor health note"""
+        code = self._health_codes.get(note)
+        if code is None:
+            code = len(self.health_notes)
+            self.health_notes.append(note)
+            self._health_codes[note] = code
+        return code
+
+    def append(self, seq: int, timestamp: datetime, location: str,
+               probability: float, confidence: float, sensors: Dict[str, float]) -> None:
+        """Write one scan into the next slot, evicting the oldest when full"""
+        i = self._head
+        self.seq[i] = seq
+        self.timestamp[i] = np.datetime64(timestamp, 'us')
+        self.location[i] = self.location_code(location)
+        self.probability[i] = probability
+        self.confidence[i] = confidence
+        self.sensors[i] = [sensors[sensor] for sensor in SENSOR_ORDER]
+        self.health[i] = 0
+        
+        self._head = (i + 1) % self.capacity
+        self._size = min(self._size + 1, self.capacity)
+
+    def append_batch(self, seq: np.ndarray, timestamp: datetime, locations,
+                     probability: np.ndarray, confidence: np.ndarray,
+                     sensors: np.ndarray, health=None) -> None:
+        """
+        Write a batch of scans that share one timestamp
+        
+        Args:
+            seq: Sequence numbers, one per scan
+            timestamp: Scan time for the whole batch
+            locations: Location names, one per scan
+            probability: Threat probabilities
+            confidence: Confidence scores
+            sensors: (N, 7) sensor matrix in SENSOR_ORDER
+            health: Sensor health note per scan ('' or None = healthy)
+        """
+        n = len(seq)
+        if n == 0:
+            return
+        
+        names, inverse = np.unique(np.asarray(locations, dtype=object).astype(str),
+                                   return_inverse=True)
+        codes = np.array([self.location_code(name) for name in names], dtype=np.int32)[inverse]
+        if health is None:
+            health_codes = np.zeros(n, dtype=np.int32)
+        else:
+            notes, inverse = np.unique(np.asarray(health, dtype=object).astype(str),
+                                       return_inverse=True)
+            health_codes = np.array([self.health_code(note) for note in notes], dtype=np.int32)[inverse]
+        
+        # Only the newest `capacity` scans of an oversized batch survive
+        keep = slice(max(0, n - self.capacity), n)
+        slots = (self._head + np.arange(max(0, n - self.capacity), n)) % self.capacity
+        
+        self.seq[slots] = seq[keep]
+        self.timestamp[slots] = np.datetime64(timestamp, 'us')
+        self.location[slots] = codes[keep]
+        self.probability[slots] = probability[keep]
+        self.confidence[slots] = confidence[keep]
+        self.sensors[slots] = sensors[keep]
+        self.health[slots] = health_codes[keep]
+        
+        self._head = (self._head + n) % self.capacity
+        self._size = min(self._size + n, self.capacity)
+
+    @property
+    def last_seq(self) -> int:
+        """Sequence number of the newest scan (-1 when empty)"""
+        if not self._size:
+            return -1
+        return int(self.seq[(self._head - 1) % self.capacity])
+
+    def count_after(self, seq: int) -> int:
+        """Number of retained scans with a sequence number above seq"""
+        return max(0, min(self._size, self.last_seq - seq))
+
+    def slots(self, limit: Optional[int] = None) -> np.ndarray:
+        """
+        Buffer slots of the most recent scans, oldest first
+        
+        Args:
+            limit: Maximum number of scans (None = all retained scans)
+        """
+        count = self._size if limit is None else min(limit, self._size)
+        return (self._head - count + np.arange(count)) % self.capacity
+
+    def count_since(self, cutoff: datetime) -> int:
+        """
+        Number of retained scans with timestamp >= cutoff
+        
+        The buffer holds at most two time-ordered runs (before and after the
+        write head), so this is two binary searches.
+        
+        Args:
+            cutoff: Earliest timestamp to include
+        """
+        cutoff = np.datetime64(cutoff, 'us')
+        if self._size < self.capacity:
+            runs = [self.timestamp[:self._size]]
+        else:
+            runs = [self.timestamp[self._head:], self.timestamp[:self._head]]
+        return sum(len(run) - int(np.searchsorted(run, cutoff)) for run in runs)
+
+    def to_frame(self, limit: Optional[int] = None) -> pd.DataFrame:
+        """
+        Columnar view of the most recent scans, oldest first
+        
+        Args:
+            limit: Maximum number of scans (None = all retained scans)
+            
+        Returns:
+            DataFrame in the export_history_to_csv column layout
+        """
+        slots = self.slots(limit)
+        timestamp = pd.Series(self.timestamp[slots])
+        probability = self.probability[slots]
+        
+        frame = pd.DataFrame({
+            'scan_id': scan_ids(timestamp, self.session, self.seq[slots]),
+            'timestamp': timestamp,
+            'location': np.asarray(self.locations, dtype=object)[self.location[slots]],
+            'probability': probability,
+            'threat_level': _threat_labels(probability),
+            'confidence': self.confidence[slots]
+        })
+        for i, sensor in enumerate(SENSOR_ORDER):
+            frame[sensor] = self.sensors[slots, i]
+        frame['health'] = np.asarray(self.health_notes, dtype=object)[self.health[slots]]
+        
+        return frame
+
+
 class NetraAI:
     """
     Advanced AI Engine for IED Threat Detection using Bayesian Fusion
     
     This class implements a multi-sensor fusion algorithm that combines
     data from rover and drone platforms to assess explosive threat probability.
+    
+    One instance can be shared by many threads (e.g. Streamlit sessions).
+    Scoring runs without locks; logging holds a short lock only to assign
+    sequence numbers and write the history slots and counters, so scan IDs
+    are unique and history stays in sequence and timestamp order.
     """
 
-    def __init__(self):
-        """Initialize the NETRA AI Engine with optimized sensor weights"""
+    def __init__(self, history_capacity: int = 100_000, weights_file: Optional[str] = None):
+        """
+        Initialize the NETRA AI Engine with optimized sensor weights
+        
+        Args:
+            history_capacity: Number of scans kept in the threat history
+            weights_file: Optional calibrated weight file (see load_weights)
+        """
         
         # Sensor weights optimized for IED detection (sum = 1.0)
         self.sensor_weights = {
@@ -110,8 +482,78 @@ class NetraAI:
             'thermal': 0.10     # Thermal signature detection
         }
         
-        self.threat_history = []
+        # Correlation boost thresholds (sensor readings in %)
+        self.correlation_thresholds = {
+            'fume_metal': 70,        # Fume AND metal above -> +12
+            'visual_agreement': 15,  # |drone_cv - ground_cv| below -> +8
+            'thermal_fume': 60,      # Thermal AND fume above -> +7
+            'buried_device': 65,     # Disturbance AND GPR above -> +6
+            'multi_sensor': 75       # 4+ sensors above -> +5
+        }
+        self.weights_version = None
+        
+        self.session_id = uuid.uuid4().hex  # Distinguishes this instance's scan numbering
+        self.threat_history = ThreatHistory(history_capacity, self.session_id[:SCAN_SESSION_LENGTH])
+        self.binlog = None
         self.analysis_count = 0
+        self._lock = threading.Lock()         # Guards history, counters and binlog appends
+        self._export_lock = threading.Lock()  # Serializes exports and their watermarks
+        
+        # Running summaries over every logged scan (see get_statistics)
+        self.band_counts = [0] * len(THREAT_BANDS)
+        self.probability_stats = RunningStats()
+        self.confidence_stats = RunningStats()
+        self.trends = TrendAggregator()
+        self.evidence = EvidenceAccumulator()  # Per-location posterior across re-scans
+        
+        if weights_file:
+            self.load_weights(weights_file)
+
+    def load_weights(self, path: str) -> None:
+        """
+        Load sensor weights and correlation thresholds from a weight file
+        
+        Args:
+            path: JSON weight file written by netra_calibration.py
+        """
+        weights = load_weight_file(path)
+        self.sensor_weights = {
+            sensor: float(weights['sensor_weights'][sensor]) for sensor in SENSOR_ORDER
+        }
+        self.correlation_thresholds.update(
+            (key, float(value)) for key, value in weights['correlation_thresholds'].items()
+        )
+        self.weights_version = weights['version']
+
+    def attach_binlog(self, path: str) -> None:
+        """
+        Also append every logged scan to a binary scan log
+        
+        Unlike threat_history, the binary log is unbounded and survives
+        restarts; read it with netra_binlog.read_binlog or binlog_frame.
+        Batches are flushed as they are logged and single scans at least
+        every second; close_binlog (also run at interpreter exit) flushes
+        the rest.
+        
+        Args:
+            path: Binary log file (created if missing, appended to otherwise)
+        """
+        from netra_binlog import BinaryLogWriter
+        
+        writer = BinaryLogWriter(path)
+        with self._lock:
+            if self.binlog:
+                self.binlog.close()
+            else:
+                atexit.register(self.close_binlog)
+            self.binlog = writer
+
+    def close_binlog(self) -> None:
+        """Flush and close the attached binary scan log, if any"""
+        with self._lock:
+            if self.binlog:
+                self.binlog.close()
+                self.binlog = None
 
     def validate_sensors(self, sensors: Dict[str, float]) -> bool:
         """
@@ -174,25 +616,26 @@ class NetraAI:
         
         # Bayesian correlation analysis - detect sensor correlations
         correlation_boost = 0
+        t = self.correlation_thresholds
         
         # Strong correlation: Chemical + Metal detection (IED signature)
-        if sensors['fume'] > 70 and sensors['metal'] > 70:
+        if sensors['fume'] > t['fume_metal'] and sensors['metal'] > t['fume_metal']:
             correlation_boost += 12
         
         # Visual confirmation from both ground and aerial angles
-        if abs(sensors['drone_cv'] - sensors['ground_cv']) < 15:
+        if abs(sensors['drone_cv'] - sensors['ground_cv']) < t['visual_agreement']:
             correlation_boost += 8
         
         # Thermal + Chemical signature (explosive heat signature)
-        if sensors['thermal'] > 60 and sensors['fume'] > 60:
+        if sensors['thermal'] > t['thermal_fume'] and sensors['fume'] > t['thermal_fume']:
             correlation_boost += 7
         
         # Ground disturbance + GPR detection (buried device)
-        if sensors['disturbance'] > 65 and sensors['gpr'] > 65:
+        if sensors['disturbance'] > t['buried_device'] and sensors['gpr'] > t['buried_device']:
             correlation_boost += 6
         
         # Multi-sensor high alert
-        high_sensors = sum(1 for v in sensors.values() if v > 75)
+        high_sensors = sum(1 for v in sensors.values() if v > t['multi_sensor'])
         if high_sensors >= 4:
             correlation_boost += 5
         
@@ -201,6 +644,210 @@ class NetraAI:
         
         return round(final_probability, 2)
 
+    def _sensor_matrix(self, sensors) -> np.ndarray:
+        """
+        Convert a batch of sensor readings to a validated (N, 7) float matrix
+        
+        Args:
+            sensors: NumPy array of shape (N, 7) in SENSOR_ORDER, or a
+                DataFrame with one column per sensor
+            
+        Returns:
+            np.ndarray: Float64 matrix with columns in SENSOR_ORDER
+        """
+        if isinstance(sensors, pd.DataFrame):
+            missing = set(SENSOR_ORDER) - set(sensors.columns)
+            if missing:
+                raise ValueError(f"Missing sensors: {missing}")
+            sensors = sensors[list(SENSOR_ORDER)]
+        
+        try:
+            matrix = np.asarray(sensors, dtype=np.float64)
+        except (TypeError, ValueError):
+            raise TypeError("Sensor matrix must be numeric")
+        
+        if matrix.ndim != 2 or matrix.shape[1] != len(SENSOR_ORDER):
+            raise ValueError(
+                f"Sensor matrix must have shape (N, {len(SENSOR_ORDER)}), got {matrix.shape}"
+            )
+        
+        # NaN fails both comparisons, so it is rejected here as well
+        in_range = (matrix >= 0) & (matrix <= 100)
+        if not in_range.all():
+            row, col = np.argwhere(~in_range)[0]
+            raise ValueError(
+                f"Sensor {SENSOR_ORDER[col]} out of range [0-100] in row {row}: {matrix[row, col]}"
+            )
+        
+        return matrix
+
+    def validate_sensor_batch(self, sensors) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Validate a batch of sensor readings without raising
+        
+        Every row is checked for missing columns, non-numeric values, NaN
+        and values outside [0, 100] in one vectorized pass, so a single
+        malformed reading does not reject the whole batch.
+        
+        Args:
+            sensors: (N, 7) array in SENSOR_ORDER or DataFrame of sensor columns
+                (may contain strings, None or NaN)
+            
+        Returns:
+            Tuple of (float matrix in SENSOR_ORDER with NaN for unusable
+            cells, uint8 error codes per row; 0 = valid)
+        """
+        if not isinstance(sensors, pd.DataFrame):
+            raw = np.asarray(sensors)
+            if raw.ndim != 2 or raw.shape[1] != len(SENSOR_ORDER):
+                raise ValueError(
+                    f"Sensor matrix must have shape (N, {len(SENSOR_ORDER)}), got {raw.shape}"
+                )
+            sensors = pd.DataFrame(raw, columns=list(SENSOR_ORDER))
+        
+        n = len(sensors)
+        matrix = np.full((n, len(SENSOR_ORDER)), np.nan)
+        codes = np.zeros(n, dtype=np.uint8)
+        
+        for i, sensor in enumerate(SENSOR_ORDER):
+            if sensor not in sensors.columns:
+                codes |= SENSOR_MISSING
+                continue
+            
+            column = sensors[sensor]
+            if pd.api.types.is_numeric_dtype(column) and not pd.api.types.is_bool_dtype(column):
+                values = column.to_numpy(dtype=np.float64, na_value=np.nan)
+                missing = np.isnan(values)
+                non_numeric = np.zeros(n, dtype=bool)
+            else:
+                missing = column.isna().to_numpy()
+                values = pd.to_numeric(column, errors='coerce').to_numpy(dtype=np.float64, na_value=np.nan)
+                non_numeric = np.isnan(values) & ~missing
+            
+            # NaN compares False, so only real numbers can be out of range
+            out_of_range = (values < 0) | (values > 100)
+            codes |= (SENSOR_NAN * missing).astype(np.uint8)
+            codes |= (SENSOR_NON_NUMERIC * non_numeric).astype(np.uint8)
+            codes |= (SENSOR_OUT_OF_RANGE * out_of_range).astype(np.uint8)
+            
+            matrix[:, i] = np.where(out_of_range, np.nan, values)
+        
+        return matrix, codes
+
+    def calculate_threat_probability_batch(self, sensors) -> np.ndarray:
+        """
+        Vectorized threat probability for a batch of sensor readings
+        
+        Applies the same weighted score, correlation boosts and 100% cap as
+        calculate_threat_probability, in the same floating-point order, so
+        each row matches the scalar result bit-for-bit.
+        
+        Args:
+            sensors: (N, 7) array in SENSOR_ORDER or DataFrame of sensor columns
+            
+        Returns:
+            np.ndarray: Threat probabilities (0-100%), one per row
+        """
+        matrix = self._sensor_matrix(sensors)
+        return self._fuse(matrix)
+
+    def _fuse(self, matrix: np.ndarray, ignore: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Score a validated sensor matrix (see calculate_threat_probability_batch)
+        
+        Channels marked in `ignore` count as not read: they are left out of
+        the weighted score (the remaining weights are scaled back up to the
+        full weight) and cannot trigger a correlation boost.
+        """
+        masked = ignore is not None and ignore.any()
+        if masked:
+            matrix = np.where(ignore, 0.0, matrix)
+        col = {sensor: matrix[:, i] for i, sensor in enumerate(SENSOR_ORDER)}
+        
+        # Accumulate column by column to keep the scalar summation order
+        weighted_score = np.zeros(len(matrix))
+        for sensor, weight in self.sensor_weights.items():
+            weighted_score = weighted_score + col[sensor] * weight
+        
+        visual_read = True
+        if masked:
+            weights = np.array([self.sensor_weights[sensor] for sensor in SENSOR_ORDER])
+            read_weight = (~ignore) @ weights
+            rows = ignore.any(axis=1)
+            weighted_score[rows] *= np.divide(weights.sum(), read_weight[rows],
+                                              out=np.zeros(int(rows.sum())), where=read_weight[rows] > 0)
+            visual_read = ~(ignore[:, SENSOR_ORDER.index('drone_cv')] | ignore[:, SENSOR_ORDER.index('ground_cv')])
+        
+        # Correlation boosts as boolean masks (ignored channels read 0, below every threshold)
+        t = self.correlation_thresholds
+        fume_metal = (col['fume'] > t['fume_metal']) & (col['metal'] > t['fume_metal'])
+        visual = (np.abs(col['drone_cv'] - col['ground_cv']) < t['visual_agreement']) & visual_read
+        thermal_fume = (col['thermal'] > t['thermal_fume']) & (col['fume'] > t['thermal_fume'])
+        buried = (col['disturbance'] > t['buried_device']) & (col['gpr'] > t['buried_device'])
+        multi_sensor = (matrix > t['multi_sensor']).sum(axis=1) >= 4
+        
+        correlation_boost = (
+            12 * fume_metal + 8 * visual + 7 * thermal_fume
+            + 6 * buried + 5 * multi_sensor
+        )
+        
+        final_probability = np.minimum(100, weighted_score + correlation_boost)
+        
+        return _round_scores(final_probability)
+
+    def get_confidence_score_batch(self, sensors) -> np.ndarray:
+        """
+        Vectorized confidence score for a batch of sensor readings
+        
+        Args:
+            sensors: (N, 7) array in SENSOR_ORDER or DataFrame of sensor columns
+            
+        Returns:
+            np.ndarray: Confidence scores (0-100%), one per row
+        """
+        matrix = self._sensor_matrix(sensors)
+        return self._confidence(matrix)
+
+    def _confidence(self, matrix: np.ndarray, ignore: Optional[np.ndarray] = None) -> np.ndarray:
+        """Confidence for a validated sensor matrix (see get_confidence_score_batch)"""
+        variance = np.var(matrix, axis=1)
+        if ignore is not None and ignore.any():
+            # Spread of the channels that were read (rows with none read keep the full spread)
+            rows = ignore.any(axis=1) & ~ignore.all(axis=1)
+            variance[rows] = np.nanvar(np.where(ignore[rows], np.nan, matrix[rows]), axis=1)
+        confidence = np.clip(100 - (variance / 10), 0, 100)
+        return np.round(confidence, 2)
+
+    def score_batch(self, sensors, ignore: Optional[np.ndarray] = None) -> pd.DataFrame:
+        """
+        Score a batch of sensor readings in one vectorized pass
+        
+        Nothing is logged; use analyze_location for single logged scans.
+        
+        Args:
+            sensors: (N, 7) array in SENSOR_ORDER or DataFrame of sensor columns
+            ignore: (N, 7) boolean mask of channels to score as not read,
+                e.g. stuck or drifting sensors (see netra_health)
+            
+        Returns:
+            DataFrame with probability, confidence and threat_level columns
+        """
+        matrix = self._sensor_matrix(sensors)
+        if ignore is not None:
+            ignore = np.asarray(ignore, dtype=bool)
+            if ignore.shape != matrix.shape:
+                raise ValueError(f"Ignore mask must have shape {matrix.shape}, got {ignore.shape}")
+        probability = self._fuse(matrix, ignore)
+        
+        threat_level = _threat_labels(probability)
+        
+        index = sensors.index if isinstance(sensors, pd.DataFrame) else None
+        return pd.DataFrame({
+            'probability': probability,
+            'confidence': self._confidence(matrix, ignore),
+            'threat_level': threat_level
+        }, index=index)
+
     def get_threat_level(self, probability: float) -> Tuple[str, str, str]:
         """
         Classify threat level based on probability
@@ -211,16 +858,31 @@ class NetraAI:
         Returns:
             Tuple of (level_label, color_code, description)
         """
-        if probability >= 75:
-            return "🔴 CRITICAL", "#dc2626", "Immediate Action Required"
-        elif probability >= 50:
-            return "🟡 HIGH", "#f59e0b", "Enhanced Monitoring"
-        elif probability >= 25:
-            return "🟢 MODERATE", "#10b981", "Routine Monitoring"
-        else:
-            return "⚪ LOW", "#3b82f6", "Area Cleared"
+        return _LEVEL_TUPLES[band_index(probability)]
+
+    def get_explosive_info(self, name: str) -> Optional[Dict]:
+        """
+        Profile of one explosive from the shared explosive table
+        
+        The table is loaded on first use (from its cached sidecar when
+        current, see netra_explosives.get_explosive_table).
+        
+        Args:
+            name: Explosive name, e.g. 'TNT'
+            
+        Returns:
+            Dictionary with fume_color, danger, velocity, density, brisance
+            and type, or None for an unknown explosive
+        """
+        from netra_explosives import explosive_dict, get_explosive_table
+        
+        table = get_explosive_table()
+        name = str(name).strip()
+        if name not in table.index:
+            return None
+        return explosive_dict(table.loc[[name]])[name]
 
-    def get_recommendations(self, probability: float) -> List[str]:
+    def get_recommendations(self, probability: float) -> Tuple[str, ...]:
         """
         Generate actionable recommendations based on threat level
         
@@ -228,43 +890,9 @@ class NetraAI:
             probability: Threat probability (0-100%)
             
         Returns:
-            List of recommended actions
-        """
-        if probability >= 75:
-            return [
-                "⚠️ EVACUATE 200m radius IMMEDIATELY",
-                "🚫 BLOCK all vehicle and pedestrian traffic",
-                "⚡ DEPLOY bomb disposal unit",
-                "📡 ALERT military and civilian authorities",
-                "🚁 MAINTAIN continuous aerial surveillance",
-                "📸 CAPTURE high-resolution evidence",
-                "🔒 SECURE perimeter with armed forces"
-            ]
-        elif probability >= 50:
-            return [
-                "🔍 CONDUCT detailed ground investigation",
-                "🚧 PLACE warning markers and caution tape",
-                "🚁 INCREASE drone surveillance frequency",
-                "📸 DOCUMENT area with multiple angles",
-                "⏱️ REASSESS threat level every 15 minutes",
-                "📞 NOTIFY local security personnel",
-                "🗺️ PREPARE evacuation routes"
-            ]
-        elif probability >= 25:
-            return [
-                "👀 MONITOR area with routine patrols",
-                "📊 LOG sensor data for pattern analysis",
-                "🔄 SCHEDULE follow-up scans in 2 hours",
-                "📝 UPDATE threat database",
-                "✅ MAINTAIN low-risk status"
-            ]
-        else:
-            return [
-                "✅ AREA CLEARED - No immediate threat",
-                "📝 UPDATE digital twin database",
-                "🚦 SAFE for normal traffic operations",
-                "📊 ARCHIVE scan data for future reference"
-            ]
+            Tuple of recommended actions (shared, immutable)
+        """
+        return THREAT_BANDS[band_index(probability)].recommendations
 
     def get_confidence_score(self, sensors: Dict[str, float]) -> float:
         """
@@ -298,22 +926,110 @@ class NetraAI:
         Returns:
             str: Unique scan ID
         """
-        scan_id = f"NETRA-{datetime.utcnow().strftime('%Y%m%d%H%M%S')}-{self.analysis_count:04d}"
+        return self._log_scan(location, probability, sensors)[0]
+
+    def _log_scan(self, location: str, probability: float,
+                  sensors: Dict[str, float]) -> Tuple[str, float, int]:
+        """
+        Log one scan (see log_threat)
         
-        self.threat_history.append({
-            'scan_id': scan_id,
-            'timestamp': datetime.utcnow(),
-            'location': location,
-            'probability': probability,
-            'sensors': sensors.copy(),
-            'threat_level': self.get_threat_level(probability)[0],
-            'confidence': self.get_confidence_score(sensors)
-        })
+        Returns:
+            Tuple of (scan ID, location posterior after the scan, scans of the
+            location so far), the last two read under the same lock as the write
+        """
+        confidence = self.get_confidence_score(sensors)
+        band = band_index(probability)
+        state = get_location_registry().attribute(location, 'state', '')
+        
+        with self._lock:
+            seq = self.analysis_count
+            timestamp = datetime.utcnow()
+            self.threat_history.append(
+                seq,
+                timestamp,
+                location,
+                probability,
+                confidence,
+                sensors
+            )
+            if self.binlog:
+                self.binlog.append(seq, timestamp, location, probability, confidence, sensors,
+                                   self.threat_history.session)
+            
+            self.band_counts[band] += 1
+            self.probability_stats.update(probability)
+            self.confidence_stats.update(confidence)
+            self.trends.add(location, state, timestamp, band, probability)
+            posterior = self.evidence.update(location, timestamp, probability)
+            scan_count = int(self.evidence.scans[self.evidence.codes[location]])
+            self.analysis_count = seq + 1
+        
+        scan_id = f"NETRA-{timestamp.strftime('%Y%m%d%H%M%S')}-{self.threat_history.session}-{seq:04d}"
+        return scan_id, posterior, scan_count
+
+    def log_threat_batch(self, locations, probabilities: np.ndarray, sensors,
+                         confidences: Optional[np.ndarray] = None, health=None,
+                         timestamps=None) -> np.ndarray:
+        """
+        Log a batch of scored readings in one columnar write
+        
+        Args:
+            locations: Location names, one per reading
+            probabilities: Threat probabilities from score_batch
+            sensors: (N, 7) sensor matrix in SENSOR_ORDER or DataFrame
+            confidences: Confidence scores (computed if omitted)
+            health: Sensor health note per reading, kept in the history's
+                'health' column ('' or None = healthy)
+            timestamps: Reading times, one per reading (naive = UTC, NaT =
+                now). They
+                place the readings in the trend windows and location
+                posteriors; the history and binary log keep the logging
+                time so they stay in time order
+            
+        Returns:
+            np.ndarray: Sequence numbers assigned to the logged scans
+        """
+        matrix = self._sensor_matrix(sensors)
+        probabilities = np.asarray(probabilities, dtype=np.float64)
+        if confidences is None:
+            confidences = self._confidence(matrix)
+        confidences = np.asarray(confidences, dtype=np.float64)
         
-        self.analysis_count += 1
-        return scan_id
+        band_counts = np.bincount(classify(probabilities), minlength=len(THREAT_BANDS))
+        registry = get_location_registry()
+        names, inverse = np.unique(np.asarray(locations, dtype=object).astype(str),
+                                   return_inverse=True)
+        states = np.array([registry.attribute(name, 'state', '') for name in names],
+                          dtype=object)[inverse]
+        
+        with self._lock:
+            seq = np.arange(self.analysis_count, self.analysis_count + len(matrix))
+            timestamp = datetime.utcnow()
+            self.threat_history.append_batch(
+                seq, timestamp, locations, probabilities, confidences, matrix, health
+            )
+            if self.binlog:
+                self.binlog.append_batch(
+                    seq, timestamp, locations, probabilities, confidences, matrix,
+                    self.threat_history.session
+                )
+            
+            for band, count in enumerate(band_counts):
+                self.band_counts[band] += int(count)
+            self.probability_stats.update_batch(probabilities)
+            self.confidence_stats.update_batch(confidences)
+            read_at = timestamp
+            if timestamps is not None:
+                read_at = pd.DatetimeIndex(pd.to_datetime(timestamps, utc=True)).tz_localize(None)
+                read_at = read_at.to_numpy(dtype='datetime64[us]')
+                read_at = np.where(np.isnat(read_at), np.datetime64(timestamp, 'us'), read_at)
+            self.trends.add_batch(locations, states, read_at, probabilities)
+            self.evidence.rebuild(locations, read_at, probabilities)
+            self.analysis_count += len(matrix)
+        
+        return seq
 
-    def get_history(self, limit: Optional[int] = None) -> List[Dict]:
+    def get_history(self, limit: Optional[int] = None) -> pd.DataFrame:
         """
         Get threat detection history
         
@@ -321,76 +1037,152 @@ class NetraAI:
             limit: Maximum number of records to return
             
         Returns:
-            List of threat records
+            DataFrame of threat records, oldest first
         """
-        if limit:
-            return self.threat_history[-limit:]
-        return self.threat_history
+        with self._lock:
+            return self.threat_history.to_frame(limit or None)
 
-    def export_history_to_csv(self, filename: str = 'netra_threat_log.csv') -> str:
+    def export_history_to_csv(self, filename: str = 'netra_threat_log.csv',
+                              incremental: bool = False, fsync: bool = True) -> str:
         """
         Export threat history to CSV file
         
+        Every export records a '<filename>.watermark' sidecar. In
+        incremental mode only scans logged since the previous export are
+        appended, so the cost is proportional to new data. The watermark
+        holds the last exported sequence number of every session that
+        exported to the file, the file size, and hashes of the header line
+        and of the EXPORT_ANCHOR_BYTES before that size; it is replaced
+        atomically after the appended rows are flushed. If a crash left rows
+        past the recorded size they are kept and the watermark catches up.
+        If the file shrank, its header or anchor bytes changed (the file was
+        replaced or edited), or its columns differ from the current export
+        layout, it is rewritten in full. A new NetraAI instance appends all
+        of its retained scans after the previous instances' rows.
+        
         Args:
             filename: Output filename
+            incremental: Append only new scans instead of rewriting the file
+            fsync: Force appended rows to disk once per export
             
         Returns:
             str: Path to saved file
         """
-        if not self.threat_history:
-            raise ValueError("No threat history to export")
-        
-        # Flatten the data for CSV
-        records = []
-        for record in self.threat_history:
-            flat_record = {
-                'scan_id': record['scan_id'],
-                'timestamp': record['timestamp'].strftime('%Y-%m-%d %H:%M:%S'),
-                'location': record['location'],
-                'probability': record['probability'],
-                'threat_level': record['threat_level'],
-                'confidence': record['confidence'],
-                **record['sensors']
-            }
-            records.append(flat_record)
-        
-        df = pd.DataFrame(records)
-        df.to_csv(filename, index=False)
-        
+        with self._export_lock:
+            watermark_path = f"{filename}.watermark"
+            session = self.threat_history.session
+            watermark = _read_watermark(watermark_path) if incremental else None
+            size = os.path.getsize(filename) if os.path.exists(filename) else -1
+            usable = (watermark is not None and 'sessions' in watermark
+                      and 0 <= watermark['offset'] <= size
+                      and _export_fingerprint(filename, watermark['offset'])
+                      == {key: watermark.get(key) for key in ('header_sha256', 'anchor_sha256')})
+            
+            sessions = {}
+            if usable:
+                sessions = watermark['sessions']
+                if size > watermark['offset']:
+                    for tag, seq in _recover_tail(filename, watermark['offset']).items():
+                        sessions[tag] = max(sessions.get(tag, -1), seq)
+            last_seq = sessions.get(session, -1)
+            
+            # Snapshot under the log lock; file I/O runs without it
+            with self._lock:
+                count = self.threat_history.count_after(last_seq)
+                df = self.threat_history.to_frame(count) if count else None
+                newest = self.threat_history.last_seq
+            
+            # A file from an older export layout cannot take rows in the current one
+            if usable and df is not None:
+                with open(filename, 'r', newline='') as f:
+                    usable = f.readline().rstrip('\r\n') == ','.join(df.columns)
+            if not usable:
+                # No usable watermark: rewrite everything retained
+                if not self.threat_history:
+                    raise ValueError("No threat history to export")
+                sessions = {}
+                if last_seq != -1:  # The snapshot above only holds the new scans
+                    with self._lock:
+                        df = self.threat_history.to_frame()
+                        newest = self.threat_history.last_seq
+            
+            if df is not None:
+                self._write_export(filename, df, 'a' if usable else 'w', fsync)
+                sessions[session] = newest
+            
+            offset = os.path.getsize(filename)
+            _write_watermark(watermark_path, {
+                'sessions': sessions,
+                'offset': offset,
+                **_export_fingerprint(filename, offset)
+            })
         return filename
 
-    def analyze_location(self, location_key: str, sensors: Dict[str, float]) -> Dict:
+    @staticmethod
+    def _write_export(filename: str, df: pd.DataFrame, mode: str, fsync: bool) -> None:
+        """Write (mode 'w') or append (mode 'a') export rows in one bulk write"""
+        df['timestamp'] = df['timestamp'].dt.strftime('%Y-%m-%d %H:%M:%S')
+        with open(filename, mode, newline='') as f:
+            df.to_csv(f, header=(mode == 'w'), index=False)
+            if fsync:
+                f.flush()
+                os.fsync(f.fileno())
+
+    def analyze_location(self, location_key: str, sensors: Dict[str, float],
+                         lat: Optional[float] = None, lon: Optional[float] = None,
+                         use_posterior: bool = False) -> Dict:
         """
         Complete threat analysis for a location
         
         Args:
-            location_key: Key from NE_LOCATIONS or location name string
+            location_key: Key from NE_LOCATIONS, or a site key, Location_ID or
+                name from locations_northeast_india.csv
             sensors: Sensor readings
+            lat: Reading latitude (resolves unknown locations to the nearest
+                site within MAX_SITE_DISTANCE_KM)
+            lon: Reading longitude
+            use_posterior: Classify on the accumulated posterior over all scans
+                of this location instead of this scan alone
             
         Returns:
-            Dictionary with complete analysis results
+            Dictionary with complete analysis results; 'posterior' and
+            'scan_count' summarize every scan of the location so far
         """
         # Check if it's a predefined location key
         if location_key in NE_LOCATIONS:
             location = NE_LOCATIONS[location_key]
         else:
-            # Create a temporary location entry for CSV-based locations
+            from netra_spatial import MAX_SITE_DISTANCE_KM, get_spatial_index, valid_coordinates
+            
+            index = get_spatial_index()
+            site = index.lookup(location_key)
+            distance_km = 0.0
+            if lat is not None and lon is not None and not valid_coordinates(lat, lon):
+                raise ValueError(f"Invalid coordinates: latitude {lat}, longitude {lon}")
+            if site is None and lat is not None and lon is not None:
+                site, distance_km = index.nearest(lat, lon, MAX_SITE_DISTANCE_KM)
+            
             location = {
                 'name': location_key,
-                'state': 'North-East India',
-                'type': 'Strategic Location',
-                'lat': 0.0,  # Will be filled if available
-                'lon': 0.0
+                'state': site['state'] if site else 'North-East India',
+                'type': site['type'] if site else 'Strategic Location',
+                'lat': lat if lat is not None else (site['lat'] if site else 0.0),
+                'lon': lon if lon is not None else (site['lon'] if site else 0.0)
             }
+            if site:
+                location['nearest_site'] = site['name']
+                location['distance_km'] = round(distance_km, 3)
         
         # Calculate metrics
         probability = self.calculate_threat_probability(sensors)
-        threat_level, color, description = self.get_threat_level(probability)
-        recommendations = self.get_recommendations(probability)
         confidence = self.get_confidence_score(sensors)
         
-        # Log the analysis
-        scan_id = self.log_threat(location['name'], probability, sensors)
+        # Log the analysis (also folds it into the location's posterior)
+        scan_id, posterior, scan_count = self._log_scan(location['name'], probability, sensors)
+        
+        assessed = posterior if use_posterior else probability
+        threat_level, color, description = self.get_threat_level(assessed)
+        recommendations = self.get_recommendations(assessed)
         
         # Return comprehensive results
         return {
@@ -403,7 +1195,9 @@ class NetraAI:
             'color': color,
             'description': description,
             'recommendations': recommendations,
-            'confidence': confidence
+            'confidence': confidence,
+            'posterior': posterior,
+            'scan_count': scan_count
         }
 
     def batch_analyze(self, location_keys: Optional[List[str]] = None) -> pd.DataFrame:
@@ -451,47 +1245,116 @@ class NetraAI:
         """
         Get system statistics
         
+        Computed in constant time from counters maintained by log_threat, so
+        they cover every scan since startup, including scans already evicted
+        from the history buffer.
+        
         Returns:
             Dictionary with system stats
         """
-        if not self.threat_history:
+        with self._lock:
+            low, moderate, high, critical = self.band_counts
             return {
-                'total_scans': 0,
-                'critical_threats': 0,
-                'high_threats': 0,
-                'moderate_threats': 0,
-                'low_threats': 0,
-                'average_probability': 0,
-                'average_confidence': 0
+                'total_scans': self.probability_stats.count,
+                'critical_threats': critical,
+                'high_threats': high,
+                'moderate_threats': moderate,
+                'low_threats': low,
+                'average_probability': round(self.probability_stats.mean, 2),
+                'average_confidence': round(self.confidence_stats.mean, 2),
+                'probability_std': round(self.probability_stats.std, 2),
+                'confidence_std': round(self.confidence_stats.std, 2)
             }
+
+    def get_posteriors(self) -> pd.DataFrame:
+        """
+        Accumulated posterior threat probability of every scanned location
+        
+        Returns:
+            DataFrame indexed by location with scans, last_seen and posterior
+            (decayed to the current time)
+        """
+        with self._lock:
+            return self.evidence.snapshot(as_of=datetime.utcnow())
+
+    def rebuild_evidence(self, df: pd.DataFrame) -> None:
+        """
+        Replace the per-location posteriors with ones rebuilt from a log
         
-        probabilities = [r['probability'] for r in self.threat_history]
-        confidences = [r['confidence'] for r in self.threat_history]
+        Args:
+            df: netra_threat_log.csv-style DataFrame (Timestamp, Location,
+                Threat_Probability), e.g. a replayed archive
+        """
+        evidence = EvidenceAccumulator.from_threat_log(df)
+        with self._lock:
+            self.evidence = evidence
+
+    def get_trends(self, scope: str = 'location', window: str = '24h') -> pd.DataFrame:
+        """
+        Sliding-window threat trends, maintained as scans are logged
+        
+        Args:
+            scope: 'location' or 'state'
+            window: '1h', '24h' or '7d'
+            
+        Returns:
+            DataFrame indexed by location or state with scan count, per-band
+            counts, mean and max probability (see TrendAggregator.snapshot)
+        """
+        with self._lock:
+            return self.trends.snapshot(scope, window, as_of=datetime.utcnow())
+
+    def get_window_statistics(self, last_n: Optional[int] = None,
+                              minutes: Optional[float] = None) -> Dict:
+        """
+        Get statistics for a recent window of scans
         
-        critical = sum(1 for p in probabilities if p >= 75)
-        high = sum(1 for p in probabilities if 50 <= p < 75)
-        moderate = sum(1 for p in probabilities if 25 <= p < 50)
-        low = sum(1 for p in probabilities if p < 25)
+        Args:
+            last_n: Only include the most recent N scans
+            minutes: Only include scans from the last T minutes
+            
+        Returns:
+            Dictionary with the same keys as get_statistics
+        """
+        with self._lock:
+            count = len(self.threat_history)
+            if last_n is not None:
+                count = min(count, last_n)
+            if minutes is not None:
+                cutoff = datetime.utcnow() - timedelta(minutes=minutes)
+                count = min(count, self.threat_history.count_since(cutoff))
+            
+            slots = self.threat_history.slots(count)
+            probabilities = self.threat_history.probability[slots]
+            confidences = self.threat_history.confidence[slots]
+        low, moderate, high, critical = np.bincount(
+            classify(probabilities), minlength=len(THREAT_BANDS)
+        )
         
         return {
-            'total_scans': len(self.threat_history),
-            'critical_threats': critical,
-            'high_threats': high,
-            'moderate_threats': moderate,
-            'low_threats': low,
-            'average_probability': round(np.mean(probabilities), 2),
-            'average_confidence': round(np.mean(confidences), 2)
+            'total_scans': count,
+            'critical_threats': int(critical),
+            'high_threats': int(high),
+            'moderate_threats': int(moderate),
+            'low_threats': int(low),
+            'average_probability': round(float(probabilities.mean()), 2) if count else 0,
+            'average_confidence': round(float(confidences.mean()), 2) if count else 0,
+            'probability_std': round(float(probabilities.std()), 2) if count else 0,
+            'confidence_std': round(float(confidences.std()), 2) if count else 0
         }
 
 
 # Singleton instance for global use
 _netra_instance = None
+_netra_instance_lock = threading.Lock()
 
 def get_netra_instance() -> NetraAI:
-    """Get or create the global NETRA AI instance"""
+    """Get or create the global NETRA AI instance (thread-safe)"""
     global _netra_instance
     if _netra_instance is None:
-        _netra_instance = NetraAI()
+        with _netra_instance_lock:
+            if _netra_instance is None:
+                _netra_instance = NetraAI()
     return _netra_instance
 
 
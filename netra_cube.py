@@ -0,0 +1,148 @@
+"""
+N.E.T.R.A. Threat Aggregate Cube
+
+Pre-aggregated counts of the historical threat log over (site, threat
+level, day), where a site is a (state, location) pair. It is built once per
+data version in a single vectorized pass. Every dashboard metric and chart
+is then a rollup over a few thousand cells instead of a scan of the log, so
+rendering costs the same at 1k or 50M rows.
+
+Missing states, locations, levels and timestamps get their own cells. They
+count toward totals but are left out of the per-category rollups, as they
+are by value_counts and groupby.
+
+Usage:
+    cube = ThreatCube.from_threat_log(df)
+    cube.count('CRITICAL'), cube.state_counts(), cube.daily_counts()
+"""
+
+from typing import Dict
+
+import numpy as np
+import pandas as pd
+
+
+# Columns kept for the newest scans of each level
+RECENT_COLUMNS = ['Timestamp', 'Location', 'State', 'Threat_Probability', 'Threat_Level']
+
+
+def _factorize(values):
+    """Sorted codes and labels, with NaN/NaT kept as a label of its own"""
+    codes, labels = pd.factorize(values, sort=True, use_na_sentinel=False)
+    return codes.astype(np.intp), pd.Index(labels)
+
+
+class ThreatCube:
+    """
+    Scan counts and probability sums per (site, threat level, day)
+
+    Build with ThreatCube.from_threat_log.
+    """
+
+    def __init__(self, states: pd.Index, locations: pd.Index, levels: pd.Index, days: pd.Index,
+                 counts: np.ndarray, probability_sum: np.ndarray, probability_count: np.ndarray,
+                 recent: Dict[str, pd.DataFrame]):
+        self.states = states            # State of every site
+        self.locations = locations      # Location of every site
+        self.levels = levels
+        self.days = days
+        self.counts = counts            # (sites, levels, days) scans
+        self.probability_sum = probability_sum
+        self.probability_count = probability_count
+        self.recent = recent            # Level -> its newest scans, newest first
+
+    @classmethod
+    def from_threat_log(cls, df: pd.DataFrame, recent_rows: int = 10) -> 'ThreatCube':
+        """
+        Aggregate a netra_threat_log.csv-style DataFrame
+
+        Args:
+            df: Threat log with Timestamp, Location, State, Threat_Level and
+                Threat_Probability columns
+            recent_rows: Newest scans kept per threat level
+        """
+        timestamp = pd.to_datetime(df['Timestamp'])
+        location_codes, location_labels = _factorize(df['Location'])
+        state_codes, state_labels = _factorize(df['State'])
+        level_codes, levels = _factorize(df['Threat_Level'])
+        day_codes, days = _factorize(timestamp.dt.floor('D'))
+
+        # Sites are the (location, state) pairs that occur
+        pair_codes, pairs = pd.factorize(location_codes * len(state_labels) + state_codes, sort=True)
+        location_of, state_of = np.divmod(pairs, len(state_labels))
+
+        shape = (len(pairs), len(levels), len(days))
+        cell = np.ravel_multi_index((pair_codes, level_codes, day_codes), shape) if len(df) else np.zeros(0, np.intp)
+        size = int(np.prod(shape))
+        probability = pd.to_numeric(df['Threat_Probability'], errors='coerce').to_numpy(dtype=np.float64)
+        valid = ~np.isnan(probability)
+
+        counts = np.bincount(cell, minlength=size).reshape(shape)
+        probability_sum = np.bincount(cell[valid], weights=probability[valid], minlength=size).reshape(shape)
+        probability_count = np.bincount(cell[valid], minlength=size).reshape(shape)
+
+        # Newest scans per level. NaT is int64 min and negating it overflows back to
+        # int64 min, so NaT maps to int64 max instead and sorts after every dated scan
+        recent = {}
+        ticks = timestamp.to_numpy(dtype='datetime64[ns]').view(np.int64)
+        age = np.where(ticks == np.iinfo(np.int64).min, np.iinfo(np.int64).max, -ticks)
+        for code, level in enumerate(levels):
+            if pd.isna(level):
+                continue
+            rows = np.flatnonzero(level_codes == code)
+            if len(rows) > recent_rows:
+                rows = rows[np.argpartition(age[rows], recent_rows - 1)[:recent_rows]]
+            rows = rows[np.argsort(age[rows], kind='stable')]
+            columns = [column for column in RECENT_COLUMNS if column in df.columns]
+            recent[level] = df.iloc[rows][columns].assign(Timestamp=timestamp.iloc[rows])
+
+        return cls(state_labels[state_of], location_labels[location_of], levels, days,
+                   counts, probability_sum, probability_count, recent)
+
+    def total(self) -> int:
+        """Number of scans"""
+        return int(self.counts.sum())
+
+    def count(self, level: str) -> int:
+        """Number of scans at one threat level"""
+        return int(self.level_counts().get(level, 0))
+
+    def level_counts(self) -> pd.Series:
+        """Scans per threat level, most frequent first (like value_counts)"""
+        return self._rollup(self.counts.sum(axis=(0, 2)), self.levels)
+
+    def state_counts(self) -> pd.Series:
+        """Scans per state, most frequent first"""
+        codes, states = _factorize(self.states)
+        return self._rollup(np.bincount(codes, weights=self.counts.sum(axis=(1, 2)),
+                                        minlength=len(states)).astype(np.int64), states)
+
+    def location_counts(self) -> pd.Series:
+        """Scans per location, most frequent first"""
+        codes, locations = _factorize(self.locations)
+        return self._rollup(np.bincount(codes, weights=self.counts.sum(axis=(1, 2)),
+                                        minlength=len(locations)).astype(np.int64), locations)
+
+    def daily_counts(self) -> pd.DataFrame:
+        """Scans per calendar day with at least one scan, as Date and Count columns"""
+        counts = self.counts.sum(axis=(0, 1))
+        keep = self.days.notna() & (counts > 0)
+        return pd.DataFrame({'Date': self.days[keep].date, 'Count': counts[keep]})
+
+    def mean_probability(self) -> float:
+        """Mean threat probability over all scans (NaN if none)"""
+        count = self.probability_count.sum()
+        return float(self.probability_sum.sum() / count) if count else float('nan')
+
+    def recent_scans(self, level: str, n: int = 10) -> pd.DataFrame:
+        """Newest scans at one threat level, newest first"""
+        recent = self.recent.get(level)
+        if recent is None:
+            return pd.DataFrame(columns=RECENT_COLUMNS)
+        return recent.head(n)
+
+    @staticmethod
+    def _rollup(counts: np.ndarray, labels: pd.Index) -> pd.Series:
+        series = pd.Series(counts, index=labels, name='count')
+        series = series[series.index.notna() & (series > 0)]
+        return series.sort_values(ascending=False, kind='stable')
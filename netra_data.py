@@ -0,0 +1,74 @@
+"""
+N.E.T.R.A. Historical Data Loader
+
+Loads the CSV datasets behind the dashboard (threat log, locations, live
+sensor readings) without any Streamlit dependency, so the same loader is
+used by netra_unified_app.py (wrapped in st.cache_data), by scripts and by
+the benchmarks in development/.
+"""
+
+import os
+from typing import Dict
+
+import pandas as pd
+
+from netra_cube import ThreatCube
+from netra_query import ThreatLogIndex
+from netra_trends import TrendAggregator
+
+try:
+    from netra_binlog import binlog_frame
+    BINLOG_AVAILABLE = True
+except ImportError:
+    BINLOG_AVAILABLE = False
+
+
+THREAT_LOG_CSV = 'netra_threat_log.csv'
+THREAT_LOG_BIN = 'netra_threat_log.bin'
+LOCATIONS_CSV = 'locations_northeast_india.csv'
+SENSOR_READINGS_CSV = 'sensor_readings_live.csv'
+
+
+def load_historical_data(base_dir: str = '.') -> Dict:
+    """
+    Load all CSV datasets
+
+    Args:
+        base_dir: Directory holding the data files
+
+    Returns:
+        Dictionary with 'threat_log', 'trends', 'cube', 'index', 'locations'
+        and 'sensor_readings' entries for the files that exist
+    """
+    data = {}
+    threat_csv = os.path.join(base_dir, THREAT_LOG_CSV)
+    threat_bin = os.path.join(base_dir, THREAT_LOG_BIN)
+
+    # Load threat log, preferring an up-to-date memory-mapped binary copy
+    if BINLOG_AVAILABLE and os.path.exists(threat_bin) and (
+            not os.path.exists(threat_csv)
+            or os.path.getmtime(threat_bin) >= os.path.getmtime(threat_csv)):
+        data['threat_log'] = binlog_frame(threat_bin)
+    elif os.path.exists(threat_csv):
+        data['threat_log'] = pd.read_csv(threat_csv)
+        data['threat_log']['Timestamp'] = pd.to_datetime(data['threat_log']['Timestamp'])
+
+    # Sliding-window trends as of the newest logged scan, the dashboard's aggregate
+    # cube and the Historical Data page's query index
+    if 'threat_log' in data:
+        data['trends'] = TrendAggregator.from_threat_log(data['threat_log'])
+        data['cube'] = ThreatCube.from_threat_log(data['threat_log'])
+        data['index'] = ThreatLogIndex.from_threat_log(data['threat_log'])
+
+    # Load locations
+    locations_csv = os.path.join(base_dir, LOCATIONS_CSV)
+    if os.path.exists(locations_csv):
+        data['locations'] = pd.read_csv(locations_csv)
+
+    # Load sensor readings
+    readings_csv = os.path.join(base_dir, SENSOR_READINGS_CSV)
+    if os.path.exists(readings_csv):
+        data['sensor_readings'] = pd.read_csv(readings_csv)
+        data['sensor_readings']['Timestamp'] = pd.to_datetime(data['sensor_readings']['Timestamp'])
+
+    return data
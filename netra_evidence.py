@@ -0,0 +1,261 @@
+"""
+N.E.T.R.A. Sequential Evidence Accumulator
+
+Keeps a running posterior threat estimate per location across repeated
+scans. The state of a location is its log-odds excess over the prior
+(X = logit(posterior) - logit(prior)) and the time of its last scan:
+
+    X <- X * 2 ** (-dt / half_life) + weight * (logit(p_scan) - logit(prior))
+
+Evidence decays back towards the prior with the given half-life, so
+repeated high readings sharpen the estimate, low readings relax it, and
+stale evidence fades. Each scan is an O(1) update.
+
+rebuild() computes the same recurrence for a whole replayed log without a
+Python loop: within a location, X_i = 2^-s_i * cumsum(e_j * 2^s_j) with
+s = t / half_life. To keep the powers of two in floating-point range the
+scans are cut into segments spanning at most SEGMENT_HALF_LIVES half-lives,
+each rebased to its first scan and summed independently; the state at the
+end of one segment is carried (decayed) into the next.
+"""
+
+from datetime import datetime
+from typing import Dict, Optional
+
+import numpy as np
+import pandas as pd
+
+
+# Scan probabilities are clipped to this range (%) before taking log-odds
+_MIN_PROBABILITY = 0.1
+_MAX_PROBABILITY = 99.9
+
+# Longest span of a rebuild segment, in half-lives (2**512 fits in float64)
+SEGMENT_HALF_LIVES = 512
+
+
+def _logit(probability) -> np.ndarray:
+    """Log-odds of a probability given in %"""
+    p = np.clip(np.asarray(probability, dtype=np.float64), _MIN_PROBABILITY, _MAX_PROBABILITY) / 100
+    return np.log(p / (1 - p))
+
+
+def _probability(log_odds) -> np.ndarray:
+    """Probability in % for log-odds"""
+    return 100 / (1 + np.exp(-np.asarray(log_odds, dtype=np.float64)))
+
+
+def _segmented_cumsum(values: np.ndarray, starts: np.ndarray) -> np.ndarray:
+    """
+    Cumulative sum restarting at every segment start
+
+    Segments are padded into 2-D blocks by power-of-two length class and
+    summed along rows, so no segment's sum passes through another's (a
+    global cumsum minus offsets would lose precision when magnitudes differ).
+    """
+    lengths = np.diff(np.r_[starts, len(values)])
+    classes = np.ceil(np.log2(lengths)).astype(np.int64)
+    out = np.empty(len(values))
+
+    for k in np.unique(classes):
+        segments = np.flatnonzero(classes == k)
+        offsets = np.arange(1 << int(k))
+        mask = offsets < lengths[segments, None]
+        index = np.where(mask, starts[segments, None] + offsets, 0)
+        out[index[mask]] = np.cumsum(np.where(mask, values[index], 0.0), axis=1)[mask]
+    return out
+
+
+def _seconds(timestamp) -> np.ndarray:
+    """Seconds since the Unix epoch for datetimes or datetime64 values"""
+    return np.asarray(timestamp, dtype='datetime64[us]').astype(np.int64) / 1e6
+
+
+class EvidenceAccumulator:
+    """
+    Per-location posterior threat probability with time decay
+
+    Args:
+        prior_probability: Base-rate threat probability (%) a location
+            relaxes to without evidence
+        half_life: Seconds for accumulated evidence to lose half its weight
+        weight: Scale applied to each scan's evidence (below 1 discounts
+            correlated re-scans)
+    """
+
+    def __init__(self, prior_probability: float = 10.0, half_life: float = 2 * 3600,
+                 weight: float = 1.0):
+        if half_life <= 0:
+            raise ValueError(f"Half-life must be positive, got {half_life}")
+
+        self.prior_probability = prior_probability
+        self.prior_log_odds = float(_logit(prior_probability))
+        self.half_life = half_life
+        self.weight = weight
+
+        self.locations = []
+        self.codes: Dict[str, int] = {}
+        self._allocate(64)
+
+    def _allocate(self, capacity: int) -> None:
+        n = len(self.locations)
+        excess = np.zeros(capacity, dtype=np.float64)
+        last_seen = np.zeros(capacity, dtype=np.float64)
+        scans = np.zeros(capacity, dtype=np.int64)
+        if n:
+            excess[:n], last_seen[:n], scans[:n] = self.excess[:n], self.last_seen[:n], self.scans[:n]
+        self.excess, self.last_seen, self.scans = excess, last_seen, scans
+
+    def _code(self, location: str) -> int:
+        code = self.codes.get(location)
+        if code is None:
+            code = len(self.locations)
+            if code == len(self.excess):
+                self._allocate(2 * code)
+            self.locations.append(location)
+            self.codes[location] = code
+        return code
+
+    def _evidence(self, probability) -> np.ndarray:
+        return self.weight * (_logit(probability) - self.prior_log_odds)
+
+    def update(self, location: str, timestamp: datetime, probability: float) -> float:
+        """
+        Fold one scan into a location's posterior
+
+        Args:
+            location: Location name
+            timestamp: Scan time
+            probability: Scan threat probability (%)
+
+        Returns:
+            float: Posterior threat probability (%) after the scan
+        """
+        k = self._code(location)
+        now = float(_seconds(timestamp))
+
+        if self.scans[k]:
+            elapsed = max(0.0, now - self.last_seen[k])
+            self.excess[k] *= 2.0 ** (-elapsed / self.half_life)
+        self.excess[k] += float(self._evidence(probability))
+        self.last_seen[k] = max(now, self.last_seen[k])
+        self.scans[k] += 1
+
+        return round(float(_probability(self.prior_log_odds + self.excess[k])), 2)
+
+    def posterior(self, location: str, as_of: Optional[datetime] = None) -> float:
+        """
+        Current posterior threat probability (%) of a location
+
+        Args:
+            location: Location name (unscanned locations return the prior)
+            as_of: Decay the evidence to this time (default: last scan time)
+        """
+        k = self.codes.get(location)
+        if k is None:
+            return float(self.prior_probability)
+        excess = self.excess[k]
+        if as_of is not None:
+            excess *= 2.0 ** (-max(0.0, float(_seconds(as_of)) - self.last_seen[k]) / self.half_life)
+        return round(float(_probability(self.prior_log_odds + excess)), 2)
+
+    def snapshot(self, as_of: Optional[datetime] = None) -> pd.DataFrame:
+        """
+        Posterior of every scanned location
+
+        Args:
+            as_of: Decay all evidence to this time (default: each location's last scan)
+
+        Returns:
+            DataFrame indexed by location with scans, last_seen and posterior
+        """
+        n = len(self.locations)
+        excess = self.excess[:n]
+        if as_of is not None:
+            elapsed = np.maximum(0.0, float(_seconds(as_of)) - self.last_seen[:n])
+            excess = excess * np.exp2(-elapsed / self.half_life)
+
+        return pd.DataFrame({
+            'scans': self.scans[:n],
+            'last_seen': pd.to_datetime(np.round(self.last_seen[:n] * 1e6).astype(np.int64), unit='us'),
+            'posterior': np.round(_probability(self.prior_log_odds + excess), 2)
+        }, index=pd.Index(self.locations, name='location'))
+
+    def rebuild(self, locations, timestamps, probabilities) -> np.ndarray:
+        """
+        Fold a batch of scans (e.g. a replayed log) into the state at once
+
+        Equivalent to calling update() for every scan in time order. Like
+        update(), a scan older than its location's current last scan counts
+        as arriving at that last scan's time.
+
+        Args:
+            locations: Location names, one per scan
+            timestamps: Scan times
+            probabilities: Scan threat probabilities (%)
+
+        Returns:
+            np.ndarray: Posterior (%) after each scan, in input order
+        """
+        names, inverse = np.unique(np.asarray(locations, dtype=object).astype(str),
+                                   return_inverse=True)
+        codes = np.array([self._code(name) for name in names], dtype=np.int64)[inverse]
+        times = np.broadcast_to(_seconds(timestamps), codes.shape).astype(np.float64)
+        times = np.maximum(times, np.where(self.scans[codes] > 0, self.last_seen[codes], -np.inf))
+        evidence = self._evidence(probabilities)
+        n = len(codes)
+        if n == 0:
+            return np.zeros(0)
+
+        # Existing state enters as a leading pseudo-scan carrying its excess
+        touched = np.unique(codes)
+        prior = touched[self.scans[touched] > 0]
+        all_codes = np.concatenate([prior, codes])
+        all_times = np.concatenate([self.last_seen[prior], times])
+        all_evidence = np.concatenate([self.excess[prior], evidence])
+
+        order = np.lexsort((np.arange(len(all_codes)), all_times, all_codes))
+        c, t, e = all_codes[order], all_times[order], all_evidence[order]
+
+        # Group starts and time in half-lives since each group's first scan
+        first = np.r_[True, c[1:] != c[:-1]]
+        group = np.cumsum(first) - 1
+        s = (t - t[first][group]) / self.half_life
+
+        # Segments: rebase every SEGMENT_HALF_LIVES so 2**s stays finite
+        block = np.floor(s / SEGMENT_HALF_LIVES).astype(np.int64)
+        seg_first = first | np.r_[True, block[1:] != block[:-1]]
+        segment = np.cumsum(seg_first) - 1
+        base = s[seg_first][segment]
+        rel = s - base
+
+        seg_starts = np.flatnonzero(seg_first)
+        excess = _segmented_cumsum(e * np.exp2(rel), seg_starts) * np.exp2(-rel)
+
+        # Carry each segment's final state into the next segment of its group
+        seg_ends = np.r_[seg_starts[1:], len(c)] - 1
+        seg_group = group[seg_starts]
+        rank = np.arange(len(seg_starts)) - np.searchsorted(seg_group, seg_group)
+        for r in range(1, int(rank.max()) + 1):
+            rows = np.flatnonzero(rank[segment] == r)
+            previous_end = seg_ends[segment[rows] - 1]
+            excess[rows] += excess[previous_end] * np.exp2(-(s[rows] - s[previous_end]))
+
+        # Store the final state of every group
+        last = np.r_[c[1:] != c[:-1], True]
+        self.excess[c[last]] = excess[last]
+        self.last_seen[c[last]] = t[last]
+        np.add.at(self.scans, codes, 1)
+
+        # Posteriors back in input order (pseudo-scans dropped)
+        posterior = np.empty(len(all_codes))
+        posterior[order] = _probability(self.prior_log_odds + excess)
+        return np.round(posterior[len(prior):], 2)
+
+    @classmethod
+    def from_threat_log(cls, df: pd.DataFrame, **kwargs) -> 'EvidenceAccumulator':
+        """Build the state from a netra_threat_log.csv-style DataFrame"""
+        evidence = cls(**kwargs)
+        evidence.rebuild(df['Location'], pd.to_datetime(df['Timestamp']).to_numpy(),
+                         df['Threat_Probability'].to_numpy())
+        return evidence
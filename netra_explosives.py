@@ -0,0 +1,200 @@
+"""
+N.E.T.R.A. Explosive Database
+
+Loads explosives_dataset_1500_entries_Version2.csv into a table with one
+row per explosive (name, fume_color, danger, velocity, density, brisance,
+type). Fume colours and danger classes are derived with vectorized string
+matching and np.select instead of per-row loops.
+
+The parsed table is cached in a '<csv>.npz' sidecar stamped with the
+source's size, mtime and SHA-256. An unchanged mtime and size reuse the
+cache without reading the CSV. A touched file whose content hash still
+matches reuses it too (and refreshes the stamp). Anything else reparses.
+
+Usage:
+    from netra_explosives import get_explosive_table
+    table = get_explosive_table()
+    table.loc['TNT', 'velocity']
+"""
+
+import os
+import hashlib
+import threading
+from typing import Dict, Optional
+
+import numpy as np
+import pandas as pd
+
+
+EXPLOSIVES_CSV = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                              'explosives_dataset_1500_entries_Version2.csv')
+EXPLOSIVE_COLUMNS = ('fume_color', 'danger', 'velocity', 'density', 'brisance', 'type')
+
+# Bump when parsing changes so stale sidecars are rebuilt
+CACHE_VERSION = 1
+
+FALLBACK_EXPLOSIVES = {
+    # Military/Common Explosives
+    'TNT': {'fume_color': 'Black/Orange-Brown', 'danger': 'High', 'velocity': 6900, 'density': 1.65, 'brisance': 'High', 'type': 'Nitroaromatic'},
+    'RDX': {'fume_color': 'Orange/Brown NOx', 'danger': 'Very High', 'velocity': 8750, 'density': 1.82, 'brisance': 'Very High', 'type': 'Nitramine'},
+    'HMX': {'fume_color': 'Brown NOx', 'danger': 'Very High', 'velocity': 9100, 'density': 1.91, 'brisance': 'Very High', 'type': 'Nitramine'},
+    'PETN': {'fume_color': 'Colorless/Brown', 'danger': 'Very High', 'velocity': 8400, 'density': 1.77, 'brisance': 'Very High', 'type': 'Nitrate Ester'},
+    'C4': {'fume_color': 'Brown/Orange', 'danger': 'Very High', 'velocity': 8040, 'density': 1.59, 'brisance': 'Very High', 'type': 'Plastic Explosive'},
+    'TATP': {'fume_color': 'White vapor', 'danger': 'Very High', 'velocity': 5300, 'density': 1.22, 'brisance': 'High', 'type': 'Peroxide'},
+    'ANFO': {'fume_color': 'Brown/Orange NOx', 'danger': 'Medium', 'velocity': 4200, 'density': 0.93, 'brisance': 'Medium', 'type': 'Ammonium Nitrate'}
+}
+
+
+def _column(df: pd.DataFrame, name: str, default) -> pd.Series:
+    return df[name] if name in df.columns else pd.Series(default, index=df.index)
+
+
+def parse_explosives(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Derive the explosive table from the raw dataset
+
+    Args:
+        df: Raw explosives_dataset CSV contents
+
+    Returns:
+        DataFrame indexed by explosive name with EXPLOSIVE_COLUMNS; a name
+        listed twice keeps its first position and its last row's values
+    """
+    fume_info = _column(df, 'Detonation Products & Inferred Fume Color', 'Unknown').astype(str)
+    fume_color = np.select(
+        [fume_info.str.contains('Black', regex=False),
+         fume_info.str.contains('Orange', regex=False) | fume_info.str.contains('Brown', regex=False),
+         fume_info.str.contains('White', regex=False),
+         fume_info.str.contains('Yellow', regex=False),
+         fume_info.str.contains('Colorless', regex=False)],
+        ['Black/Orange-Brown', 'Orange/Brown NOx', 'White vapor', 'Yellow smoke', 'Colorless'],
+        'Unknown'
+    )
+
+    # Missing velocities count as 0 (Low danger)
+    velocity = pd.to_numeric(_column(df, 'Detonation Velocity (m/s)', 0), errors='coerce').fillna(0).to_numpy()
+    danger = np.select([velocity > 7500, velocity > 5000, velocity > 3000],
+                       ['Very High', 'High', 'Medium'], 'Low')
+
+    density = pd.to_numeric(_column(df, 'Density (g/cm³)', np.nan), errors='coerce').fillna(1.0)
+    brisance = _column(df, 'Brisance', np.nan)
+    brisance = brisance.where(brisance.notna(), '').astype(str).str.strip().replace('', 'Medium')
+
+    table = pd.DataFrame({
+        'fume_color': fume_color,
+        'danger': danger,
+        'velocity': velocity.astype(np.int64),
+        'density': density.to_numpy(dtype=np.float64),
+        'brisance': brisance.to_numpy(),
+        'type': _column(df, 'Type/Class', 'Unknown').astype(str).to_numpy()
+    }, index=pd.Index(df['Explosive Name'].astype(str).str.strip(), name='name'))
+
+    first = ~table.index.duplicated(keep='first')
+    last = table[~table.index.duplicated(keep='last')]
+    return last.reindex(table.index[first])
+
+
+def _file_hash(path: str) -> str:
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _read_cache(cache_path: str) -> Optional[Dict]:
+    try:
+        with np.load(cache_path, allow_pickle=False) as cache:
+            return {key: cache[key] for key in cache.files}
+    except (OSError, ValueError, KeyError):
+        return None
+
+
+def _write_cache(cache_path: str, table: pd.DataFrame, stamp: Dict) -> None:
+    """Write the sidecar atomically (tmp file + rename)"""
+    arrays = {'name': table.index.to_numpy(dtype=str)}
+    for column in EXPLOSIVE_COLUMNS:
+        values = table[column].to_numpy()
+        arrays[column] = values.astype(str) if values.dtype == object else values
+    tmp_path = f"{cache_path}.tmp"
+    with open(tmp_path, 'wb') as f:
+        np.savez(f, **arrays, **{key: np.asarray(value) for key, value in stamp.items()})
+    os.replace(tmp_path, cache_path)
+
+
+def _table_from_cache(cache: Dict) -> pd.DataFrame:
+    table = pd.DataFrame({column: cache[column] for column in EXPLOSIVE_COLUMNS},
+                         index=pd.Index(cache['name'].astype(object), name='name'))
+    for column in EXPLOSIVE_COLUMNS:
+        if table[column].dtype.kind == 'U':
+            table[column] = table[column].astype(object)
+    return table
+
+
+def load_explosives(csv_path: str = EXPLOSIVES_CSV, use_cache: bool = True) -> pd.DataFrame:
+    """
+    Load the explosive table, from the sidecar cache when it is current
+
+    Args:
+        csv_path: Explosives dataset CSV
+        use_cache: Read and write the '<csv_path>.npz' sidecar
+
+    Returns:
+        DataFrame indexed by explosive name with EXPLOSIVE_COLUMNS
+
+    Raises:
+        FileNotFoundError: If the dataset does not exist
+    """
+    info = os.stat(csv_path)
+    cache_path = f"{csv_path}.npz"
+
+    if use_cache:
+        cache = _read_cache(cache_path)
+        if cache is not None and int(cache['version']) == CACHE_VERSION:
+            if int(cache['mtime_ns']) == info.st_mtime_ns and int(cache['size']) == info.st_size:
+                return _table_from_cache(cache)
+
+            digest = _file_hash(csv_path)
+            if str(cache['sha256']) == digest:
+                table = _table_from_cache(cache)
+                _write_cache(cache_path, table, {'version': CACHE_VERSION, 'mtime_ns': info.st_mtime_ns,
+                                                 'size': info.st_size, 'sha256': digest})
+                return table
+
+    table = parse_explosives(pd.read_csv(csv_path))
+    if use_cache:
+        _write_cache(cache_path, table, {'version': CACHE_VERSION, 'mtime_ns': info.st_mtime_ns,
+                                         'size': info.st_size, 'sha256': _file_hash(csv_path)})
+    return table
+
+
+def fallback_table() -> pd.DataFrame:
+    """Built-in explosive table used when the dataset is unavailable"""
+    table = pd.DataFrame.from_dict(FALLBACK_EXPLOSIVES, orient='index')[list(EXPLOSIVE_COLUMNS)]
+    table.index.name = 'name'
+    return table
+
+
+def explosive_dict(table: pd.DataFrame) -> Dict[str, Dict]:
+    """Table as {name: {'fume_color': ..., 'velocity': ..., ...}} (legacy format)"""
+    return {
+        name: {column: value.item() if isinstance(value, np.generic) else value
+               for column, value in zip(EXPLOSIVE_COLUMNS, row)}
+        for name, row in zip(table.index, table[list(EXPLOSIVE_COLUMNS)].itertuples(index=False))
+    }
+
+
+_explosive_table = None
+_explosive_table_lock = threading.Lock()
+
+def get_explosive_table() -> pd.DataFrame:
+    """Get the shared explosive table (dataset if present, else the fallback; thread-safe)"""
+    global _explosive_table
+    if _explosive_table is None:
+        with _explosive_table_lock:
+            if _explosive_table is None:
+                try:
+                    _explosive_table = load_explosives()
+                except (OSError, ValueError, KeyError):
+                    _explosive_table = fallback_table()
+    return _explosive_table
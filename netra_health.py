@@ -0,0 +1,276 @@
+"""
+N.E.T.R.A. Sensor Health Monitor
+
+Streaming detector for flatlined, saturated and drifting sensors. Every
+(location, sensor) pair is one channel; channel state lives in (locations,
+7) arrays, so a batch of readings updates thousands of channels with a few
+vectorized operations and each reading costs O(1).
+
+Per channel:
+    stuck      the same mid-scale value repeated stuck_run times in a row
+               (readings at 0% or 100% are legitimate and never count)
+    saturated  pinned at 100% for saturation_run readings in a row; this
+               is informational, since a sustained full-scale signature
+               is a real detection as often as a clipped sensor
+    drift      two-sided CUSUM on the reading's z-score against a baseline
+               learnt over the first `warmup` readings exceeds cusum_h
+
+Flags are bit flags, OR-ed per channel, in the style of the sensor
+validation codes in netra_core. They never drop a reading: stuck and
+drifting channels are scored as not read (unreliable_channels, for
+NetraAI.score_batch) and lower the reading's confidence (health_confidence);
+saturation only annotates it.
+"""
+
+from typing import Dict, Optional
+
+import numpy as np
+import pandas as pd
+
+from netra_core import SENSOR_ORDER
+
+
+# Channel health flags (bit flags, OR-ed together per channel)
+HEALTH_OK = 0
+HEALTH_STUCK = 1
+HEALTH_SATURATED = 2
+HEALTH_DRIFT = 4
+
+HEALTH_FLAG_NAMES = {
+    HEALTH_STUCK: 'stuck',
+    HEALTH_SATURATED: 'saturated',
+    HEALTH_DRIFT: 'drift'
+}
+
+# Flags that take a channel out of fusion and lower the reading's confidence,
+# and the share of a channel's weight each such channel costs the confidence
+UNRELIABLE_FLAGS = HEALTH_STUCK | HEALTH_DRIFT
+UNHEALTHY_CHANNEL_PENALTY = 0.5
+
+# Readings this close to a bound are at full or zero scale; values this close are "the same"
+_SATURATION_MARGIN = 0.5
+_STUCK_TOLERANCE = 1e-9
+_MIN_BASELINE_STD = 1.0
+
+
+def describe_health_flags(flags: int) -> str:
+    """Human-readable description of one channel's flags, e.g. 'stuck, saturated'"""
+    return ', '.join(name for bit, name in HEALTH_FLAG_NAMES.items() if flags & bit) or 'ok'
+
+
+class SensorHealthMonitor:
+    """
+    Streaming health state for every (location, sensor) channel
+
+    Args:
+        warmup: Readings used to learn each channel's baseline
+        stuck_run: Identical consecutive readings that flag a stuck sensor
+        saturation_run: Consecutive readings at 100% that flag saturation
+        cusum_k: CUSUM slack, in baseline standard deviations
+        cusum_h: CUSUM decision threshold, in baseline standard deviations
+        alpha: Smoothing factor of the per-channel EWMA
+    """
+
+    def __init__(self, warmup: int = 30, stuck_run: int = 5, saturation_run: int = 5,
+                 cusum_k: float = 1.0, cusum_h: float = 10.0, alpha: float = 0.1):
+        self.warmup = warmup
+        self.stuck_run = stuck_run
+        self.saturation_run = saturation_run
+        self.cusum_k = cusum_k
+        self.cusum_h = cusum_h
+        self.alpha = alpha
+
+        self.locations = []
+        self.codes: Dict[str, int] = {}
+        self._allocate(64)
+
+    def _allocate(self, capacity: int) -> None:
+        shape = (capacity, len(SENSOR_ORDER))
+        state = {
+            'count': np.zeros(shape, dtype=np.int64),
+            'last': np.full(shape, np.nan),
+            'stuck': np.zeros(shape, dtype=np.int64),        # Current run of identical mid-scale values
+            'saturated': np.zeros(shape, dtype=np.int64),    # Current run at 100%
+            'base_mean': np.zeros(shape),                    # Welford baseline over warmup
+            'base_m2': np.zeros(shape),
+            'cusum_pos': np.zeros(shape),
+            'cusum_neg': np.zeros(shape),
+            'ewma': np.zeros(shape),
+            'flags': np.zeros(shape, dtype=np.uint8)
+        }
+        n = len(self.locations)
+        for name, array in state.items():
+            if n:
+                array[:n] = getattr(self, name)[:n]
+            setattr(self, name, array)
+
+    def _code(self, location: str) -> int:
+        code = self.codes.get(location)
+        if code is None:
+            code = len(self.locations)
+            if code == len(self.count):
+                self._allocate(2 * code)
+            self.locations.append(location)
+            self.codes[location] = code
+        return code
+
+    def _update_rows(self, rows: np.ndarray, x: np.ndarray) -> None:
+        """Fold one reading into each of the given (distinct) locations"""
+        seen = np.isfinite(x)
+        count = self.count[rows] + seen
+        last = self.last[rows]
+
+        at_floor = x <= _SATURATION_MARGIN
+        at_top = x >= 100 - _SATURATION_MARGIN
+        same = seen & ~at_floor & ~at_top & (np.abs(x - last) <= _STUCK_TOLERANCE)
+        stuck = np.where(same, self.stuck[rows] + 1, np.where(seen, 1, self.stuck[rows]))
+        saturated = np.where(seen, np.where(at_top, self.saturated[rows] + 1, 0),
+                             self.saturated[rows])
+
+        # Baseline (Welford) during warmup, CUSUM afterwards
+        learning = seen & (count <= self.warmup)
+        base_mean = self.base_mean[rows]
+        base_m2 = self.base_m2[rows]
+        delta = np.where(learning, x - base_mean, 0.0)
+        base_mean = base_mean + np.where(learning, delta / np.maximum(count, 1), 0.0)
+        base_m2 = base_m2 + np.where(learning, delta * (x - base_mean), 0.0)
+
+        base_std = np.sqrt(base_m2 / np.maximum(self.warmup - 1, 1))
+        z = (x - base_mean) / np.maximum(base_std, _MIN_BASELINE_STD)
+        monitoring = seen & (count > self.warmup)
+        cusum_pos = np.where(monitoring, np.maximum(0.0, self.cusum_pos[rows] + z - self.cusum_k),
+                             self.cusum_pos[rows])
+        cusum_neg = np.where(monitoring, np.maximum(0.0, self.cusum_neg[rows] - z - self.cusum_k),
+                             self.cusum_neg[rows])
+
+        ewma = self.ewma[rows]
+        ewma = np.where(seen, np.where(count == 1, x, ewma + self.alpha * (x - ewma)), ewma)
+
+        flags = (np.where(stuck >= self.stuck_run, HEALTH_STUCK, 0)
+                 | np.where(saturated >= self.saturation_run, HEALTH_SATURATED, 0)
+                 | np.where(np.maximum(cusum_pos, cusum_neg) > self.cusum_h, HEALTH_DRIFT, 0))
+
+        self.count[rows] = count
+        self.last[rows] = np.where(seen, x, last)
+        self.stuck[rows] = stuck
+        self.saturated[rows] = saturated
+        self.base_mean[rows] = base_mean
+        self.base_m2[rows] = base_m2
+        self.cusum_pos[rows] = cusum_pos
+        self.cusum_neg[rows] = cusum_neg
+        self.ewma[rows] = ewma
+        self.flags[rows] = flags
+
+    def update(self, locations, matrix: np.ndarray) -> np.ndarray:
+        """
+        Fold a batch of readings into the channel state
+
+        Readings of the same location are applied in order; distinct
+        locations are updated together in one vectorized step.
+
+        Args:
+            locations: Location names, one per reading
+            matrix: (N, 7) sensor readings in SENSOR_ORDER (NaN = not read)
+
+        Returns:
+            np.ndarray: (N, 7) uint8 health flags of each reading's channels
+            right after that reading
+        """
+        matrix = np.asarray(matrix, dtype=np.float64)
+        names, inverse = np.unique(np.asarray(locations, dtype=object).astype(str),
+                                   return_inverse=True)
+        codes = np.array([self._code(name) for name in names], dtype=np.intp)[inverse]
+        result = np.zeros(matrix.shape, dtype=np.uint8)
+        if len(codes) == 0:
+            return result
+
+        # Occurrence rank of each reading within its location
+        order = np.argsort(codes, kind='stable')
+        sorted_codes = codes[order]
+        starts = np.r_[0, np.flatnonzero(sorted_codes[1:] != sorted_codes[:-1]) + 1]
+        rank = np.empty(len(codes), dtype=np.int64)
+        rank[order] = np.arange(len(codes)) - np.repeat(starts, np.diff(np.r_[starts, len(codes)]))
+
+        for r in range(int(rank.max()) + 1):
+            batch = np.flatnonzero(rank == r)
+            rows = codes[batch]
+            self._update_rows(rows, matrix[batch])
+            result[batch] = self.flags[rows]
+        return result
+
+    def reset(self, location: str, sensor: Optional[str] = None) -> None:
+        """Forget a channel's history (e.g. after recalibration or repair)"""
+        k = self.codes.get(location)
+        if k is None:
+            return
+        columns = slice(None) if sensor is None else SENSOR_ORDER.index(sensor)
+        for name in ('count', 'stuck', 'saturated', 'base_mean', 'base_m2',
+                     'cusum_pos', 'cusum_neg', 'ewma', 'flags'):
+            getattr(self, name)[k, columns] = 0
+        self.last[k, columns] = np.nan
+
+    def report(self, unhealthy_only: bool = True) -> pd.DataFrame:
+        """
+        Per-channel health table
+
+        Args:
+            unhealthy_only: Only include flagged channels
+
+        Returns:
+            DataFrame with location, sensor, readings, flags, status, ewma,
+            baseline and cusum columns
+        """
+        n = len(self.locations)
+        frame = pd.DataFrame({
+            'location': np.repeat(np.asarray(self.locations, dtype=object), len(SENSOR_ORDER)),
+            'sensor': np.tile(np.asarray(SENSOR_ORDER, dtype=object), n),
+            'readings': self.count[:n].ravel(),
+            'flags': self.flags[:n].ravel(),
+            'ewma': np.round(self.ewma[:n].ravel(), 2),
+            'baseline': np.round(self.base_mean[:n].ravel(), 2),
+            'cusum': np.round(np.maximum(self.cusum_pos[:n], self.cusum_neg[:n]).ravel(), 2)
+        })
+        if unhealthy_only:
+            frame = frame[frame['flags'] != HEALTH_OK].reset_index(drop=True)
+        frame.insert(4, 'status', [describe_health_flags(int(f)) for f in frame['flags']])
+        return frame
+
+
+def unreliable_channels(flags: np.ndarray) -> np.ndarray:
+    """(N, 7) mask of stuck or drifting channels, for NetraAI.score_batch(ignore=...)"""
+    return (np.asarray(flags) & UNRELIABLE_FLAGS) != 0
+
+
+def health_confidence(flags: np.ndarray) -> np.ndarray:
+    """
+    Confidence multiplier of each reading from its channels' health
+
+    Every stuck or drifting channel costs UNHEALTHY_CHANNEL_PENALTY of its
+    1/7 share; saturation alone costs nothing.
+
+    Args:
+        flags: (N, 7) health flags from SensorHealthMonitor.update
+
+    Returns:
+        np.ndarray: Factors in [1 - UNHEALTHY_CHANNEL_PENALTY, 1]
+    """
+    unhealthy = unreliable_channels(flags).sum(axis=1)
+    return 1.0 - UNHEALTHY_CHANNEL_PENALTY * unhealthy / len(SENSOR_ORDER)
+
+
+def describe_row_health(flags: np.ndarray) -> np.ndarray:
+    """
+    Describe the unhealthy channels of each reading
+
+    Args:
+        flags: (N, 7) health flags from SensorHealthMonitor.update
+
+    Returns:
+        np.ndarray: One string per reading, e.g. 'metal: stuck; thermal: drift'
+    """
+    flags = np.asarray(flags)
+    return np.array([
+        '; '.join(f"{sensor}: {describe_health_flags(int(f))}"
+                  for sensor, f in zip(SENSOR_ORDER, row) if f)
+        for row in flags
+    ], dtype=object)
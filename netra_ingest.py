@@ -0,0 +1,421 @@
+"""
+N.E.T.R.A. Streaming Ingestion Pipeline
+
+Tails a growing sensor feed with the sensor_readings_live.csv schema
+(Timestamp, Location_ID, Location, State, Latitude, Longitude, fume ... thermal;
+feeds with only coordinates are resolved to the nearest known site),
+groups rows into micro-batches by size or time, scores each batch through
+NetraAI and appends the results to the engine's threat log. A row's own
+Timestamp places it in the engine's trend windows and location posteriors,
+so replayed or late feeds are attributed to when they were read.
+
+Every stage is a generator, so memory stays bounded by one micro-batch plus
+the engine's fixed-capacity history. An optional SensorHealthMonitor
+(netra_health.py) watches every (location, sensor) channel; readings from
+stuck, saturated or drifting channels are still scored and logged, with
+their health noted on the logged scan and reported per batch. Stuck or
+drifting channels are left out of the fusion and lower the reading's
+confidence. Only readings that fail validation are quarantined.
+
+Usage:
+    python netra_ingest.py sensor_readings_live.csv
+    python netra_ingest.py sensor_readings_live.csv --follow --batch-size 500
+    tail -f feed.csv | python netra_ingest.py -
+"""
+
+import io
+import os
+import csv
+import sys
+import time
+import codecs
+import select
+import argparse
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+from netra_bands import CRITICAL, classify
+from netra_core import (NetraAI, SENSOR_BAD_COORDINATES, SENSOR_MALFORMED, SENSOR_NO_LOCATION,
+                        SENSOR_NO_NEARBY_SITE, SENSOR_ORDER, SENSOR_OK, describe_sensor_errors,
+                        get_netra_instance)
+from netra_health import (HEALTH_OK, SensorHealthMonitor, describe_row_health, health_confidence,
+                          unreliable_channels)
+
+
+def tail_lines(path: str, follow: bool = False, poll_interval: float = 0.25,
+               idle_timeout: Optional[float] = None) -> Iterator[Optional[str]]:
+    """
+    Yield complete lines from a file, optionally following it as it grows
+
+    While following, None is yielded on every empty poll so downstream
+    stages can flush time-based batches without waiting for new data.
+
+    Args:
+        path: File to read
+        follow: Keep polling for appended lines after reaching EOF
+        poll_interval: Seconds between polls at EOF
+        idle_timeout: Stop following after this many seconds without data
+
+    Yields:
+        Lines including the trailing newline, or None on an idle poll
+    """
+    with open(path, 'r', newline='') as f:
+        partial = ''
+        last_data = time.monotonic()
+
+        while True:
+            line = f.readline()
+            if line.endswith('\n'):
+                yield partial + line
+                partial = ''
+                last_data = time.monotonic()
+                continue
+
+            # EOF, possibly in the middle of a line still being written
+            partial += line
+            if not follow:
+                if partial:
+                    yield partial
+                return
+            if idle_timeout is not None and time.monotonic() - last_data > idle_timeout:
+                return
+
+            yield None
+            time.sleep(poll_interval)
+
+
+def stream_lines(stream, poll_interval: float = 0.25,
+                 idle_timeout: Optional[float] = None) -> Iterator[Optional[str]]:
+    """
+    Yield complete lines from a pipe or terminal, with heartbeats while it is quiet
+
+    A blocking readline on a quiet pipe would hold back a partial
+    micro-batch indefinitely, so the descriptor is polled with select()
+    and None is yielded whenever poll_interval passes without data.
+
+    Args:
+        stream: Text stream with a file descriptor (e.g. sys.stdin)
+        poll_interval: Seconds to wait for data before a heartbeat
+        idle_timeout: Stop after this many seconds without data
+
+    Yields:
+        Lines including the trailing newline, or None on an idle poll
+    """
+    fd = stream.fileno()
+    decoder = codecs.getincrementaldecoder(getattr(stream, 'encoding', None) or 'utf-8')(errors='replace')
+    partial = ''
+    last_data = time.monotonic()
+
+    while True:
+        ready, _, _ = select.select([fd], [], [], poll_interval)
+        if not ready:
+            if idle_timeout is not None and time.monotonic() - last_data > idle_timeout:
+                return
+            yield None
+            continue
+
+        chunk = os.read(fd, 1 << 16)
+        if not chunk:
+            partial += decoder.decode(b'', final=True)
+            if partial:
+                yield partial
+            return
+        last_data = time.monotonic()
+
+        lines = (partial + decoder.decode(chunk)).split('\n')
+        partial = lines.pop()
+        for line in lines:
+            yield line + '\n'
+
+
+def micro_batches(lines: Iterable[Optional[str]], batch_size: int = 1000,
+                  max_latency: float = 1.0) -> Iterator[List[str]]:
+    """
+    Group lines into micro-batches by size or age
+
+    Args:
+        lines: Lines from tail_lines or stream_lines (None entries are idle heartbeats)
+        batch_size: Flush when this many lines are buffered
+        max_latency: Flush when the oldest buffered line is this many seconds old
+
+    Yields:
+        Lists of at most batch_size lines
+    """
+    batch = []
+    started = 0.0
+
+    for line in lines:
+        if line is not None and line.strip():
+            if not batch:
+                started = time.monotonic()
+            batch.append(line)
+
+        if batch and (len(batch) >= batch_size or time.monotonic() - started >= max_latency):
+            yield batch
+            batch = []
+
+    if batch:
+        yield batch
+
+
+def parse_batch(lines: List[str], columns: List[str]) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    Parse one micro-batch of CSV lines into a DataFrame
+
+    Args:
+        lines: Raw CSV data lines (no header, no blank lines)
+        columns: Column names from the feed header
+
+    Returns:
+        Tuple of (parsed rows with the feed columns, malformed lines with
+        more fields than the header: their leading fields in the feed
+        columns plus the whole line in 'Raw')
+    """
+    df = pd.read_csv(io.StringIO(''.join(lines)), header=None, names=columns,
+                     on_bad_lines='skip')
+
+    # The C parser drops over-long lines silently; find them only when some went missing
+    malformed = []
+    if len(df) < len(lines):
+        for line in lines:
+            fields = next(csv.reader([line]), [])
+            if len(fields) > len(columns):
+                malformed.append(fields[:len(columns)] + [line.rstrip('\r\n')])
+    return df, pd.DataFrame(malformed, columns=[*columns, 'Raw'])
+
+
+def quarantine_rows(rows: pd.DataFrame, codes, path: str) -> None:
+    """
+    Append rejected readings to a side file with their error codes
+
+    Args:
+        rows: Rejected feed rows (malformed lines carry their text in 'Raw')
+        codes: Error codes from NetraAI.validate_sensor_batch
+        path: Quarantine CSV (header written when the file is new)
+    """
+    if 'Raw' not in rows.columns:
+        rows = rows.assign(Raw='')
+    rows = rows.assign(Error_Code=codes, Errors=describe_sensor_errors(codes))
+    rows.to_csv(path, mode='a', header=not os.path.exists(path), index=False)
+
+
+def ingest(engine: NetraAI, lines: Iterable[Optional[str]], batch_size: int = 1000,
+           max_latency: float = 1.0, quarantine_path: Optional[str] = None,
+           health: Optional[SensorHealthMonitor] = None,
+           max_site_km: Optional[float] = None) -> Iterator[Dict]:
+    """
+    Score a sensor feed in micro-batches and log the results
+
+    The first line of the feed must be the CSV header. Each batch is
+    validated row by row; invalid readings are skipped (and written to the
+    quarantine file if one is given) while the rest are scored. With a
+    health monitor, valid readings also update their channels' health;
+    readings with an unhealthy channel are scored and logged like the rest,
+    with the health noted on the logged scan and listed in the batch
+    summary. Stuck or drifting channels are scored as not read and lower
+    the reading's confidence (see health_confidence).
+
+    Args:
+        engine: NetraAI instance that scores and logs the readings
+        lines: Feed lines, e.g. from tail_lines or a pipe/socket file object
+        batch_size: Maximum rows per micro-batch
+        max_latency: Maximum seconds a row waits before its batch is flushed
+        quarantine_path: CSV that receives rejected rows with error codes
+        health: Sensor health monitor fed with every valid reading
+        max_site_km: Coordinate-only feeds: readings further than this from
+            every known site are rejected instead of attributed to one
+            (None = netra_spatial.MAX_SITE_DISTANCE_KM)
+
+    Yields:
+        Per-batch summary with running throughput in rows per second, plus
+        'flagged': DataFrame (seq, location, health) of logged readings
+        that had an unhealthy channel
+    """
+    lines = iter(lines)
+    header = next((line for line in lines if line), None)
+    if header is None:
+        return
+    columns = header.strip().split(',')
+
+    missing = set(SENSOR_ORDER) - set(columns)
+    if missing:
+        raise ValueError(f"Feed is missing sensor columns: {missing}")
+
+    if 'Location' in columns or 'Location_ID' in columns:
+        location_column = 'Location' if 'Location' in columns else 'Location_ID'
+    elif {'Latitude', 'Longitude'} <= set(columns):
+        location_column = None  # Resolved to the nearest known site per batch
+        from netra_spatial import MAX_SITE_DISTANCE_KM, get_spatial_index, valid_coordinates
+        spatial_index = get_spatial_index()
+        if max_site_km is None:
+            max_site_km = MAX_SITE_DISTANCE_KM
+    else:
+        raise ValueError("Feed needs a Location, Location_ID or Latitude/Longitude column")
+    total_rows = 0
+    total_rejected = 0
+    total_unhealthy = 0
+    start = time.perf_counter()
+
+    for batch_number, batch in enumerate(micro_batches(lines, batch_size, max_latency), 1):
+        df, malformed = parse_batch(batch, columns)
+        matrix, codes = engine.validate_sensor_batch(df)
+
+        if location_column:
+            # Blank locations are rejected rather than logged as 'nan'
+            names = df[location_column]
+            missing = (names.isna() | (names.astype(str).str.strip() == '')).to_numpy()
+            codes = codes | np.where(missing, SENSOR_NO_LOCATION, 0).astype(codes.dtype)
+            locations = np.where(missing, '', names.astype(object).to_numpy())
+        else:
+            # Blank, non-numeric or out-of-range coordinates, and readings with no site
+            # within max_site_km, get no site and are rejected
+            lat = pd.to_numeric(df['Latitude'], errors='coerce').to_numpy()
+            lon = pd.to_numeric(df['Longitude'], errors='coerce').to_numpy()
+            sites, _ = spatial_index.nearest_many(lat, lon, max_site_km)
+            usable = valid_coordinates(lat, lon)
+            codes = codes | np.select([~usable, sites < 0], [SENSOR_BAD_COORDINATES, SENSOR_NO_NEARBY_SITE],
+                                      0).astype(codes.dtype)
+            locations = np.where(sites >= 0, spatial_index.sites['name'].to_numpy()[np.maximum(sites, 0)], '')
+        valid = codes == SENSOR_OK
+        timestamps = (pd.to_datetime(df['Timestamp'], errors='coerce', utc=True)
+                      if 'Timestamp' in df.columns else None)
+
+        rejected = len(batch) - int(valid.sum())
+        if rejected and quarantine_path:
+            if not valid.all():
+                quarantine_rows(df[~valid], codes[~valid], quarantine_path)
+            if len(malformed):
+                quarantine_rows(malformed, np.full(len(malformed), SENSOR_MALFORMED, dtype=np.uint8),
+                                quarantine_path)
+
+        critical = 0
+        max_probability = 0.0
+        unhealthy = 0
+        flagged_rows = pd.DataFrame(columns=['seq', 'location', 'health'])
+        if valid.any():
+            # Stuck or drifting channels are scored as not read; no reading is dropped for its health
+            ignore = None
+            notes = None
+            if health is not None:
+                flags = health.update(locations[valid], matrix[valid])
+                flagged = (flags != HEALTH_OK).any(axis=1)
+                ignore = unreliable_channels(flags)
+                notes = np.full(len(flags), '', dtype=object)
+                notes[flagged] = describe_row_health(flags[flagged])
+
+            scores = engine.score_batch(matrix[valid], ignore)
+            probabilities = scores['probability'].to_numpy()
+            confidences = scores['confidence'].to_numpy()
+            if health is not None:
+                confidences = np.round(confidences * health_confidence(flags), 2)
+
+            seq = engine.log_threat_batch(
+                locations[valid], probabilities, matrix[valid], confidences, notes,
+                timestamps[valid] if timestamps is not None else None
+            )
+            if notes is not None and flagged.any():
+                unhealthy = int(flagged.sum())
+                flagged_rows = pd.DataFrame({
+                    'seq': seq[flagged],
+                    'location': locations[valid][flagged],
+                    'health': notes[flagged]
+                })
+            critical = int((classify(probabilities) == CRITICAL).sum())
+            max_probability = float(probabilities.max())
+
+        total_rows += len(batch)
+        total_rejected += rejected
+        total_unhealthy += unhealthy
+        elapsed = time.perf_counter() - start
+
+        yield {
+            'batch': batch_number,
+            'rows': len(batch),
+            'rejected': rejected,
+            'unhealthy': unhealthy,
+            'flagged': flagged_rows,
+            'total_rows': total_rows,
+            'total_rejected': total_rejected,
+            'total_unhealthy': total_unhealthy,
+            'critical': critical,
+            'max_probability': max_probability,
+            'elapsed': elapsed,
+            'rows_per_second': total_rows / elapsed if elapsed > 0 else 0.0
+        }
+
+
+def open_feed(source: Union[str, io.TextIOBase], follow: bool = False,
+              poll_interval: float = 0.25,
+              idle_timeout: Optional[float] = None) -> Iterable[Optional[str]]:
+    """
+    Open a feed from a file path or an already-open text stream
+
+    Args:
+        source: CSV path, '-' for stdin, or a file object (pipe, socket.makefile())
+        follow: Tail the file as it grows (paths only)
+        poll_interval: Seconds between polls at EOF (paths) or for data (stdin)
+        idle_timeout: Stop following after this many idle seconds
+    """
+    if source == '-':
+        # select() only handles sockets on Windows, where stdin is read without heartbeats
+        if os.name == 'nt':
+            return sys.stdin
+        return stream_lines(sys.stdin, poll_interval, idle_timeout)
+    if isinstance(source, str):
+        return tail_lines(source, follow, poll_interval, idle_timeout)
+    return source
+
+
+def main():
+    parser = argparse.ArgumentParser(description="N.E.T.R.A. streaming sensor ingestion")
+    parser.add_argument('source', help="Sensor CSV path, or '-' for stdin")
+    parser.add_argument('--follow', action='store_true', help="Keep tailing the file as it grows")
+    parser.add_argument('--batch-size', type=int, default=1000, help="Rows per micro-batch")
+    parser.add_argument('--max-latency', type=float, default=1.0, help="Max seconds before a batch is flushed")
+    parser.add_argument('--idle-timeout', type=float, default=None, help="Stop following after N idle seconds")
+    parser.add_argument('--quarantine', default='netra_quarantine.csv', help="CSV for rejected readings")
+    parser.add_argument('--no-health', action='store_true', help="Disable stuck/saturated/drift sensor flags")
+    parser.add_argument('--max-site-km', type=float, default=None,
+                        help="Reject coordinate-only readings further than this from every site (default 50)")
+    parser.add_argument('--export', default=None, help="Export the threat log to this CSV when done")
+    args = parser.parse_args()
+
+    if args.source != '-' and not os.path.exists(args.source):
+        print(f"❌ Error: File not found: {args.source}")
+        return 1
+
+    engine = get_netra_instance()
+    feed = open_feed(args.source, args.follow, idle_timeout=args.idle_timeout)
+    health = None if args.no_health else SensorHealthMonitor()
+
+    print(f"📡 Ingesting {args.source} (batch size {args.batch_size}, max latency {args.max_latency}s)")
+    summary = None
+    try:
+        for summary in ingest(engine, feed, args.batch_size, args.max_latency, args.quarantine,
+                              health, args.max_site_km):
+            print(f"  ✓ Batch {summary['batch']}: {summary['rows']} rows, "
+                  f"{summary['critical']} critical, {summary['rejected']} rejected | "
+                  f"{summary['rows_per_second']:,.0f} rows/s")
+    except KeyboardInterrupt:
+        print("\n⏹️ Ingestion stopped")
+
+    if summary:
+        print(f"\n✅ Processed {summary['total_rows']} readings in {summary['elapsed']:.2f}s "
+              f"({summary['rows_per_second']:,.0f} rows/s)")
+        if summary['total_rejected']:
+            print(f"⚠️ {summary['total_rejected']} rejected readings quarantined to {args.quarantine}")
+        if health is not None and summary['total_unhealthy']:
+            report = health.report()
+            print(f"🩺 {summary['total_unhealthy']} readings scored with unhealthy channels "
+                  f"(stuck/drifting channels left out of fusion), {len(report)} unhealthy sensor channels:")
+            for row in report.head(10).itertuples():
+                print(f"   - {row.location} / {row.sensor}: {row.status}")
+        if args.export:
+            print(f"📁 Saved to: {engine.export_history_to_csv(args.export)}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
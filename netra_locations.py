@@ -0,0 +1,237 @@
+"""
+N.E.T.R.A. Location Registry
+
+Single source of truth for strategic sites. The hard-coded NE_LOCATIONS
+table and locations_northeast_india.csv are merged once into one site
+table; every key, Location_ID and name (including the CSV name of a merged
+NE_LOCATIONS site) maps to its row in a hash table, so single lookups are
+O(1) and joining a whole DataFrame of location names is one vectorized
+hash lookup instead of a per-row scan.
+
+Usage:
+    from netra_locations import get_location_registry
+    registry = get_location_registry()
+    site = registry.get('LOC_014')
+    df = registry.join(threat_log, 'Location', ['lat', 'lon'])
+"""
+
+import os
+import threading
+from typing import Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+
+# North-East India Strategic Locations Database
+NE_LOCATIONS = {
+    'Guwahati_Airport': {
+        'lat': 26.1061,
+        'lon': 91.5859,
+        'name': 'Guwahati Airport Road, Assam',
+        'state': 'Assam',
+        'type': 'Critical Infrastructure'
+    },
+    'Imphal_City': {
+        'lat': 24.8170,
+        'lon': 93.9368,
+        'name': 'Imphal City Center, Manipur',
+        'state': 'Manipur',
+        'type': 'Urban Center'
+    },
+    'Kohima_NH29': {
+        'lat': 25.6747,
+        'lon': 94.1078,
+        'name': 'Kohima NH-29, Nagaland',
+        'state': 'Nagaland',
+        'type': 'Highway'
+    },
+    'Shillong_Bypass': {
+        'lat': 25.5788,
+        'lon': 91.8933,
+        'name': 'Shillong Bypass Road, Meghalaya',
+        'state': 'Meghalaya',
+        'type': 'Highway'
+    },
+    'Agartala_Station': {
+        'lat': 23.8315,
+        'lon': 91.2868,
+        'name': 'Agartala Railway Station, Tripura',
+        'state': 'Tripura',
+        'type': 'Critical Infrastructure'
+    },
+    'Itanagar_Zero': {
+        'lat': 27.0844,
+        'lon': 93.6053,
+        'name': 'Itanagar Zero Point, Arunachal Pradesh',
+        'state': 'Arunachal Pradesh',
+        'type': 'Urban Center'
+    },
+    'Aizawl_NH54': {
+        'lat': 23.7271,
+        'lon': 92.7176,
+        'name': 'Aizawl NH-54, Mizoram',
+        'state': 'Mizoram',
+        'type': 'Highway'
+    },
+    'Dimapur_Junction': {
+        'lat': 25.9097,
+        'lon': 93.7267,
+        'name': 'Dimapur Junction, Nagaland',
+        'state': 'Nagaland',
+        'type': 'Critical Infrastructure'
+    },
+    'Silchar_Medical': {
+        'lat': 24.8333,
+        'lon': 92.7789,
+        'name': 'Silchar Medical College Road, Assam',
+        'state': 'Assam',
+        'type': 'Medical Facility'
+    },
+    'Tinsukia_Border': {
+        'lat': 27.4900,
+        'lon': 95.3600,
+        'name': 'Tinsukia Border Checkpoint, Assam',
+        'state': 'Assam',
+        'type': 'Border Area'
+    }
+}
+
+
+LOCATIONS_CSV = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                             'locations_northeast_india.csv')
+
+SITE_COLUMNS = ['key', 'location_id', 'name', 'state', 'type', 'lat', 'lon',
+                'population', 'risk_zone']
+
+# locations_northeast_india.csv column -> site column
+_CSV_COLUMNS = {
+    'Location_ID': 'location_id', 'Location': 'name', 'State': 'state', 'Type': 'type',
+    'Latitude': 'lat', 'Longitude': 'lon', 'Population': 'population', 'Risk_Zone': 'risk_zone'
+}
+
+
+class LocationRegistry:
+    """
+    Site table with O(1) lookup by key, Location_ID or name
+
+    Args:
+        sites: Site table with SITE_COLUMNS (see load_sites)
+        aliases: Extra names mapped to site row indices
+    """
+
+    def __init__(self, sites: pd.DataFrame, aliases: Optional[Dict[str, int]] = None):
+        self.sites = sites.reset_index(drop=True)
+
+        self._rows: Dict[str, int] = dict(aliases or {})
+        for column in ('name', 'location_id', 'key'):
+            self._rows.update((value, i) for i, value in enumerate(self.sites[column])
+                              if isinstance(value, str))
+
+    def __len__(self) -> int:
+        return len(self.sites)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._rows
+
+    def index_of(self, name: str) -> int:
+        """Site row index for a key, Location_ID or name (-1 if unknown)"""
+        return self._rows.get(name, -1)
+
+    def get(self, name: str) -> Optional[Dict]:
+        """Site record for a key, Location_ID or name (None if unknown)"""
+        index = self._rows.get(name)
+        return None if index is None else self.sites.iloc[index].to_dict()
+
+    def attribute(self, name: str, column: str, default=None):
+        """One site column for a key, Location_ID or name (default if unknown)"""
+        index = self._rows.get(name)
+        return default if index is None else self.sites[column].iat[index]
+
+    def codes(self, names) -> np.ndarray:
+        """Site row indices for an array of names in one hash lookup (-1 if unknown)"""
+        return pd.Series(names, dtype=object).map(self._rows).fillna(-1).to_numpy(dtype=np.intp)
+
+    def join(self, df: pd.DataFrame, on: str, columns: Optional[List[str]] = None,
+             how: str = 'left') -> pd.DataFrame:
+        """
+        Attach site columns to a DataFrame by location name, ID or key
+
+        Args:
+            df: Rows to enrich
+            on: Column of df holding location names, IDs or keys
+            columns: Site columns to attach (default: all but the match column)
+            how: 'left' keeps unknown locations with NaN site columns,
+                'inner' drops them
+
+        Returns:
+            DataFrame with the site columns added (prefixed 'site_' where
+            they clash with existing columns)
+        """
+        codes = self.codes(df[on])
+        found = codes >= 0
+        if how == 'inner':
+            df, codes, found = df[found], codes[found], found[found]
+        else:
+            df = df.copy()
+
+        for column in columns or SITE_COLUMNS:
+            values = self.sites[column].to_numpy()[np.where(found, codes, 0)]
+            if not found.all():
+                values = np.where(found, values, None if values.dtype == object else np.nan)
+            df['site_' + column if column in df.columns else column] = values
+        return df
+
+
+def load_sites(csv_path: Optional[str] = LOCATIONS_CSV) -> LocationRegistry:
+    """
+    Build the registry from NE_LOCATIONS and the locations CSV
+
+    A CSV row at the same coordinates as an NE_LOCATIONS entry is merged
+    into it: the entry keeps its key and name and gains the CSV Location_ID
+    and attributes, and the CSV name becomes an alias.
+
+    Args:
+        csv_path: locations_northeast_india.csv-style file (None = NE_LOCATIONS only)
+
+    Returns:
+        LocationRegistry over all sites
+    """
+    sites = pd.DataFrame([
+        {'key': key, 'location_id': None, 'name': info['name'], 'state': info['state'],
+         'type': info['type'], 'lat': info['lat'], 'lon': info['lon'],
+         'population': None, 'risk_zone': None}
+        for key, info in NE_LOCATIONS.items()
+    ], columns=SITE_COLUMNS)
+    aliases = {}
+
+    if csv_path and os.path.exists(csv_path):
+        csv = pd.read_csv(csv_path).rename(columns=_CSV_COLUMNS).reindex(columns=SITE_COLUMNS)
+        csv['key'] = csv['location_id']
+
+        known = dict(zip(zip(sites['lat'].round(4), sites['lon'].round(4)), sites.index))
+        matches = pd.Series(list(zip(csv['lat'].round(4), csv['lon'].round(4)))).map(known)
+        duplicate = matches.notna().to_numpy()
+        rows = matches[duplicate].astype(int).to_numpy()
+
+        merged = csv.loc[duplicate]
+        for column in ('location_id', 'population', 'risk_zone'):
+            sites.loc[rows, column] = merged[column].to_numpy()
+        aliases = dict(zip(merged['name'], rows))
+
+        sites = pd.concat([sites, csv.loc[~duplicate]], ignore_index=True)
+
+    return LocationRegistry(sites, aliases)
+
+
+_location_registry = None
+_location_registry_lock = threading.Lock()
+
+def get_location_registry() -> LocationRegistry:
+    """Get or build the shared location registry (thread-safe)"""
+    global _location_registry
+    if _location_registry is None:
+        with _location_registry_lock:
+            if _location_registry is None:
+                _location_registry = load_sites()
+    return _location_registry
@@ -0,0 +1,235 @@
+"""
+N.E.T.R.A. Latency Metrics
+
+Process-wide latency histograms for hot paths. Durations are recorded into
+log-spaced buckets (8 per power of two from 1 µs, so percentiles are
+accurate to within ~9%) and summarized as call counts, mean, p50/p95/p99
+and max.
+
+Instrumentation is off by default (set NETRA_METRICS=1 or call enable()).
+Two ways to instrument:
+    timed(name)          decorator; when disabled it costs one flag check
+    instrument(cls)      wraps a class's public methods only while enabled,
+                         so disabled classes run their original methods
+
+Usage:
+    from netra_metrics import get_metrics, timed
+    metrics = get_metrics()
+    metrics.instrument(NetraAI)
+    metrics.enable()
+    ...
+    print(metrics.snapshot())
+    metrics.dump_json('netra_metrics.json')
+"""
+
+import os
+import json
+import math
+import time
+import inspect
+import threading
+from datetime import datetime
+from functools import wraps
+from typing import Dict, Iterable, Optional
+
+import numpy as np
+import pandas as pd
+
+
+# Bucket i holds durations in [2 ** (i / SUBBUCKETS), 2 ** ((i + 1) / SUBBUCKETS)) µs
+SUBBUCKETS = 8
+BUCKETS = 30 * SUBBUCKETS  # Up to 2**30 µs (~18 minutes); longer calls land in the last bucket
+
+PERCENTILES = (50, 95, 99)
+
+
+class LatencyHistogram:
+    """Call count, total and log-bucketed distribution of one operation's latency"""
+
+    def __init__(self):
+        self.counts = [0] * BUCKETS
+        self.calls = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def record(self, seconds: float) -> None:
+        micros = seconds * 1e6
+        index = int(math.log2(micros) * SUBBUCKETS) if micros > 1 else 0
+        self.counts[min(index, BUCKETS - 1)] += 1
+        self.calls += 1
+        self.total += seconds
+        if seconds > self.max:
+            self.max = seconds
+
+    def percentile(self, q: float) -> float:
+        """Latency (seconds) below which q% of calls fall, at bucket resolution"""
+        if not self.calls:
+            return 0.0
+        cumulative = np.cumsum(self.counts)
+        index = int(np.searchsorted(cumulative, q / 100 * self.calls))
+        upper = 2 ** ((index + 1) / SUBBUCKETS) / 1e6
+        return min(upper, self.max)
+
+    def summary(self) -> Dict:
+        summary = {
+            'calls': self.calls,
+            'total_ms': round(self.total * 1e3, 3),
+            'mean_ms': round(self.total / self.calls * 1e3, 4) if self.calls else 0.0
+        }
+        for q in PERCENTILES:
+            summary[f'p{q}_ms'] = round(self.percentile(q) * 1e3, 4)
+        summary['max_ms'] = round(self.max * 1e3, 4)
+        return summary
+
+
+class MetricsRegistry:
+    """
+    Named latency histograms plus the instrumented classes they come from
+
+    Args:
+        enabled: Start with instrumentation on
+    """
+
+    def __init__(self, enabled: bool = False):
+        self.enabled = False
+        self._histograms: Dict[str, LatencyHistogram] = {}
+        self._lock = threading.Lock()
+        self._instrumented = {}  # (class, method name) -> original function
+        if enabled:
+            self.enable()
+
+    def record(self, name: str, seconds: float) -> None:
+        """Add one call's duration to a histogram"""
+        with self._lock:
+            histogram = self._histograms.get(name)
+            if histogram is None:
+                histogram = self._histograms[name] = LatencyHistogram()
+            histogram.record(seconds)
+
+    def timer(self, name: str):
+        """Context manager that records the duration of its block (if enabled)"""
+        return _Timer(self, name)
+
+    def _wrap(self, name: str, func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                self.record(name, time.perf_counter() - start)
+        return wrapper
+
+    def instrument(self, cls: type, methods: Optional[Iterable[str]] = None,
+                   prefix: Optional[str] = None) -> None:
+        """
+        Time a class's methods while instrumentation is enabled
+
+        Args:
+            cls: Class to instrument
+            methods: Method names (default: all public instance methods)
+            prefix: Histogram name prefix (default: the class name)
+        """
+        if methods is None:
+            methods = [name for name, value in vars(cls).items()
+                       if inspect.isfunction(value) and not name.startswith('_')]
+        prefix = prefix or cls.__name__
+
+        with self._lock:
+            for method in methods:
+                if (cls, method) not in self._instrumented:
+                    self._instrumented[(cls, method)] = (f"{prefix}.{method}", vars(cls)[method])
+        if self.enabled:
+            self._patch()
+
+    def _patch(self) -> None:
+        for (cls, method), (name, func) in self._instrumented.items():
+            if vars(cls)[method] is func:
+                setattr(cls, method, self._wrap(name, func))
+
+    def enable(self) -> None:
+        """Start recording (wraps instrumented classes)"""
+        self.enabled = True
+        self._patch()
+
+    def disable(self) -> None:
+        """Stop recording (restores instrumented classes; histograms are kept)"""
+        self.enabled = False
+        for (cls, method), (_, func) in self._instrumented.items():
+            setattr(cls, method, func)
+
+    def reset(self) -> None:
+        """Drop all recorded histograms"""
+        with self._lock:
+            self._histograms.clear()
+
+    def to_dict(self) -> Dict:
+        """Summary of every histogram, keyed by name"""
+        with self._lock:
+            return {name: histogram.summary() for name, histogram in sorted(self._histograms.items())}
+
+    def snapshot(self) -> pd.DataFrame:
+        """Summary of every histogram as a DataFrame indexed by operation, slowest total first"""
+        summary = self.to_dict()
+        columns = ['calls', 'total_ms', 'mean_ms', *(f'p{q}_ms' for q in PERCENTILES), 'max_ms']
+        if not summary:
+            return pd.DataFrame(columns=columns)
+        frame = pd.DataFrame.from_dict(summary, orient='index')[columns]
+        frame.index.name = 'operation'
+        return frame.sort_values('total_ms', ascending=False)
+
+    def dump_json(self, path: str) -> str:
+        """
+        Write all histogram summaries to a JSON file
+
+        Returns:
+            str: Path to saved file
+        """
+        with open(path, 'w') as f:
+            json.dump({
+                'generated_at': datetime.utcnow().isoformat(timespec='seconds'),
+                'enabled': self.enabled,
+                'metrics': self.to_dict()
+            }, f, indent=2)
+        return path
+
+
+class _Timer:
+    def __init__(self, registry: MetricsRegistry, name: str):
+        self.registry = registry
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter() if self.registry.enabled else None
+        return self
+
+    def __exit__(self, *exc):
+        if self.start is not None:
+            self.registry.record(self.name, time.perf_counter() - self.start)
+
+
+_metrics = MetricsRegistry(enabled=os.environ.get('NETRA_METRICS', '').lower() in ('1', 'true', 'yes'))
+
+def get_metrics() -> MetricsRegistry:
+    """Get the process-wide metrics registry"""
+    return _metrics
+
+
+def timed(name: str):
+    """
+    Decorator recording a function's latency under the given name
+
+    When instrumentation is disabled the wrapper only checks a flag.
+    """
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            if not _metrics.enabled:
+                return func(*args, **kwargs)
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                _metrics.record(name, time.perf_counter() - start)
+        return wrapper
+    return decorator
@@ -0,0 +1,158 @@
+"""
+N.E.T.R.A. Threat Log Query Index
+
+Read-only index over the historical threat log for interactive filtering.
+It is built once per data version and never copies the log:
+- rows are ordered by timestamp, so a date range resolves to one slice of
+  that order with two binary searches (searchsorted)
+- State, Location and Threat_Level are stored as categorical codes, and
+  every (column, value) has a packed bitmap over the time-ordered rows
+  (one bit per row); category filters AND/OR the bitmap bytes of the
+  selected slice and unpack only that slice
+
+A query returns row positions into the original DataFrame; the caller takes
+just those rows (df.iloc[rows]).
+
+Usage:
+    index = ThreatLogIndex.from_threat_log(df)
+    rows = index.select(start='2025-10-01', end='2025-10-08', State='Assam', Threat_Level='CRITICAL')
+    df.iloc[rows]
+"""
+
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+
+INDEXED_COLUMNS = ('State', 'Location', 'Threat_Level')
+
+# Bitmaps built up front; other indexed columns get theirs on first use
+BITMAP_COLUMNS = ('State', 'Threat_Level')
+
+_NAT = np.iinfo(np.int64).min
+
+
+def _ticks(values) -> np.ndarray:
+    """Nanoseconds since the epoch (NaT = int64 min) of datetime-like values"""
+    return np.asarray(pd.to_datetime(values), dtype='datetime64[ns]').view(np.int64)
+
+
+class ThreatLogIndex:
+    """
+    Timestamp-sorted, category-bitmapped index of a threat log
+
+    Build with ThreatLogIndex.from_threat_log.
+    """
+
+    def __init__(self, order: np.ndarray, ticks: np.ndarray, dated: int,
+                 codes: Dict[str, np.ndarray], labels: Dict[str, pd.Index]):
+        self.order = order      # Row positions sorted by timestamp (NaT rows last)
+        self.ticks = ticks      # Sorted timestamps (ns) of the first `dated` entries of order
+        self.dated = dated
+        self.codes = codes      # Column -> category code per time-ordered row (-1 = missing)
+        self.labels = labels    # Column -> category labels
+        self._bitmaps: Dict[str, List[np.ndarray]] = {}
+
+    def __len__(self) -> int:
+        return len(self.order)
+
+    @classmethod
+    def from_threat_log(cls, df: pd.DataFrame, columns: Sequence[str] = INDEXED_COLUMNS) -> 'ThreatLogIndex':
+        """Index a netra_threat_log.csv-style DataFrame (Timestamp plus the given columns)"""
+        ticks = _ticks(df['Timestamp'])
+        dated = int((ticks != _NAT).sum())
+        # NaT is the smallest int64, so a stable sort puts it first; rotate it to the end
+        order = np.argsort(ticks, kind='stable')
+        order = np.roll(order, dated - len(order)) if dated < len(order) else order
+        order = order.astype(np.int32 if len(order) < 2 ** 31 else np.int64)
+
+        codes, labels = {}, {}
+        for column in columns:
+            if column not in df.columns:
+                continue
+            column_codes, column_labels = pd.factorize(df[column])
+            codes[column] = column_codes.astype(np.min_scalar_type(-len(column_labels)))[order]
+            labels[column] = pd.Index(column_labels)
+
+        index = cls(order, ticks[order[:dated]], dated, codes, labels)
+        for column in BITMAP_COLUMNS:
+            if column in codes:
+                index._column_bitmaps(column)
+        return index
+
+    def values(self, column: str) -> list:
+        """Category values of a column, in order of first appearance"""
+        return self.labels[column].tolist() if column in self.labels else []
+
+    def time_range(self):
+        """(first, last) timestamp as pd.Timestamp, or (None, None) without dated rows"""
+        if not self.dated:
+            return None, None
+        return pd.Timestamp(self.ticks[0]), pd.Timestamp(self.ticks[-1])
+
+    def _column_bitmaps(self, column: str) -> List[np.ndarray]:
+        # No lock (the index is pickled by st.cache_data): racing builds produce identical bitmaps
+        bitmaps = self._bitmaps.get(column)
+        if bitmaps is None:
+            codes = self.codes[column]
+            bitmaps = [np.packbits(codes == code) for code in range(len(self.labels[column]))]
+            self._bitmaps[column] = bitmaps
+        return bitmaps
+
+    def bitmap(self, column: str, value) -> Optional[np.ndarray]:
+        """Packed bitmap of the rows (time order) where column == value, None if it never does"""
+        location = self.labels[column].get_indexer([value])[0]
+        return self._column_bitmaps(column)[location] if location >= 0 else None
+
+    def time_slice(self, start=None, end=None) -> slice:
+        """
+        Positions in time order with start <= Timestamp < end
+
+        Args:
+            start: Inclusive lower bound (None = no bound)
+            end: Exclusive upper bound (None = no bound; NaT rows only match
+                when neither bound is given)
+        """
+        if start is None and end is None:
+            return slice(0, len(self.order))
+        lo = int(np.searchsorted(self.ticks, _ticks([start])[0], 'left')) if start is not None else 0
+        hi = int(np.searchsorted(self.ticks, _ticks([end])[0], 'left')) if end is not None else self.dated
+        return slice(lo, max(lo, hi))
+
+    def select(self, start=None, end=None, **filters) -> np.ndarray:
+        """
+        Row positions (into the indexed DataFrame) matching every filter, in log order
+
+        Args:
+            start: Inclusive earliest timestamp
+            end: Exclusive latest timestamp
+            **filters: Indexed column -> value, or list of accepted values
+
+        Returns:
+            np.ndarray of row positions for df.iloc / df.take
+        """
+        window = self.time_slice(start, end)
+        lo, hi = window.start, window.stop
+
+        mask = None
+        for column, accepted in filters.items():
+            if column not in self.codes:
+                raise KeyError(f"Column not indexed: {column}")
+            accepted = [accepted] if isinstance(accepted, str) or not np.iterable(accepted) else accepted
+
+            # OR the accepted values' bytes over the window, then AND across columns
+            matched = np.zeros(((hi + 7) >> 3) - (lo >> 3), dtype=np.uint8)
+            for value in accepted:
+                bitmap = self.bitmap(column, value)
+                if bitmap is not None:
+                    matched |= bitmap[lo >> 3:(hi + 7) >> 3]
+            mask = matched if mask is None else mask & matched
+
+        if mask is None:
+            positions = self.order[lo:hi]
+        else:
+            offset = lo & 7
+            bits = np.unpackbits(mask)[offset:offset + hi - lo]
+            positions = self.order[lo + np.flatnonzero(bits)]
+        return np.sort(positions)
@@ -0,0 +1,372 @@
+"""
+N.E.T.R.A. Replay Scorer
+
+Re-scores archived threat logs shaped like netra_threat_log.csv, e.g. after
+a sensor weight change. The input is split into byte ranges at line
+boundaries; each range is parsed, scored and sorted by a worker process
+with its own NetraAI engine, and written to a part file. The sorted parts
+are then k-way merged in timestamp order into the output log.
+
+Workers share nothing but the read-only input file, so throughput scales
+with the number of cores.
+
+Usage:
+    python netra_replay.py netra_threat_log.csv -o netra_threat_log_rescored.csv
+    python netra_replay.py big_log.csv -o rescored.csv --workers 8 --weights netra_weights.json
+    python netra_replay.py big_log.csv --benchmark
+    python netra_replay.py big_log.csv --check --chunk-mb 1
+    python netra_replay.py netra_threat_log.bin -o netra_threat_log_rescored.bin
+
+Binary logs (netra_binlog.py) are memory-mapped and re-scored in-process in
+record chunks; there is no parsing step to spread across workers.
+"""
+
+import io
+import os
+import sys
+import time
+import heapq
+import shutil
+import argparse
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from netra_bands import BAND_ACTIONS, BAND_NAMES, classify
+from netra_binlog import BinaryLogWriter, read_binlog
+from netra_core import NetraAI, LOG_SENSOR_COLUMNS
+
+
+# Per-process engine, created by _init_worker
+_ENGINE: Optional[NetraAI] = None
+
+
+def _init_worker(weights_file: Optional[str] = None) -> None:
+    """Create this worker's private engine"""
+    global _ENGINE
+    _ENGINE = NetraAI(history_capacity=1, weights_file=weights_file)
+
+
+def _replay_range(path: str, start: int, end: int, columns: List[str],
+                  part_path: str) -> Tuple[int, str, str]:
+    """
+    Score one byte range of the input and write it sorted by timestamp
+
+    Returns:
+        Tuple of (rows written, first timestamp, last timestamp); (0, None,
+        None) for a range holding only blank lines
+    """
+    with open(path, 'rb') as f:
+        f.seek(start)
+        data = f.read(end - start)
+
+    # Timestamps stay strings: the log format sorts lexicographically
+    df = pd.read_csv(io.BytesIO(data), header=None, names=columns, dtype={'Timestamp': str})
+    if df.empty:
+        return 0, None, None
+    scores = _ENGINE.score_batch(df[list(LOG_SENSOR_COLUMNS)].to_numpy())
+
+    bands = classify(scores['probability'].to_numpy())
+    df['Threat_Probability'] = scores['probability'].to_numpy()
+    df['Threat_Level'] = BAND_NAMES[bands]
+    if 'Action' in df.columns:
+        df['Action'] = BAND_ACTIONS[bands]
+    if 'Confidence' in df.columns:
+        df['Confidence'] = scores['confidence'].to_numpy()
+
+    df = df.sort_values('Timestamp', kind='stable')
+    df.to_csv(part_path, header=False, index=False)
+    return len(df), df['Timestamp'].iloc[0], df['Timestamp'].iloc[-1]
+
+
+def split_byte_ranges(path: str, chunk_bytes: int) -> Tuple[str, List[Tuple[int, int]]]:
+    """
+    Split a CSV file into line-aligned byte ranges
+
+    Args:
+        path: CSV file with a header line
+        chunk_bytes: Target size of each range
+
+    Returns:
+        Tuple of (header line, list of (start, end) byte offsets)
+    """
+    size = os.path.getsize(path)
+
+    with open(path, 'rb') as f:
+        header = f.readline().decode('utf-8-sig')
+        bounds = [f.tell()]
+
+        pos = bounds[0] + chunk_bytes
+        while pos < size:
+            f.seek(pos)
+            f.readline()  # Advance to the start of the next line
+            if f.tell() >= size:
+                break
+            bounds.append(f.tell())
+            pos = f.tell() + chunk_bytes
+
+    bounds.append(size)
+    ranges = [(start, end) for start, end in zip(bounds, bounds[1:]) if end > start]
+    return header, ranges
+
+
+def merge_parts(part_paths: List[str], spans: List[Tuple[str, str]], header: str,
+                output: str, timestamp_index: int) -> None:
+    """
+    Merge timestamp-sorted part files into one log
+
+    Parts whose timestamp spans do not overlap (the usual case for an
+    already time-ordered archive) are concatenated as raw bytes; otherwise
+    a k-way merge is used. Ties keep input order because heapq.merge is
+    stable across inputs.
+
+    Args:
+        part_paths: Sorted part files, in input order
+        spans: (first, last) timestamp of each part
+        header: CSV header line
+        output: Merged output path
+        timestamp_index: Column index of Timestamp
+    """
+    ordered = all(prev[1] <= cur[0] for prev, cur in zip(spans, spans[1:]))
+
+    if ordered:
+        with open(output, 'wb') as out:
+            out.write(header.encode())
+            for part in part_paths:
+                with open(part, 'rb') as f:
+                    shutil.copyfileobj(f, out, 1024 * 1024)
+        return
+
+    def timestamp(line: str) -> str:
+        return line.split(',', timestamp_index + 1)[timestamp_index]
+
+    files = [open(part, 'r', newline='') for part in part_paths]
+    try:
+        with open(output, 'w', newline='') as out:
+            out.write(header)
+            out.writelines(heapq.merge(*files, key=timestamp))
+    finally:
+        for f in files:
+            f.close()
+
+
+def replay(input_path: str, output_path: str, workers: Optional[int] = None,
+           weights_file: Optional[str] = None,
+           chunk_bytes: int = 8 * 1024 * 1024) -> Dict:
+    """
+    Re-score a threat log on a process pool
+
+    Args:
+        input_path: Threat log CSV to replay
+        output_path: Where to write the re-scored, timestamp-ordered log
+        workers: Number of worker processes (None = all cores, 1 = in-process)
+        weights_file: Calibrated weight file to score with (None = engine defaults)
+        chunk_bytes: Target input bytes per task
+
+    Returns:
+        Dictionary with row count, chunk count, elapsed time and rows/second
+    """
+    workers = workers or os.cpu_count() or 1
+    start = time.perf_counter()
+
+    header, ranges = split_byte_ranges(input_path, chunk_bytes)
+    columns = header.strip().split(',')
+    missing = set(LOG_SENSOR_COLUMNS) - set(columns)
+    if missing:
+        raise ValueError(f"Threat log is missing sensor columns: {missing}")
+
+    out_dir = os.path.dirname(os.path.abspath(output_path))
+    with tempfile.TemporaryDirectory(prefix='netra_replay_', dir=out_dir) as tmp:
+        parts = [os.path.join(tmp, f"part_{i:05d}.csv") for i in range(len(ranges))]
+        tasks = [(input_path, s, e, columns, part) for (s, e), part in zip(ranges, parts)]
+
+        if workers == 1 or len(tasks) <= 1:
+            _init_worker(weights_file)
+            results = [_replay_range(*task) for task in tasks]
+        else:
+            with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                     initargs=(weights_file,)) as pool:
+                results = list(pool.map(_replay_range, *zip(*tasks)))
+
+        # Blank-only ranges write no part file
+        kept = [(part, (first, last)) for part, (count, first, last) in zip(parts, results) if count]
+        rows = sum(count for count, _, _ in results)
+        merge_parts([part for part, _ in kept], [span for _, span in kept], header,
+                    output_path, columns.index('Timestamp'))
+
+    elapsed = time.perf_counter() - start
+    return {
+        'rows': rows,
+        'chunks': len(ranges),
+        'workers': workers,
+        'elapsed': elapsed,
+        'rows_per_second': rows / elapsed if elapsed > 0 else 0.0
+    }
+
+
+def replay_binlog(input_path: str, output_path: str, weights_file: Optional[str] = None,
+                  chunk_rows: int = 1_000_000) -> Dict:
+    """
+    Re-score a binary scan log into a new, timestamp-ordered binary log
+
+    Args:
+        input_path: Binary log to replay
+        output_path: Binary log to write (replaced if it exists)
+        weights_file: Calibrated weight file to score with (None = engine defaults)
+        chunk_rows: Records scored per chunk
+
+    Returns:
+        Dictionary with row count, chunk count, elapsed time and rows/second
+    """
+    start = time.perf_counter()
+    records, _ = read_binlog(input_path)
+    _init_worker(weights_file)
+
+    # The output shares the input's string codes
+    for path in (output_path, f"{output_path}.strings"):
+        if os.path.exists(path):
+            os.remove(path)
+    if os.path.exists(f"{input_path}.strings"):
+        shutil.copyfile(f"{input_path}.strings", f"{output_path}.strings")
+
+    order = np.argsort(records['timestamp'], kind='stable')
+    chunks = 0
+    with BinaryLogWriter(output_path) as writer:
+        for i in range(0, len(order), chunk_rows):
+            chunk = records[order[i:i + chunk_rows]]
+            scores = _ENGINE.score_batch(chunk['sensors'])
+            chunk['probability'] = scores['probability'].to_numpy()
+            chunk['confidence'] = scores['confidence'].to_numpy()
+            chunk['level'] = classify(chunk['probability'])
+            writer.append_records(chunk)
+            chunks += 1
+
+    elapsed = time.perf_counter() - start
+    return {
+        'rows': len(records),
+        'chunks': chunks,
+        'workers': 1,
+        'elapsed': elapsed,
+        'rows_per_second': len(records) / elapsed if elapsed > 0 else 0.0
+    }
+
+
+def _same_file(path_a: str, path_b: str) -> bool:
+    with open(path_a, 'rb') as a, open(path_b, 'rb') as b:
+        while True:
+            block_a, block_b = a.read(1 << 20), b.read(1 << 20)
+            if block_a != block_b:
+                return False
+            if not block_a:
+                return True
+
+
+def check_replay(input_path: str, workers: Optional[int] = None,
+                 chunk_bytes: int = 1024 * 1024) -> bool:
+    """
+    Check that a sharded replay writes exactly what a single-range serial replay writes
+
+    Args:
+        input_path: Threat log CSV to replay
+        workers: Worker processes for the sharded run (None = all cores)
+        chunk_bytes: Target input bytes per shard
+
+    Returns:
+        bool: True if both outputs are byte-identical
+    """
+    with tempfile.TemporaryDirectory(prefix='netra_check_') as tmp:
+        serial = os.path.join(tmp, 'serial.csv')
+        sharded = os.path.join(tmp, 'sharded.csv')
+        replay(input_path, serial, workers=1, chunk_bytes=os.path.getsize(input_path) + 1)
+        replay(input_path, sharded, workers, chunk_bytes=chunk_bytes)
+        return _same_file(serial, sharded)
+
+
+def benchmark_replay(input_path: str, worker_counts: Optional[List[int]] = None,
+                     chunk_bytes: int = 8 * 1024 * 1024) -> List[Dict]:
+    """
+    Measure replay speedup over the serial path
+
+    Args:
+        input_path: Threat log CSV to replay
+        worker_counts: Pool sizes to try (default: 1, 2, 4, ... up to all cores)
+        chunk_bytes: Target input bytes per task
+
+    Returns:
+        One result per pool size, with 'speedup' relative to 1 worker and
+        'matches_serial' (output byte-identical to the 1-worker run)
+    """
+    if worker_counts is None:
+        cores = os.cpu_count() or 1
+        worker_counts = sorted({1, cores} | {2 ** i for i in range(cores.bit_length()) if 2 ** i <= cores})
+
+    results = []
+    with tempfile.TemporaryDirectory(prefix='netra_bench_') as tmp:
+        reference = os.path.join(tmp, 'serial.csv')
+        output = os.path.join(tmp, 'replayed.csv')
+        for workers in worker_counts:
+            result = replay(input_path, output, workers, chunk_bytes=chunk_bytes)
+            if not results:
+                os.replace(output, reference)
+            result['matches_serial'] = _same_file(reference, output if results else reference)
+            results.append(result)
+
+    baseline = results[0]['elapsed']
+    for result in results:
+        result['speedup'] = baseline / result['elapsed'] if result['elapsed'] > 0 else 0.0
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="N.E.T.R.A. threat log replay scorer")
+    parser.add_argument('input', help="Threat log CSV to replay")
+    parser.add_argument('-o', '--output', default=None, help="Re-scored output CSV")
+    parser.add_argument('--workers', type=int, default=None, help="Worker processes (default: all cores)")
+    parser.add_argument('--weights', default=None, help="Weight file from netra_calibration.py")
+    parser.add_argument('--chunk-mb', type=float, default=8, help="Input megabytes per task")
+    parser.add_argument('--benchmark', action='store_true', help="Report speedup versus 1 worker")
+    parser.add_argument('--check', action='store_true', help="Verify sharded output equals serial output")
+    args = parser.parse_args()
+
+    if not os.path.exists(args.input):
+        print(f"❌ Error: File not found: {args.input}")
+        return 1
+
+    chunk_bytes = int(args.chunk_mb * 1024 * 1024)
+
+    if args.benchmark:
+        print(f"⏱️ Benchmarking replay of {args.input} on {os.cpu_count()} cores...")
+        results = benchmark_replay(args.input, chunk_bytes=chunk_bytes)
+        for result in results:
+            print(f"   {result['workers']:>3} workers: {result['elapsed']:.2f}s "
+                  f"({result['rows_per_second']:,.0f} rows/s) | speedup {result['speedup']:.2f}x"
+                  + ("" if result['matches_serial'] else " | ❌ output differs from serial"))
+        return 0 if all(result['matches_serial'] for result in results) else 1
+
+    if args.check:
+        workers = args.workers or max(2, os.cpu_count() or 1)
+        if check_replay(args.input, workers, chunk_bytes):
+            print(f"✅ Sharded replay ({workers} workers) matches the serial output")
+            return 0
+        print(f"❌ Sharded replay ({workers} workers) differs from the serial output")
+        return 1
+
+    if not args.output:
+        parser.error("--output is required unless --benchmark is given")
+
+    if args.input.endswith('.bin'):
+        result = replay_binlog(args.input, args.output, args.weights)
+    else:
+        result = replay(args.input, args.output, args.workers, args.weights, chunk_bytes)
+    print(f"✅ Re-scored {result['rows']:,} records in {result['elapsed']:.2f}s "
+          f"({result['rows_per_second']:,.0f} rows/s, {result['workers']} workers, "
+          f"{result['chunks']} chunks)")
+    print(f"📁 Saved to: {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
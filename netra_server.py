@@ -0,0 +1,470 @@
+"""
+N.E.T.R.A. Telemetry Server
+
+Asyncio ingest server for rover and drone sensor packets. Packets are
+newline-delimited JSON frames over TCP (one frame per datagram over UDP):
+
+    {"location": "Tezpur Airbase", "platform": "rover",
+     "readings": {"fume": 76.2, "metal": 72.6, "gpr": 84.7, "ground_cv": 80.6}}
+    {"location": "Tezpur Airbase", "platform": "drone",
+     "readings": {"drone_cv": 72.4, "disturbance": 63.4, "thermal": 58.6}}
+
+Rover and drone halves for the same location are fused into one 7-sensor
+reading ("fused" packets may carry all seven at once) and pushed onto a
+bounded queue that a single consumer scores in micro-batches. When the
+queue is full TCP handlers stop reading, so backpressure propagates to the
+senders' socket buffers instead of growing memory; UDP packets that do not
+fit are dropped and counted.
+
+Usage:
+    python netra_server.py serve --port 9750 --udp-port 9751
+    python netra_server.py loadgen --port 9750 --senders 50 --packets 2000
+    python netra_server.py selftest
+"""
+
+import sys
+import json
+import time
+import asyncio
+import logging
+import argparse
+from collections import deque
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from netra_core import NetraAI, SENSOR_ORDER, get_netra_instance
+
+
+logger = logging.getLogger(__name__)
+
+# Sensors reported by each platform
+PLATFORM_SENSORS = {
+    'rover': ('fume', 'metal', 'gpr', 'ground_cv'),
+    'drone': ('drone_cv', 'disturbance', 'thermal'),
+    'fused': SENSOR_ORDER
+}
+
+
+class ConnectionStats:
+    """Throughput counters for one sender connection"""
+
+    __slots__ = ('peer', 'packets', 'bytes', 'rejected', 'connected_at', 'closed_at')
+
+    def __init__(self, peer: str):
+        self.peer = peer
+        self.packets = 0
+        self.bytes = 0
+        self.rejected = 0
+        self.connected_at = time.monotonic()
+        self.closed_at = None
+
+    def as_dict(self) -> Dict:
+        elapsed = (self.closed_at or time.monotonic()) - self.connected_at
+        return {
+            'peer': self.peer,
+            'packets': self.packets,
+            'bytes': self.bytes,
+            'rejected': self.rejected,
+            'open': self.closed_at is None,
+            'packets_per_second': self.packets / elapsed if elapsed > 0 else 0.0
+        }
+
+
+class TelemetryServer:
+    """
+    Bounded-queue telemetry ingest server
+
+    Args:
+        engine: NetraAI instance that scores and logs fused readings
+        host: Interface to bind
+        port: TCP port (0 = ephemeral)
+        udp_port: Optional UDP port (None = TCP only)
+        queue_size: Maximum fused readings waiting to be scored
+        batch_size: Maximum readings scored per micro-batch
+        max_pending: Maximum locations with an unpaired rover/drone half
+        max_udp_peers: Maximum UDP senders tracked individually
+        recent_connections: Closed connections kept for stats(); older ones
+            only count toward the closed totals
+    """
+
+    def __init__(self, engine: NetraAI, host: str = '127.0.0.1', port: int = 9750,
+                 udp_port: Optional[int] = None, queue_size: int = 10_000,
+                 batch_size: int = 512, max_pending: int = 10_000,
+                 max_udp_peers: int = 1024, recent_connections: int = 100):
+        self.engine = engine
+        self.host = host
+        self.port = port
+        self.udp_port = udp_port
+        self.queue_size = queue_size
+        self.batch_size = batch_size
+        self.max_pending = max_pending
+        self.max_udp_peers = max_udp_peers
+
+        self.queue: Optional[asyncio.Queue] = None
+        self.connections = set()  # Open TCP connections
+        self.recent = deque(maxlen=recent_connections)
+        self.closed = {'connections': 0, 'packets': 0, 'bytes': 0, 'rejected': 0}
+        self.pending: Dict[str, Dict[str, float]] = {}
+        self._udp_peers: Dict[str, ConnectionStats] = {}
+        self._handlers: Dict[asyncio.Task, asyncio.StreamWriter] = {}
+
+        self.scored = 0
+        self.batches = 0
+        self.failed = 0  # Readings in batches that could not be scored or logged
+        self.dropped = 0
+        self.max_queue_depth = 0
+
+        self._tcp_server = None
+        self._udp_transport = None
+        self._consumer = None
+        self._started_at = None
+
+    async def start(self) -> None:
+        """Bind the listeners and start the scoring consumer"""
+        self.queue = asyncio.Queue(maxsize=self.queue_size)
+        self._started_at = time.monotonic()
+        self._consumer = asyncio.create_task(self._consume())
+
+        self._tcp_server = await asyncio.start_server(self._handle_tcp, self.host, self.port)
+        self.port = self._tcp_server.sockets[0].getsockname()[1]
+
+        if self.udp_port is not None:
+            loop = asyncio.get_running_loop()
+            self._udp_transport, _ = await loop.create_datagram_endpoint(
+                lambda: _UDPProtocol(self), local_addr=(self.host, self.udp_port)
+            )
+            self.udp_port = self._udp_transport.get_extra_info('sockname')[1]
+
+    async def stop(self, drain: bool = True, drain_timeout: float = 5.0) -> None:
+        """
+        Stop accepting packets and shut down
+
+        Args:
+            drain: Score everything already queued before returning
+            drain_timeout: Seconds connected senders get to finish sending
+                (with drain) before their connections are closed
+        """
+        if self._tcp_server is not None:
+            self._tcp_server.close()
+        if self._udp_transport is not None:
+            self._udp_transport.close()
+
+        # Finish reading from senders that are still connected, then close the idle ones
+        handlers = dict(self._handlers)
+        if drain and handlers:
+            _, pending = await asyncio.wait(handlers, timeout=drain_timeout)
+            handlers = {handler: handlers[handler] for handler in pending}
+        for writer in handlers.values():
+            writer.close()
+        await asyncio.gather(*handlers, return_exceptions=True)
+        if self._tcp_server is not None:
+            await self._tcp_server.wait_closed()
+
+        if drain:
+            await self.queue.join()
+        self._consumer.cancel()
+        try:
+            await self._consumer
+        except asyncio.CancelledError:
+            pass
+
+    async def serve_forever(self) -> None:
+        """Run until cancelled"""
+        await self.start()
+        async with self._tcp_server:
+            await self._tcp_server.serve_forever()
+
+    def parse_packet(self, frame: bytes) -> Optional[Tuple[str, List[float]]]:
+        """
+        Decode one frame and fuse it with any pending half for its location
+
+        Args:
+            frame: JSON-encoded packet
+
+        Returns:
+            (location, readings in SENSOR_ORDER) once a full reading is
+            available, otherwise None
+
+        Raises:
+            ValueError: If the frame is malformed
+        """
+        packet = json.loads(frame)
+        location = str(packet['location'])
+        sensors = PLATFORM_SENSORS.get(packet.get('platform', 'fused'))
+        if sensors is None:
+            raise ValueError(f"Unknown platform: {packet.get('platform')}")
+
+        readings = packet['readings']
+        values = {}
+        for sensor in sensors:
+            value = readings[sensor]
+            if not isinstance(value, (int, float)) or not 0 <= value <= 100:
+                raise ValueError(f"Sensor {sensor} out of range [0-100]: {value}")
+            values[sensor] = value
+
+        merged = self.pending.pop(location, {})
+        merged.update(values)
+        if len(merged) == len(SENSOR_ORDER):
+            return location, [merged[sensor] for sensor in SENSOR_ORDER]
+
+        # Keep the half until its counterpart arrives, evicting the oldest
+        if len(self.pending) >= self.max_pending:
+            self.pending.pop(next(iter(self.pending)))
+        self.pending[location] = merged
+        return None
+
+    async def _handle_tcp(self, reader: asyncio.StreamReader,
+                          writer: asyncio.StreamWriter) -> None:
+        peer = writer.get_extra_info('peername')
+        stats = ConnectionStats(f"{peer[0]}:{peer[1]}" if peer else 'unknown')
+        self.connections.add(stats)
+        self._handlers[asyncio.current_task()] = writer
+
+        try:
+            async for frame in reader:
+                stats.bytes += len(frame)
+                if not frame.strip():
+                    continue
+                try:
+                    reading = self.parse_packet(frame)
+                except (ValueError, KeyError, TypeError):
+                    stats.rejected += 1
+                    continue
+
+                stats.packets += 1
+                if reading is not None:
+                    # Blocks while the queue is full: this is the backpressure point
+                    await self.queue.put(reading)
+                    self.max_queue_depth = max(self.max_queue_depth, self.queue.qsize())
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        except (ValueError, asyncio.LimitOverrunError):
+            # Line longer than the stream limit: reject it and drop the sender
+            stats.rejected += 1
+        finally:
+            self.connections.discard(stats)
+            self._retire(stats)
+            self._handlers.pop(asyncio.current_task(), None)
+            writer.close()
+
+    def _retire(self, stats: ConnectionStats) -> None:
+        """Fold a finished connection into the closed totals"""
+        stats.closed_at = time.monotonic()
+        self.recent.append(stats)
+        self.closed['connections'] += 1
+        self.closed['packets'] += stats.packets
+        self.closed['bytes'] += stats.bytes
+        self.closed['rejected'] += stats.rejected
+
+    def _handle_datagram(self, data: bytes, addr) -> None:
+        peer = f"{addr[0]}:{addr[1]}"
+        stats = self._udp_peers.get(peer)
+        if stats is None:
+            # Retire the longest-tracked peer once the table is full
+            if len(self._udp_peers) >= self.max_udp_peers:
+                self._retire(self._udp_peers.pop(next(iter(self._udp_peers))))
+            stats = self._udp_peers[peer] = ConnectionStats(peer)
+
+        for frame in data.splitlines():
+            stats.bytes += len(frame)
+            if not frame.strip():
+                continue
+            try:
+                reading = self.parse_packet(frame)
+            except (ValueError, KeyError, TypeError):
+                stats.rejected += 1
+                continue
+
+            stats.packets += 1
+            if reading is not None:
+                try:
+                    self.queue.put_nowait(reading)
+                    self.max_queue_depth = max(self.max_queue_depth, self.queue.qsize())
+                except asyncio.QueueFull:
+                    self.dropped += 1
+
+    async def _consume(self) -> None:
+        """Drain the queue in micro-batches and score them"""
+        while True:
+            batch = [await self.queue.get()]
+            while len(batch) < self.batch_size and not self.queue.empty():
+                batch.append(self.queue.get_nowait())
+
+            # A failing batch is counted and logged; the consumer keeps going so producers never stall
+            try:
+                locations = [location for location, _ in batch]
+                matrix = np.array([readings for _, readings in batch], dtype=np.float64)
+                scores = self.engine.score_batch(matrix)
+                self.engine.log_threat_batch(
+                    locations, scores['probability'].to_numpy(), matrix,
+                    scores['confidence'].to_numpy()
+                )
+                self.scored += len(batch)
+                self.batches += 1
+            except Exception:
+                self.failed += len(batch)
+                logger.exception("Failed to score a batch of %d readings", len(batch))
+            finally:
+                for _ in batch:
+                    self.queue.task_done()
+
+            # Let the handlers refill the queue between batches
+            await asyncio.sleep(0)
+
+    def stats(self) -> Dict:
+        """
+        Server counters
+
+        Returns:
+            Dictionary with queue depth, totals, per-connection throughput of
+            open and recently closed connections, and closed-connection totals
+        """
+        elapsed = time.monotonic() - self._started_at if self._started_at else 0.0
+        return {
+            'queue_depth': self.queue.qsize() if self.queue else 0,
+            'queue_capacity': self.queue_size,
+            'max_queue_depth': self.max_queue_depth,
+            'pending_halves': len(self.pending),
+            'scored': self.scored,
+            'batches': self.batches,
+            'failed': self.failed,
+            'dropped': self.dropped,
+            'scored_per_second': self.scored / elapsed if elapsed > 0 else 0.0,
+            'connections': [c.as_dict() for c in (*self.connections, *self._udp_peers.values(),
+                                                  *self.recent)],
+            'closed': dict(self.closed)
+        }
+
+
+class _UDPProtocol(asyncio.DatagramProtocol):
+    """Forward datagrams to the owning TelemetryServer"""
+
+    def __init__(self, server: TelemetryServer):
+        self.server = server
+
+    def datagram_received(self, data: bytes, addr) -> None:
+        self.server._handle_datagram(data, addr)
+
+
+# ==================== LOAD GENERATOR ====================
+def make_packets(location: str, rng: np.random.Generator) -> bytes:
+    """Encode one rover packet and one drone packet for a location"""
+    values = np.round(rng.uniform(10, 95, len(SENSOR_ORDER)), 1).tolist()
+    readings = dict(zip(SENSOR_ORDER, values))
+    frames = [
+        {'location': location, 'platform': platform,
+         'readings': {sensor: readings[sensor] for sensor in PLATFORM_SENSORS[platform]}}
+        for platform in ('rover', 'drone')
+    ]
+    return b''.join(json.dumps(frame).encode() + b'\n' for frame in frames)
+
+
+async def load_generator(host: str = '127.0.0.1', port: int = 9750, senders: int = 10,
+                         packets: int = 1000, seed: int = 0) -> Dict:
+    """
+    Drive a server with many concurrent TCP senders
+
+    Each sender owns one location and sends `packets` rover/drone pairs,
+    awaiting drain() after every write so it is slowed by backpressure.
+
+    Args:
+        host: Server host
+        port: Server TCP port
+        senders: Number of concurrent connections
+        packets: Rover/drone pairs per sender
+        seed: Random seed for sensor values
+
+    Returns:
+        Dictionary with total readings sent, elapsed time and send rate
+    """
+    async def sender(index: int) -> None:
+        rng = np.random.default_rng(seed + index)
+        _, writer = await asyncio.open_connection(host, port)
+        location = f"Sensor-Site-{index:03d}"
+        for _ in range(packets):
+            writer.write(make_packets(location, rng))
+            await writer.drain()
+        writer.close()
+        await writer.wait_closed()
+
+    start = time.perf_counter()
+    await asyncio.gather(*(sender(i) for i in range(senders)))
+    elapsed = time.perf_counter() - start
+
+    return {
+        'readings_sent': senders * packets,
+        'elapsed': elapsed,
+        'readings_per_second': senders * packets / elapsed if elapsed > 0 else 0.0
+    }
+
+
+async def selftest(senders: int = 20, packets: int = 500, queue_size: int = 256) -> Dict:
+    """Run a server and the load generator in one event loop"""
+    engine = NetraAI(history_capacity=senders * packets)
+    server = TelemetryServer(engine, port=0, queue_size=queue_size)
+    await server.start()
+
+    load = await load_generator(port=server.port, senders=senders, packets=packets)
+    await server.stop(drain=True)
+
+    stats = server.stats()
+    stats['load'] = load
+    stats['lost'] = load['readings_sent'] - stats['scored']
+    return stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description="N.E.T.R.A. telemetry server")
+    sub = parser.add_subparsers(dest='command', required=True)
+
+    serve = sub.add_parser('serve', help="Run the ingest server")
+    serve.add_argument('--host', default='127.0.0.1')
+    serve.add_argument('--port', type=int, default=9750)
+    serve.add_argument('--udp-port', type=int, default=None)
+    serve.add_argument('--queue-size', type=int, default=10_000)
+    serve.add_argument('--batch-size', type=int, default=512)
+
+    loadgen = sub.add_parser('loadgen', help="Send synthetic rover/drone packets")
+    loadgen.add_argument('--host', default='127.0.0.1')
+    loadgen.add_argument('--port', type=int, default=9750)
+    loadgen.add_argument('--senders', type=int, default=10)
+    loadgen.add_argument('--packets', type=int, default=1000)
+
+    test = sub.add_parser('selftest', help="Run server and load generator together")
+    test.add_argument('--senders', type=int, default=20)
+    test.add_argument('--packets', type=int, default=500)
+    test.add_argument('--queue-size', type=int, default=256)
+
+    args = parser.parse_args()
+
+    if args.command == 'serve':
+        server = TelemetryServer(get_netra_instance(), args.host, args.port, args.udp_port,
+                                 args.queue_size, args.batch_size)
+        print(f"📡 Listening on {args.host}:{args.port} (TCP)"
+              + (f" and :{args.udp_port} (UDP)" if args.udp_port is not None else ""))
+        try:
+            asyncio.run(server.serve_forever())
+        except KeyboardInterrupt:
+            stats = server.stats()
+            print(f"\n⏹️ Stopped: {stats['scored']} readings scored, {stats['dropped']} dropped")
+
+    elif args.command == 'loadgen':
+        result = asyncio.run(load_generator(args.host, args.port, args.senders, args.packets))
+        print(f"🚀 Sent {result['readings_sent']} readings in {result['elapsed']:.2f}s "
+              f"({result['readings_per_second']:,.0f} readings/s)")
+
+    else:
+        stats = asyncio.run(selftest(args.senders, args.packets, args.queue_size))
+        print(f"🚀 Sent {stats['load']['readings_sent']} readings from {args.senders} senders")
+        print(f"   Scored: {stats['scored']} in {stats['batches']} batches "
+              f"({stats['load']['readings_per_second']:,.0f} readings/s end to end)")
+        print(f"   Max queue depth: {stats['max_queue_depth']}/{stats['queue_capacity']}")
+        print(f"   Lost readings: {stats['lost']}")
+        return 0 if stats['lost'] == 0 else 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,174 @@
+"""
+N.E.T.R.A. Spatial Index
+
+Resolves GPS coordinates to known strategic sites. All sites in the
+location registry (NE_LOCATIONS merged with locations_northeast_india.csv,
+see netra_locations.py) are projected once
+onto the unit sphere and stored in a KD-tree, so nearest-site and radius
+queries are O(log n) and whole batches of readings are resolved in one
+vectorized call. Great-circle distances are recovered exactly from the
+chord length between unit vectors.
+
+Usage:
+    from netra_spatial import get_spatial_index
+    index = get_spatial_index()
+    site, km = index.nearest(26.10, 91.58)
+    nearby = index.within_radius(26.10, 91.58, 5)
+"""
+
+import threading
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+from scipy.spatial import cKDTree
+
+from netra_locations import LocationRegistry, get_location_registry
+
+
+EARTH_RADIUS_KM = 6371.0088
+
+# Readings further than this from every known site are not attributed to one
+MAX_SITE_DISTANCE_KM = 50.0
+
+
+def valid_coordinates(lat, lon) -> np.ndarray:
+    """True where latitude is within [-90, 90] and longitude within [-180, 180] (NaN fails)"""
+    lat = np.asarray(lat, dtype=np.float64)
+    lon = np.asarray(lon, dtype=np.float64)
+    return (np.abs(lat) <= 90) & (np.abs(lon) <= 180)
+
+
+def to_unit_vectors(lat, lon) -> np.ndarray:
+    """Project latitude/longitude (degrees) onto the unit sphere as (N, 3) vectors (NaN for invalid input)"""
+    valid = valid_coordinates(lat, lon)
+    lat = np.radians(np.where(valid, lat, np.nan))
+    lon = np.radians(np.where(valid, lon, np.nan))
+    with np.errstate(invalid='ignore'):
+        cos_lat = np.cos(lat)
+        return np.stack([cos_lat * np.cos(lon), cos_lat * np.sin(lon), np.sin(lat)], axis=-1)
+
+
+def km_to_chord(km) -> np.ndarray:
+    """Straight-line distance between unit vectors for a great-circle distance"""
+    return 2 * np.sin(np.minimum(np.asarray(km, dtype=np.float64) / EARTH_RADIUS_KM, np.pi) / 2)
+
+
+def chord_to_km(chord) -> np.ndarray:
+    """Great-circle distance for a straight-line distance between unit vectors"""
+    return 2 * EARTH_RADIUS_KM * np.arcsin(np.clip(np.asarray(chord) / 2, 0, 1))
+
+
+class SpatialIndex:
+    """
+    KD-tree over site coordinates on the unit sphere
+
+    Args:
+        registry: Location registry whose sites are indexed
+    """
+
+    def __init__(self, registry: LocationRegistry):
+        if not len(registry):
+            raise ValueError("Spatial index needs at least one site")
+        self.registry = registry
+        self.sites = registry.sites
+        self._tree = cKDTree(to_unit_vectors(self.sites['lat'], self.sites['lon']))
+
+    def __len__(self) -> int:
+        return len(self.sites)
+
+    def site(self, index: int) -> Dict:
+        """Site record by row index"""
+        return self.sites.iloc[index].to_dict()
+
+    def lookup(self, name: str) -> Optional[Dict]:
+        """Site record by key, Location_ID or name (None if unknown)"""
+        return self.registry.get(name)
+
+    def nearest_many(self, lat, lon, max_km: Optional[float] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Nearest site for every coordinate in one call
+
+        Args:
+            lat: Latitudes (degrees)
+            lon: Longitudes (degrees)
+            max_km: Ignore sites further than this
+
+        Returns:
+            Tuple of (site row indices, distances in km); -1 and inf where
+            no site is within max_km or the coordinate is invalid (NaN,
+            infinite or out of range, see valid_coordinates)
+        """
+        points = to_unit_vectors(lat, lon).reshape(-1, 3)
+        bound = km_to_chord(max_km) if max_km is not None else np.inf
+
+        # The tree rejects non-finite points, so only valid ones are queried
+        finite = np.isfinite(points).all(axis=1)
+        chord = np.full(len(points), np.inf)
+        index = np.full(len(points), -1, dtype=np.intp)
+        if finite.any():
+            chord[finite], index[finite] = self._tree.query(points[finite], k=1, distance_upper_bound=bound)
+
+        missing = ~np.isfinite(chord)
+        index = np.where(missing, -1, index)
+        return index, np.where(missing, np.inf, chord_to_km(np.where(missing, 0, chord)))
+
+    def nearest(self, lat: float, lon: float,
+                max_km: Optional[float] = None) -> Tuple[Optional[Dict], float]:
+        """
+        Nearest site to one coordinate
+
+        Returns:
+            Tuple of (site record or None, distance in km)
+        """
+        index, km = self.nearest_many([lat], [lon], max_km)
+        if index[0] < 0:
+            return None, float('inf')
+        return self.site(int(index[0])), float(km[0])
+
+    def within_radius_many(self, lat, lon, km: float) -> List[np.ndarray]:
+        """
+        Sites within a radius of every coordinate
+
+        Returns:
+            One array of site row indices per coordinate, nearest first
+            (empty for invalid coordinates)
+        """
+        points = to_unit_vectors(lat, lon).reshape(-1, 3)
+        finite = np.isfinite(points).all(axis=1)
+        matches = np.empty(len(points), dtype=object)
+        matches[:] = [[] for _ in range(len(points))]
+        if finite.any():
+            matches[finite] = self._tree.query_ball_point(points[finite], r=km_to_chord(km))
+
+        result = []
+        for point, indices in zip(points, matches):
+            indices = np.asarray(indices, dtype=np.intp)
+            chord = np.linalg.norm(self._tree.data[indices] - point, axis=1)
+            result.append(indices[np.argsort(chord, kind='stable')])
+        return result
+
+    def within_radius(self, lat: float, lon: float, km: float) -> pd.DataFrame:
+        """
+        All sites within a radius of one coordinate
+
+        Returns:
+            Site rows with a 'distance_km' column, nearest first
+        """
+        indices = self.within_radius_many([lat], [lon], km)[0]
+        point = to_unit_vectors(lat, lon)
+        chord = np.linalg.norm(self._tree.data[indices] - point, axis=1)
+        return self.sites.iloc[indices].assign(distance_km=chord_to_km(chord))
+
+
+_spatial_index = None
+_spatial_index_lock = threading.Lock()
+
+def get_spatial_index() -> SpatialIndex:
+    """Get or build the shared spatial index over all known sites (thread-safe)"""
+    global _spatial_index
+    if _spatial_index is None:
+        with _spatial_index_lock:
+            if _spatial_index is None:
+                _spatial_index = SpatialIndex(get_location_registry())
+    return _spatial_index
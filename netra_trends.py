@@ -0,0 +1,206 @@
+"""
+N.E.T.R.A. Threat Trend Aggregator
+
+Sliding-window threat trends per location and per state (1h / 24h / 7d by
+default). Each window is a ring of fixed-width time buckets per key;
+logging a scan touches one bucket per window (O(1)), and a bucket is
+cleared when the ring wraps onto it, so expiry needs no sweeps. Reading a
+window sums its buckets, so trends are available instantly at any history
+size.
+
+Windows are resolved to bucket granularity: with 60 buckets, the 1h
+window covers the current minute plus the 59 before it.
+"""
+
+from datetime import datetime
+from typing import Dict, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from netra_bands import BAND_NAMES, THREAT_BANDS, classify
+
+
+# (name, length in seconds) of every default window
+TREND_WINDOWS: Tuple[Tuple[str, int], ...] = (
+    ('1h', 3600),
+    ('24h', 24 * 3600),
+    ('7d', 7 * 24 * 3600)
+)
+
+
+def _seconds(timestamp) -> np.ndarray:
+    """Whole seconds since the Unix epoch for datetimes or datetime64 values"""
+    return np.asarray(timestamp, dtype='datetime64[s]').astype(np.int64)
+
+
+class _TrendTable:
+    """Bucket rings for one scope (e.g. locations), indexed by key code"""
+
+    def __init__(self, windows: int, buckets: int, capacity: int = 64):
+        self.keys = []
+        self.codes: Dict[str, int] = {}
+        self._shape = (windows, buckets)
+        self._allocate(capacity)
+
+    def _allocate(self, capacity: int) -> None:
+        old = getattr(self, 'epoch', None)
+        windows, buckets = self._shape
+        epoch = np.full((capacity, windows, buckets), -1, dtype=np.int64)
+        counts = np.zeros((capacity, windows, buckets, len(THREAT_BANDS)), dtype=np.int64)
+        total = np.zeros((capacity, windows, buckets), dtype=np.float64)
+        peak = np.zeros((capacity, windows, buckets), dtype=np.float64)
+
+        if old is not None:
+            n = len(old)
+            epoch[:n], counts[:n], total[:n], peak[:n] = self.epoch, self.counts, self.total, self.peak
+        self.epoch, self.counts, self.total, self.peak = epoch, counts, total, peak
+
+    def code(self, key: str) -> int:
+        """Get (or assign) the row for a key, growing the arrays as needed"""
+        code = self.codes.get(key)
+        if code is None:
+            code = len(self.keys)
+            if code == len(self.epoch):
+                self._allocate(2 * code)
+            self.keys.append(key)
+            self.codes[key] = code
+        return code
+
+
+class TrendAggregator:
+    """
+    Per-location and per-state sliding-window threat trends
+
+    Args:
+        windows: (name, seconds) pairs, e.g. TREND_WINDOWS
+        buckets: Time buckets per window
+    """
+
+    SCOPES = ('location', 'state')
+
+    def __init__(self, windows: Sequence[Tuple[str, int]] = TREND_WINDOWS, buckets: int = 60):
+        self.window_names = [name for name, _ in windows]
+        self.bucket_seconds = np.array([max(1, seconds // buckets) for _, seconds in windows],
+                                       dtype=np.int64)
+        self.buckets = buckets
+        self.latest = None  # Newest scan time seen (seconds since epoch)
+        self._tables = {scope: _TrendTable(len(windows), buckets) for scope in self.SCOPES}
+
+    def add(self, location: str, state: str, timestamp: datetime, band: int,
+            probability: float) -> None:
+        """Record one scan in every window of its location and state"""
+        seconds = int(_seconds(timestamp))
+        self.latest = seconds if self.latest is None else max(self.latest, seconds)
+
+        for scope, key in (('location', location), ('state', state)):
+            table = self._tables[scope]
+            k = table.code(key)
+            for w, width in enumerate(self.bucket_seconds.tolist()):
+                epoch = seconds // width
+                slot = epoch % self.buckets
+                current = table.epoch[k, w, slot]
+                if epoch < current:
+                    continue  # Older than this bucket's contents: already expired
+                if epoch > current:
+                    table.epoch[k, w, slot] = epoch
+                    table.counts[k, w, slot] = 0
+                    table.total[k, w, slot] = 0.0
+                    table.peak[k, w, slot] = 0.0
+                table.counts[k, w, slot, band] += 1
+                table.total[k, w, slot] += probability
+                if probability > table.peak[k, w, slot]:
+                    table.peak[k, w, slot] = probability
+
+    def add_batch(self, locations, states, timestamps, probabilities: np.ndarray) -> None:
+        """
+        Record a batch of scans in one vectorized update
+
+        Args:
+            locations: Location names, one per scan
+            states: State names, one per scan ('' if unknown)
+            timestamps: One shared timestamp or one per scan (any order)
+            probabilities: Threat probabilities
+        """
+        probabilities = np.asarray(probabilities, dtype=np.float64)
+        n = len(probabilities)
+        if n == 0:
+            return
+        seconds = np.broadcast_to(_seconds(timestamps), (n,))
+        bands = classify(probabilities)
+        newest = int(seconds.max())
+        self.latest = newest if self.latest is None else max(self.latest, newest)
+
+        for scope, keys in (('location', locations), ('state', states)):
+            table = self._tables[scope]
+            names, inverse = np.unique(np.asarray(keys, dtype=object).astype(str),
+                                       return_inverse=True)
+            codes = np.array([table.code(name) for name in names], dtype=np.intp)[inverse]
+
+            for w, width in enumerate(self.bucket_seconds.tolist()):
+                epoch = seconds // width
+                slot = epoch % self.buckets
+
+                # Newest epoch landing in each touched (key, slot), including what is stored
+                pairs, pair_index = np.unique(codes * self.buckets + slot, return_inverse=True)
+                k, s = np.divmod(pairs, self.buckets)
+                target = table.epoch[k, w, s]
+                np.maximum.at(target, pair_index, epoch)
+
+                reset = target > table.epoch[k, w, s]
+                rk, rs = k[reset], s[reset]
+                table.epoch[rk, w, rs] = target[reset]
+                table.counts[rk, w, rs] = 0
+                table.total[rk, w, rs] = 0.0
+                table.peak[rk, w, rs] = 0.0
+
+                keep = epoch == target[pair_index]
+                k, s = codes[keep], slot[keep]
+                np.add.at(table.counts, (k, w, s, bands[keep]), 1)
+                np.add.at(table.total, (k, w, s), probabilities[keep])
+                np.maximum.at(table.peak, (k, w, s), probabilities[keep])
+
+    def snapshot(self, scope: str = 'location', window: str = '24h',
+                 as_of: Optional[datetime] = None) -> pd.DataFrame:
+        """
+        Current trend of every key in one window
+
+        Args:
+            scope: 'location' or 'state'
+            window: Window name, e.g. '1h', '24h' or '7d'
+            as_of: End of the window (default: newest scan seen)
+
+        Returns:
+            DataFrame indexed by key with scans, one count column per band,
+            mean_probability and max_probability (keys without scans omitted)
+        """
+        table = self._tables[scope]
+        w = self.window_names.index(window)
+        columns = ['scans', *BAND_NAMES, 'mean_probability', 'max_probability']
+        n = len(table.keys)
+        if n == 0 or self.latest is None:
+            return pd.DataFrame(columns=columns)
+
+        now = int(_seconds(as_of)) if as_of is not None else self.latest
+        current = now // int(self.bucket_seconds[w])
+        epoch = table.epoch[:n, w]
+        valid = (epoch > current - self.buckets) & (epoch <= current)
+
+        counts = (table.counts[:n, w] * valid[..., None]).sum(axis=1)
+        scans = counts.sum(axis=1)
+        total = np.where(valid, table.total[:n, w], 0.0).sum(axis=1)
+        peak = np.where(valid, table.peak[:n, w], 0.0).max(axis=1)
+
+        frame = pd.DataFrame(counts, columns=list(BAND_NAMES), index=pd.Index(table.keys, name=scope))
+        frame.insert(0, 'scans', scans)
+        frame['mean_probability'] = np.round(np.divide(total, scans, out=np.zeros(n), where=scans > 0), 2)
+        frame['max_probability'] = peak
+        return frame[scans > 0]
+
+    @classmethod
+    def from_threat_log(cls, df: pd.DataFrame, **kwargs) -> 'TrendAggregator':
+        """Build an aggregator from a netra_threat_log.csv-style DataFrame"""
+        trends = cls(**kwargs)
+        trends.add_batch(df['Location'], df['State'].fillna(''), pd.to_datetime(df['Timestamp']).to_numpy(),
+                         df['Threat_Probability'].to_numpy())
+        return trends
@@ -20,14 +20,19 @@ from plotly.subplots import make_subplots
 import folium
 from streamlit_folium import st_folium, folium_static
 from datetime import datetime, timedelta
-import time
 import json
 import os
 
+from netra_bands import THREAT_BANDS, CRITICAL, HIGH, MODERATE, band_of
+import netra_data
+from netra_locations import get_location_registry
+from netra_metrics import get_metrics, timed
+
 # Import NETRA core engine
 try:
     from netra_core import NetraAI, NE_LOCATIONS, get_netra_instance
     CORE_AVAILABLE = True
+    get_metrics().instrument(NetraAI)
 except ImportError:
     CORE_AVAILABLE = False
     st.warning("⚠️ netra_core.py not found - running in historical data mode only")
@@ -155,24 +160,8 @@ st.markdown("""
 # ==================== DATA LOADING ====================
 @st.cache_data
 def load_historical_data():
-    """Load all CSV datasets"""
-    data = {}
-    
-    # Load threat log
-    if os.path.exists('netra_threat_log.csv'):
-        data['threat_log'] = pd.read_csv('netra_threat_log.csv')
-        data['threat_log']['Timestamp'] = pd.to_datetime(data['threat_log']['Timestamp'])
-    
-    # Load locations
-    if os.path.exists('locations_northeast_india.csv'):
-        data['locations'] = pd.read_csv('locations_northeast_india.csv')
-    
-    # Load sensor readings
-    if os.path.exists('sensor_readings_live.csv'):
-        data['sensor_readings'] = pd.read_csv('sensor_readings_live.csv')
-        data['sensor_readings']['Timestamp'] = pd.to_datetime(data['sensor_readings']['Timestamp'])
-    
-    return data
+    """Load all CSV datasets (cached per session)"""
+    return netra_data.load_historical_data()
 
 
 # ==================== SESSION STATE ====================
@@ -228,11 +217,10 @@ def create_sidebar():
         
         # Quick stats
         data = st.session_state.historical_data
-        if 'threat_log' in data:
-            df = data['threat_log']
-            st.metric("Total Analyses", len(df))
-            critical_count = len(df[df['Threat_Level'] == 'CRITICAL'])
-            st.metric("Critical Threats", critical_count)
+        if 'cube' in data:
+            cube = data['cube']
+            st.metric("Total Analyses", cube.total())
+            st.metric("Critical Threats", cube.count('CRITICAL'))
         
         st.markdown("---")
         st.markdown("### 🚨 Emergency")
@@ -243,6 +231,7 @@ def create_sidebar():
 
 
 # ==================== PAGE: DASHBOARD ====================
+@timed('page.show_dashboard')
 def show_dashboard():
     """Main dashboard with overview"""
     st.markdown("## 🏠 System Overview Dashboard")
@@ -253,7 +242,8 @@ def show_dashboard():
         st.error("❌ No historical data found. Please ensure netra_threat_log.csv exists.")
         return
     
-    df = data['threat_log']
+    # Every widget is a rollup of the precomputed aggregate cube (see netra_cube.py)
+    cube = data['cube']
     
     # Top metrics
     col1, col2, col3, col4 = st.columns(4)
@@ -264,10 +254,10 @@ def show_dashboard():
             <h2>📊 Total Scans</h2>
             <h1>{}</h1>
         </div>
-        """.format(len(df)), unsafe_allow_html=True)
+        """.format(cube.total()), unsafe_allow_html=True)
     
     with col2:
-        critical = len(df[df['Threat_Level'] == 'CRITICAL'])
+        critical = cube.count('CRITICAL')
         st.markdown("""
         <div class="metric-card" style="background: linear-gradient(135deg, #dc2626, #991b1b);">
             <h2>🔴 Critical</h2>
@@ -276,7 +266,7 @@ def show_dashboard():
         """.format(critical), unsafe_allow_html=True)
     
     with col3:
-        high = len(df[df['Threat_Level'] == 'HIGH'])
+        high = cube.count('HIGH')
         st.markdown("""
         <div class="metric-card" style="background: linear-gradient(135deg, #f59e0b, #d97706);">
             <h2>🟡 High</h2>
@@ -285,7 +275,7 @@ def show_dashboard():
         """.format(high), unsafe_allow_html=True)
     
     with col4:
-        avg_threat = df['Threat_Probability'].mean()
+        avg_threat = cube.mean_probability()
         st.markdown("""
         <div class="metric-card" style="background: linear-gradient(135deg, #10b981, #059669);">
             <h2>📈 Avg Threat</h2>
@@ -300,7 +290,7 @@ def show_dashboard():
     
     with col1:
         st.markdown("### 🔥 Threat Distribution")
-        threat_counts = df['Threat_Level'].value_counts()
+        threat_counts = cube.level_counts()
         fig = px.pie(
             values=threat_counts.values,
             names=threat_counts.index,
@@ -321,7 +311,7 @@ def show_dashboard():
     
     with col2:
         st.markdown("### 📍 Geographic Distribution")
-        state_counts = df['State'].value_counts()
+        state_counts = cube.state_counts()
         fig = px.bar(
             x=state_counts.index,
             y=state_counts.values,
@@ -339,8 +329,7 @@ def show_dashboard():
     
     # Timeline
     st.markdown("### 📅 30-Day Threat Timeline")
-    df_daily = df.groupby(df['Timestamp'].dt.date).size().reset_index()
-    df_daily.columns = ['Date', 'Count']
+    df_daily = cube.daily_counts()
     
     fig = px.area(
         df_daily,
@@ -356,18 +345,35 @@ def show_dashboard():
     )
     st.plotly_chart(fig, use_container_width=True)
     
+    # Sliding-window trends (as of the newest logged scan, plus live engine scans)
+    st.markdown("### ⏱️ Current Threat Trends")
+    col1, col2 = st.columns(2)
+    with col1:
+        trend_window = st.radio("Window", ['1h', '24h', '7d'], index=1, horizontal=True)
+    with col2:
+        trend_scope = st.radio("Group by", ['state', 'location'], horizontal=True)
+    
+    trends = data['trends'].snapshot(trend_scope, trend_window)
+    st.caption("Historical log, window ending at the newest logged scan")
+    st.dataframe(trends.sort_values('max_probability', ascending=False), use_container_width=True)
+    
+    if CORE_AVAILABLE and st.session_state.netra_ai.analysis_count:
+        st.caption("Live scans from this engine")
+        st.dataframe(st.session_state.netra_ai.get_trends(trend_scope, trend_window),
+                     use_container_width=True)
+    
     # Recent threats table
     st.markdown("### 🚨 Recent Critical Threats")
-    recent_critical = df[df['Threat_Level'] == 'CRITICAL'].sort_values('Timestamp', ascending=False).head(10)
+    recent_critical = cube.recent_scans('CRITICAL', 10)
     
     if len(recent_critical) > 0:
-        display_df = recent_critical[['Timestamp', 'Location', 'State', 'Threat_Probability', 'Threat_Level']]
-        st.dataframe(display_df, use_container_width=True)
+        st.dataframe(recent_critical, use_container_width=True)
     else:
         st.info("✅ No critical threats detected")
 
 
 # ==================== PAGE: LIVE ANALYSIS ====================
+@timed('page.show_live_analysis')
 def show_live_analysis():
     """Live sensor controls and real-time analysis"""
     st.markdown("## 🔍 Live Threat Analysis")
@@ -385,14 +391,14 @@ def show_live_analysis():
         location_options = locations_df['Location'].tolist()
         selected_location = st.selectbox("Location", location_options, label_visibility="collapsed")
         
-        loc_info = locations_df[locations_df['Location'] == selected_location].iloc[0]
+        loc_info = get_location_registry().get(selected_location)
         col1, col2, col3 = st.columns(3)
         with col1:
-            st.info(f"**State:** {loc_info['State']}")
+            st.info(f"**State:** {loc_info['state']}")
         with col2:
-            st.info(f"**Type:** {loc_info['Type']}")
+            st.info(f"**Type:** {loc_info['type']}")
         with col3:
-            st.info(f"**Coords:** {loc_info['Latitude']:.4f}°N, {loc_info['Longitude']:.4f}°E")
+            st.info(f"**Coords:** {loc_info['lat']:.4f}°N, {loc_info['lon']:.4f}°E")
     elif CORE_AVAILABLE:
         location_key = st.selectbox(
             "Location",
@@ -464,11 +470,10 @@ def show_live_analysis():
         display_live_results(st.session_state.current_analysis)
 
 
+@timed('app.analyze_threat')
 def analyze_threat(sensors, location):
     """Perform threat analysis"""
     with st.spinner("🔄 Analyzing threat data..."):
-        time.sleep(1)
-        
         if CORE_AVAILABLE:
             analysis = st.session_state.netra_ai.analyze_location(location, sensors)
         else:
@@ -482,15 +487,7 @@ def analyze_threat(sensors, location):
                 probability += 10
             
             probability = min(100, probability)
-            
-            if probability >= 75:
-                threat_level = "CRITICAL"
-            elif probability >= 55:
-                threat_level = "HIGH"
-            elif probability >= 35:
-                threat_level = "MODERATE"
-            else:
-                threat_level = "LOW"
+            threat_level = band_of(probability).name
             
             analysis = {
                 'scan_id': f"SCAN_{datetime.now().strftime('%Y%m%d_%H%M%S')}",
@@ -505,6 +502,19 @@ def analyze_threat(sensors, location):
         st.success(f"✅ Analysis complete! Scan ID: {analysis['scan_id']}")
 
 
+# Alert box (CSS class, title, message) per threat band
+ALERT_BOXES = {
+    'CRITICAL': ("alert-critical", "🚨 CRITICAL THREAT DETECTED",
+                 "<strong>Recommendation:</strong> Immediate evacuation and bomb disposal team deployment required!"),
+    'HIGH': ("alert-high", "⚠️ HIGH THREAT LEVEL",
+             "<strong>Recommendation:</strong> Route diversion and increased surveillance recommended."),
+    'MODERATE': ("alert-moderate", "⚡ MODERATE THREAT",
+                 "<strong>Recommendation:</strong> Continue monitoring. Standard security protocols."),
+    'LOW': ("alert-low", "✅ LOW THREAT",
+            "<strong>Status:</strong> All clear. Normal operations.")
+}
+
+
 def display_live_results(analysis):
     """Display live analysis results"""
     st.markdown("---")
@@ -514,38 +524,14 @@ def display_live_results(analysis):
     threat_level = analysis['threat_level']
     
     # Alert box
-    if probability >= 75:
-        st.markdown(f"""
-        <div class="alert-critical">
-            <h2>🚨 CRITICAL THREAT DETECTED</h2>
-            <h1>{probability:.1f}% Threat Probability</h1>
-            <p><strong>Recommendation:</strong> Immediate evacuation and bomb disposal team deployment required!</p>
-        </div>
-        """, unsafe_allow_html=True)
-    elif probability >= 55:
-        st.markdown(f"""
-        <div class="alert-high">
-            <h2>⚠️ HIGH THREAT LEVEL</h2>
-            <h1>{probability:.1f}% Threat Probability</h1>
-            <p><strong>Recommendation:</strong> Route diversion and increased surveillance recommended.</p>
-        </div>
-        """, unsafe_allow_html=True)
-    elif probability >= 35:
-        st.markdown(f"""
-        <div class="alert-moderate">
-            <h2>⚡ MODERATE THREAT</h2>
-            <h1>{probability:.1f}% Threat Probability</h1>
-            <p><strong>Recommendation:</strong> Continue monitoring. Standard security protocols.</p>
-        </div>
-        """, unsafe_allow_html=True)
-    else:
-        st.markdown(f"""
-        <div class="alert-low">
-            <h2>✅ LOW THREAT</h2>
-            <h1>{probability:.1f}% Threat Probability</h1>
-            <p><strong>Status:</strong> All clear. Normal operations.</p>
-        </div>
-        """, unsafe_allow_html=True)
+    css_class, title, message = ALERT_BOXES[band_of(probability).name]
+    st.markdown(f"""
+    <div class="{css_class}">
+        <h2>{title}</h2>
+        <h1>{probability:.1f}% Threat Probability</h1>
+        <p>{message}</p>
+    </div>
+    """, unsafe_allow_html=True)
     
     # Sensor visualization
     col1, col2 = st.columns(2)
@@ -583,6 +569,7 @@ def display_live_results(analysis):
 
 
 # ==================== PAGE: HISTORICAL DATA ====================
+@timed('page.show_historical_data')
 def show_historical_data():
     """Show historical analysis data"""
     st.markdown("## 📊 Historical Threat Analysis")
@@ -594,31 +581,39 @@ def show_historical_data():
         return
     
     df = data['threat_log']
+    index = data['index']  # Timestamp-sorted, category-bitmapped (see netra_query.py)
     
     # Filters
     st.markdown("### 🔍 Filters")
     col1, col2, col3 = st.columns(3)
     
     with col1:
-        states = ['All'] + sorted(df['State'].unique().tolist())
+        states = ['All'] + sorted(str(state) for state in index.values('State') if pd.notna(state))
         selected_state = st.selectbox("State", states)
     
     with col2:
-        threat_levels = ['All'] + df['Threat_Level'].unique().tolist()
+        threat_levels = ['All'] + [level for level in index.values('Threat_Level') if pd.notna(level)]
         selected_level = st.selectbox("Threat Level", threat_levels)
     
     with col3:
+        first, last = index.time_range()
         date_range = st.date_input(
             "Date Range",
-            value=(df['Timestamp'].min(), df['Timestamp'].max())
+            value=(first, last) if first is not None else ()
         )
     
-    # Apply filters
-    filtered_df = df.copy()
+    # Apply filters: binary search for the dates, bitmaps for the categories, then take only matching rows
+    filters = {}
     if selected_state != 'All':
-        filtered_df = filtered_df[filtered_df['State'] == selected_state]
+        filters['State'] = selected_state
     if selected_level != 'All':
-        filtered_df = filtered_df[filtered_df['Threat_Level'] == selected_level]
+        filters['Threat_Level'] = selected_level
+    start = end = None
+    if isinstance(date_range, (tuple, list)) and date_range:
+        start = pd.Timestamp(date_range[0])
+        end = pd.Timestamp(date_range[-1]) + pd.Timedelta(days=1)  # Inclusive last day
+    
+    filtered_df = df.iloc[index.select(start, end, **filters)]
     
     st.markdown(f"### 📈 Showing {len(filtered_df)} analyses")
     
@@ -640,6 +635,7 @@ def show_historical_data():
 
 
 # ==================== PAGE: REGIONAL MAP ====================
+@timed('page.show_regional_map')
 def show_regional_map():
     """Show interactive map with all locations"""
     st.markdown("## 🗺️ Regional Threat Map")
@@ -651,31 +647,26 @@ def show_regional_map():
         return
     
     df = data['threat_log']
-    locations_df = data['locations']
     
-    # Get latest threat for each location
+    # Get latest threat for each location, with coordinates from the registry
     latest_threats = df.sort_values('Timestamp').groupby('Location').last().reset_index()
+    latest_threats = get_location_registry().join(latest_threats, 'Location', ['lat', 'lon'], how='inner')
     
     # Create map centered on NE India
     m = folium.Map(location=[25.5, 93.5], zoom_start=7, tiles='OpenStreetMap')
     
+    # Color based on threat level
+    color_map = {
+        'CRITICAL': 'darkred',
+        'HIGH': 'orange',
+        'MODERATE': 'lightgreen',
+        'LOW': 'green'
+    }
+    
     # Add markers
     for _, row in latest_threats.iterrows():
-        # Get coordinates from locations_df
-        loc_info = locations_df[locations_df['Location'] == row['Location']]
-        if len(loc_info) == 0:
-            continue
-        
-        lat = loc_info.iloc[0]['Latitude']
-        lon = loc_info.iloc[0]['Longitude']
-        
-        # Color based on threat level
-        color_map = {
-            'CRITICAL': 'darkred',
-            'HIGH': 'orange',
-            'MODERATE': 'lightgreen',
-            'LOW': 'green'
-        }
+        lat = row['lat']
+        lon = row['lon']
         color = color_map.get(row['Threat_Level'], 'blue')
         
         # Create popup
@@ -712,6 +703,7 @@ def show_regional_map():
 
 
 # ==================== PAGE: BATCH ANALYSIS ====================
+@timed('page.show_batch_analysis')
 def show_batch_analysis():
     """Analyze all locations simultaneously"""
     st.markdown("## 📦 Batch Threat Analysis")
@@ -727,33 +719,19 @@ def show_batch_analysis():
     st.info(f"📍 Analyzing {len(locations_df)} locations across North-East India")
     
     if st.button("🚀 Run Batch Analysis", type="primary"):
-        progress_bar = st.progress(0)
-        status_text = st.empty()
-        
-        results = []
-        
-        for idx, row in locations_df.iterrows():
-            status_text.text(f"Analyzing {row['Location']}...")
-            
-            # Simulate analysis or use real data
-            if 'threat_log' in data:
-                threat_data = data['threat_log'][data['threat_log']['Location'] == row['Location']]
-                if len(threat_data) > 0:
-                    latest = threat_data.sort_values('Timestamp').iloc[-1]
-                    results.append({
-                        'Location': row['Location'],
-                        'State': row['State'],
-                        'Type': row['Type'],
-                        'Threat_Probability': latest['Threat_Probability'],
-                        'Threat_Level': latest['Threat_Level']
-                    })
-            
-            progress_bar.progress((idx + 1) / len(locations_df))
+        # Latest scan per location, hash-joined onto the location table
+        results_df = locations_df[['Location', 'State', 'Type']]
+        if 'threat_log' in data:
+            latest = (data['threat_log'].sort_values('Timestamp', kind='stable')
+                      .drop_duplicates('Location', keep='last').set_index('Location'))
+            results_df = results_df.join(latest[['Threat_Probability', 'Threat_Level']],
+                                         on='Location', how='inner')
+        else:
+            results_df = results_df.iloc[0:0].assign(Threat_Probability=[], Threat_Level=[])
         
-        status_text.text("✅ Analysis complete!")
+        st.success("✅ Analysis complete!")
         
         # Display results
-        results_df = pd.DataFrame(results)
         results_df = results_df.sort_values('Threat_Probability', ascending=False)
         
         st.markdown("### 📊 Batch Analysis Results")
@@ -770,6 +748,7 @@ def show_batch_analysis():
 
 
 # ==================== PAGE: REPORTS ====================
+@timed('page.show_reports')
 def show_reports():
     """Generate reports"""
     st.markdown("## 📄 Report Generation")
@@ -818,14 +797,15 @@ def show_reports():
 
 
 # ==================== PAGE: SETTINGS ====================
+@timed('page.show_settings')
 def show_settings():
     """System settings"""
     st.markdown("## ⚙️ System Settings")
     
     st.markdown("### 🚨 Alert Thresholds")
-    critical = st.slider("🔴 Critical Threshold (%)", 0, 100, 75)
-    high = st.slider("🟡 High Threshold (%)", 0, 100, 55)
-    moderate = st.slider("🟢 Moderate Threshold (%)", 0, 100, 35)
+    critical = st.slider("🔴 Critical Threshold (%)", 0, 100, int(THREAT_BANDS[CRITICAL].min_probability))
+    high = st.slider("🟡 High Threshold (%)", 0, 100, int(THREAT_BANDS[HIGH].min_probability))
+    moderate = st.slider("🟢 Moderate Threshold (%)", 0, 100, int(THREAT_BANDS[MODERATE].min_probability))
     
     st.markdown("### 🔧 System Configuration")
     auto_refresh = st.checkbox("Enable Auto-Refresh", value=False)
@@ -840,6 +820,33 @@ def show_settings():
     if st.button("🗑️ Clear Cache"):
         st.cache_data.clear()
         st.success("✅ Cache cleared!")
+    
+    st.markdown("### ⏱️ Performance Metrics")
+    metrics = get_metrics()
+    instrumented = st.checkbox("Record latency of engine calls and pages (all sessions)", value=metrics.enabled)
+    if instrumented and not metrics.enabled:
+        metrics.enable()
+    elif not instrumented and metrics.enabled:
+        metrics.disable()
+    
+    snapshot = metrics.snapshot()
+    if snapshot.empty:
+        st.info("No latencies recorded yet" + ("" if metrics.enabled else " - enable recording above"))
+    else:
+        st.dataframe(snapshot, use_container_width=True)
+    
+    col1, col2 = st.columns(2)
+    with col1:
+        st.download_button(
+            "📥 Download Metrics (JSON)",
+            data=json.dumps({'enabled': metrics.enabled, 'metrics': metrics.to_dict()}, indent=2),
+            file_name=f"netra_metrics_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json",
+            mime="application/json"
+        )
+    with col2:
+        if st.button("♻️ Reset Metrics"):
+            metrics.reset()
+            st.rerun()
 
 
 # ==================== MAIN APP ====================